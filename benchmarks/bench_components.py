@@ -0,0 +1,106 @@
+"""
+bench_components.py
+===================
+Benchmarks de construcción de cada factory de components/.
+
+Cada función pública de los módulos de components/ necesita un caso en
+CASES; las que no lo tienen, o cuyo módulo no se puede importar (por ejemplo
+sin flet_datatable2), se listan como omitidas en la salida.
+"""
+
+import importlib.util
+import inspect
+import os
+from typing import Any, Dict, List, Tuple
+
+import flet as ft
+
+from harness import ROOT, measure
+
+MODULES = (
+    "buttons",
+    "data_display",
+    "inputs",
+    "menu_elements",
+    "modals",
+    "text",
+    "visual_elements",
+)
+
+# "modulo.funcion" -> (args, kwargs) representativos
+CASES: Dict[str, Tuple[tuple, dict]] = {
+    "buttons.filled_btn": (("Guardar",), {"icon": ft.Icons.SAVE}),
+    "buttons.icon_filled_btn": ((ft.Icons.ADD,), {}),
+    "buttons.icon_btn": ((ft.Icons.MENU,), {}),
+    "buttons.text_btn": (("Cancelar",), {}),
+    "buttons.btn": (("Aceptar",), {}),
+    "data_display.datatable": (([], []), {}),
+    "data_display.icon": ((ft.Icons.HOME,), {}),
+    "data_display.image": (("logo.png",), {}),
+    "data_display.progress_bar": ((0.5,), {}),
+    "data_display.loading_indicator": ((), {}),
+    "inputs.switch": (("Activo",), {}),
+    "inputs.text_autocomplete_input": (("Nombre", "Escribe..."), {}),
+    "inputs.checkbox": (("Acepto",), {}),
+    "inputs.color_picker": (("Color",), {}),
+    "inputs.date_picker": (("Fecha",), {}),
+    "inputs.date_range_picker": (("Rango",), {}),
+    "inputs.dropdown": (("Opción", []), {}),
+    "inputs.slider": (("Volumen",), {}),
+    "menu_elements.appbar": ((), {}),
+    "modals.alert_modal": (("Título", "Contenido"), {}),
+    "text.markdown": (("# Título",), {}),
+    "text.title": (("Título",), {}),
+    "text.subtitle": (("Subtítulo",), {}),
+    "text.body": (("Texto",), {}),
+    "text.caption": (("Nota",), {}),
+    "text.error_text": (("Error",), {}),
+    "text.link": (("Docs", "https://flet.dev"), {}),
+    "text.text_primary_color": (("Primario",), {}),
+    "text.translated_text": (("dismiss",), {}),
+    "visual_elements.card": (([],), {}),
+    "visual_elements.expansion_panel": (("Panel",), {}),
+}
+
+
+def _factories() -> Tuple[List[Tuple[str, Any]], Dict[str, str]]:
+    """Retorna (factories importables, {nombre: motivo de omisión})."""
+    factories: List[Tuple[str, Any]] = []
+    skipped: Dict[str, str] = {}
+    for module_name in MODULES:
+        # Se carga cada fichero por separado: components/__init__.py importa
+        # todos los módulos y un solo fallo impediría medir los demás
+        path = os.path.join(ROOT, "components", f"{module_name}.py")
+        spec = importlib.util.spec_from_file_location(f"components.{module_name}", path)
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        except Exception as exc:
+            skipped[f"{module_name}.*"] = f"import: {exc!r}"
+            continue
+        for name, fn in inspect.getmembers(module, inspect.isfunction):
+            if fn.__module__ == module.__name__ and not name.startswith("_"):
+                factories.append((f"{module_name}.{name}", fn))
+    return factories, skipped
+
+
+def run(quick: bool = False) -> Tuple[Dict[str, float], Dict[str, str]]:
+    number = 50 if quick else 500
+    metrics: Dict[str, float] = {}
+    factories, skipped = _factories()
+
+    for name, fn in factories:
+        case = CASES.get(name)
+        if case is None:
+            skipped[name] = "sin caso en CASES"
+            continue
+        args, kwargs = case
+        try:
+            fn(*args, **kwargs)
+        except Exception as exc:
+            skipped[name] = f"error: {exc!r}"
+            continue
+        timing = measure(lambda: fn(*args, **kwargs), number=number)
+        metrics[f"components.{name}.mean_us"] = timing["median_ms"] * 1000.0
+
+    return metrics, skipped
@@ -0,0 +1,243 @@
+"""
+bench_layout.py
+===============
+Benchmarks de ResponsiveLayout / LayoutBuilder: coste de construcción, número
+de controles, on_resize() y toggle_*_sidebar(), tamaño de los updates con el
+árbol anidado frente al plano (flat_tree), sidebar de 500 ítems simple frente
+a virtualizado con búsqueda, y tiempo/memoria por sesión
+con LayoutBuilder frente a LayoutTemplate (1000 sesiones simuladas).
+"""
+
+import itertools
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+import flet as ft
+
+from harness import FakePage, count_controls, estimate_payload, headless, measure
+from layout_helpers import create_footer, create_searchable_sidebar, create_simple_sidebar
+from layout_system import LayoutBuilder, ResponsiveLayout
+from layout_template import LayoutTemplate
+
+REPEAT = 5
+SESSIONS = 1000
+LARGE_MENU = [
+    {"icon": ft.Icons.ARTICLE, "label": f"Entrada {i}", "section": f"Sección {i // 25}"}
+    for i in range(500)
+]
+SIDEBAR_ITEMS = [{"icon": ft.Icons.HOME, "label": f"Item {i}"} for i in range(20)]
+
+
+def _content() -> ft.Control:
+    return ft.Column([ft.Text(f"Fila {i}") for i in range(50)])
+
+
+def _navbar() -> ft.Control:
+    # Equivalente a create_simple_navbar() (evita ft.padding.symmetric, que
+    # no existe en todas las versiones de Flet)
+    return ft.Container(
+        content=ft.Row([ft.IconButton(icon=ft.Icons.MENU), ft.Text("Bench", size=20)]),
+        padding=10,
+    )
+
+
+def build_minimal() -> ResponsiveLayout:
+    return LayoutBuilder().with_content(_content()).build()
+
+
+def build_full(flat_tree: bool = False) -> ResponsiveLayout:
+    return (
+        LayoutBuilder()
+        .with_content(_content())
+        .with_top_bar(_navbar())
+        .with_left_bar(create_simple_sidebar(SIDEBAR_ITEMS))
+        .with_right_bar(create_simple_sidebar(SIDEBAR_ITEMS[:5]))
+        .with_bottom_bar(create_footer())
+        .with_flat_tree(flat_tree)
+        .build()
+    )
+
+
+def build_full_flat() -> ResponsiveLayout:
+    return build_full(flat_tree=True)
+
+
+def build_lazy_sidebars() -> ResponsiveLayout:
+    # Igual que build_full, pero con las barras laterales como factory
+    return (
+        LayoutBuilder()
+        .with_content(_content())
+        .with_top_bar(_navbar())
+        .with_left_bar(lambda: create_simple_sidebar(SIDEBAR_ITEMS))
+        .with_right_bar(lambda: create_simple_sidebar(SIDEBAR_ITEMS[:5]))
+        .with_bottom_bar(create_footer())
+        .build()
+    )
+
+
+VARIANTS: Dict[str, Callable[[], ResponsiveLayout]] = {
+    "minimal": build_minimal,
+    "full": build_full,
+    "full_flat": build_full_flat,
+    "lazy_sidebars": build_lazy_sidebars,
+}
+
+
+# Misma configuración que build_lazy_sidebars(), compilada una vez para todas las sesiones
+SESSION_TEMPLATE = LayoutTemplate.from_builder(
+    LayoutBuilder()
+    .with_top_bar(_navbar)
+    .with_left_bar(lambda: create_simple_sidebar(SIDEBAR_ITEMS))
+    .with_right_bar(lambda: create_simple_sidebar(SIDEBAR_ITEMS[:5]))
+    .with_bottom_bar(create_footer)
+)
+
+
+def _session_with_builder(width: int) -> ResponsiveLayout:
+    # Mismas barras (factories) que SESSION_TEMPLATE: solo cambia quién compila
+    layout = build_lazy_sidebars()
+    layout.on_resize(width)
+    return layout
+
+
+def _session_with_template(width: int) -> ResponsiveLayout:
+    layout = SESSION_TEMPLATE.instantiate(_content())
+    layout.on_resize(width)
+    return layout
+
+
+def _sessions(
+    session: Callable[[int], ResponsiveLayout], width: int, n: int
+) -> Dict[str, float]:
+    """Simula n sesiones simultáneas de un ancho dado: tiempo y memoria por sesión."""
+    start = time.perf_counter()
+    layouts = [session(width) for _ in range(n)]
+    elapsed = time.perf_counter() - start
+    del layouts
+
+    # La memoria se mide en otra pasada: tracemalloc ralentiza la primera
+    tracemalloc.start()
+    layouts = [session(width) for _ in range(n)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del layouts
+    return {"mean_ms": elapsed * 1000.0 / n, "memory_bytes": memory / n}
+
+
+def _large_menu_metrics(number: int) -> Dict[str, float]:
+    """create_simple_sidebar frente a create_searchable_sidebar con 500 ítems."""
+    metrics: Dict[str, float] = {}
+    for name, factory in (
+        ("simple", lambda: create_simple_sidebar(LARGE_MENU)),
+        ("searchable", lambda: create_searchable_sidebar(LARGE_MENU)),
+    ):
+        metrics[f"layout.sidebar_500.{name}.build_ms"] = measure(factory, number=number)["median_ms"]
+        metrics[f"layout.sidebar_500.{name}.controls"] = count_controls(factory())
+
+    sidebar = create_searchable_sidebar(LARGE_MENU)
+    queries = itertools.cycle(("e", "en", "entrada 1", "sección 3", ""))
+    metrics["layout.sidebar_500.search.median_ms"] = measure(
+        lambda: sidebar.filter(next(queries)), number=number
+    )["median_ms"]
+
+    # Cambiar el ítem activo solo debe enviar el anterior y el nuevo
+    sidebar.filter("")
+    sidebar.set_active(1)
+    page = sidebar.page
+    page.reset_counters()
+    sidebar.set_active(2)
+    metrics["layout.sidebar_500.set_active.updated_controls"] = page.updated_controls
+    return metrics
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    number = 20 if quick else 200
+    metrics: Dict[str, float] = {}
+    page = FakePage()
+
+    with headless(page):
+        for name, factory in VARIANTS.items():
+            timing = measure(factory, number=number, repeat=REPEAT)
+            metrics[f"layout.build.{name}.median_ms"] = timing["median_ms"]
+            layout = factory()
+            metrics[f"layout.build.{name}.controls"] = count_controls(layout)
+            metrics[f"layout.build.{name}.payload_bytes"] = estimate_payload(layout)
+
+        layout = build_full()
+        # Alterna móvil / tablet / escritorio en cada llamada
+        widths = itertools.cycle((400, 800, 1400))
+
+        page.reset_counters()
+        timing = measure(lambda: layout.on_resize(next(widths)), number=number, repeat=REPEAT)
+        calls = number * REPEAT
+        metrics["layout.on_resize.median_ms"] = timing["median_ms"]
+        metrics["layout.on_resize.updates"] = page.update_calls / calls
+
+        for side in ("left", "right"):
+            toggle = getattr(layout, f"toggle_{side}_sidebar")
+            page.reset_counters()
+            timing = measure(toggle, number=number, repeat=REPEAT)
+            metrics[f"layout.toggle_{side}.median_ms"] = timing["median_ms"]
+            metrics[f"layout.toggle_{side}.updates"] = page.update_calls / calls
+
+            page.reset_counters()
+            page.measure_payload = True
+            toggle()
+            page.measure_payload = False
+            metrics[f"layout.toggle_{side}.payload_bytes"] = page.payload_bytes
+
+        # Varias mutaciones agrupadas en un único envío
+        def batched_changes() -> None:
+            with layout.batch():
+                layout.toggle_left_sidebar()
+                layout.toggle_right_sidebar()
+                layout.set_content(_content())
+
+        page.reset_counters()
+        timing = measure(batched_changes, number=number, repeat=REPEAT)
+        metrics["layout.batch.median_ms"] = timing["median_ms"]
+        metrics["layout.batch.updates"] = page.update_calls / calls
+
+        # Tamaño de los updates habituales: árbol anidado frente a plano
+        for tree, flat_tree in (("nested", False), ("flat", True)):
+            tree_layout = build_full(flat_tree)
+            actions = {
+                "toggle_left": tree_layout.toggle_left_sidebar,
+                "set_content": lambda: tree_layout.set_content(_content()),
+                "full_update": tree_layout.update,
+            }
+            for action, fn in actions.items():
+                page.reset_counters()
+                page.measure_payload = True
+                fn()
+                page.measure_payload = False
+                metrics[f"layout.tree.{tree}.{action}.payload_bytes"] = page.payload_bytes
+
+        # Arrastre de 100 eventos del borde del sidebar izquierdo (sin pausas)
+        resizable = LayoutBuilder().with_content(_content()).with_left_bar(
+            create_simple_sidebar(SIDEBAR_ITEMS)
+        ).with_resizable_sidebars().build()
+        resizable.on_resize(1400)
+        page.reset_counters()
+        page.measure_payload = True
+        resizable._start_resize("left")
+        for _ in range(100):
+            resizable._drag_resize("left", 1.0)
+        resizable._end_resize("left")
+        page.measure_payload = False
+        metrics["layout.drag_resize.updates"] = page.update_calls
+        metrics["layout.drag_resize.payload_bytes"] = page.payload_bytes
+
+        metrics.update(_large_menu_metrics(number))
+
+        sessions = SESSIONS // 10 if quick else SESSIONS
+        for device, width in (("desktop", 1400), ("mobile", 400)):
+            for name, session in (
+                ("builder", _session_with_builder),
+                ("template", _session_with_template),
+            ):
+                for metric, value in _sessions(session, width, sessions).items():
+                    metrics[f"layout.sessions.{device}.{name}.{metric}"] = value
+
+    return metrics
@@ -0,0 +1,76 @@
+"""
+bench_route_table.py
+====================
+Microbenchmark de RouteTable: coste de resolver rutas según el número de
+rutas registradas (estáticas, con parámetros, con conversores y comodines).
+
+Uso:
+    python benchmarks/bench_route_table.py [--iterations N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "screen_system"))
+
+from screen_system import RouteTable, Screen  # noqa: E402
+
+
+def build_table(n_routes: int) -> RouteTable:
+    """Crea una tabla con n_routes rutas repartidas entre los tipos de patrón."""
+    table = RouteTable()
+    for i in range(n_routes):
+        kind = i % 4
+        if kind == 0:
+            pattern = f"/section{i}"
+        elif kind == 1:
+            pattern = f"/section{i}/items/:id<int>"
+        elif kind == 2:
+            pattern = f"/section{i}/:slug/details"
+        else:
+            pattern = f"/section{i}/files/*path"
+        table.add(pattern, type(f"Screen{i}", (Screen,), {"route": pattern}))
+    return table
+
+
+def bench(n_routes: int, iterations: int) -> dict:
+    """Tiempo medio (µs) de match() por tipo de ruta con n_routes registradas."""
+    table = build_table(n_routes)
+
+    def last(kind: int) -> int:
+        # Índice de la última ruta registrada de ese tipo
+        return (n_routes - 1 - kind) // 4 * 4 + kind
+
+    samples = {
+        "static": f"/section{last(0)}",
+        "param_int": f"/section{last(1)}/items/42?tab=info",
+        "param_str": f"/section{last(2)}/report-2026/details",
+        "wildcard": f"/section{last(3)}/files/a/b/c.txt",
+        "miss": "/does/not/exist",
+    }
+    results = {}
+    for name, route in samples.items():
+        seconds = timeit.timeit(lambda: table.match(route), number=iterations)
+        results[name] = seconds / iterations * 1e6
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    header = None
+    for n_routes in (10, 100, 1000):
+        results = bench(n_routes, args.iterations)
+        if header is None:
+            header = " ".join(f"{name:>10}" for name in results)
+            print(f"{'rutas':>6} {header}  (µs/match)")
+        print(f"{n_routes:>6} " + " ".join(f"{v:>10.2f}" for v in results.values()))
+
+
+if __name__ == "__main__":
+    main()
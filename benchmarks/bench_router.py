@@ -0,0 +1,59 @@
+"""
+bench_router.py
+===============
+Benchmarks de ScreenRouter: navegaciones por segundo sin animación, con y
+sin caché keep-alive, sobre una FakePage.
+"""
+
+import itertools
+from typing import Dict, List, Type
+
+import flet as ft
+
+from harness import FakePage, headless, measure
+from screen_system import Screen, ScreenRouter
+
+N_SCREENS = 20
+
+
+def make_screens(n: int = N_SCREENS) -> List[Type[Screen]]:
+    """Pantallas sintéticas con un árbol de ~100 controles cada una."""
+
+    def build(self) -> ft.Control:
+        return ft.Column(
+            [ft.Row([ft.Text(f"{self.route} {i}"), ft.Icon(ft.Icons.HOME)]) for i in range(33)]
+        )
+
+    screens = [type(f"BenchScreen{i}", (Screen,), {"route": f"/s{i}", "build": build}) for i in range(n)]
+    screens.append(
+        type("BenchDetail", (Screen,), {"route": "/items/:id<int>", "build": build})
+    )
+    return screens
+
+
+def _navigations_per_second(keep_alive: bool, routes: List[str], number: int) -> float:
+    page = FakePage()
+    with headless(page):
+        router = ScreenRouter(
+            page,
+            animate_transitions=False,
+            keep_alive=keep_alive,
+            keep_alive_max_screens=len(routes),
+            collect_stats=False,
+        )
+        router.register_routes(make_screens())
+        cycle = itertools.cycle(routes)
+        # Mismo camino que en producción: push_route() en el event loop de la página
+        timing = measure(
+            lambda: page.run_task(page.push_route, next(cycle)).result(), number=number
+        )
+    return 1000.0 / timing["median_ms"]
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    number = 50 if quick else 500
+    hot_routes = ["/s0", "/s1", "/s2", "/s3", "/items/42?tab=info"]
+    return {
+        "router.navigate.rebuild.nav_per_s": _navigations_per_second(False, hot_routes, number),
+        "router.navigate.keep_alive.nav_per_s": _navigations_per_second(True, hot_routes, number),
+    }
@@ -0,0 +1,201 @@
+"""
+bench_translations.py
+=====================
+Benchmarks del sistema de traducciones: carga del catálogo desde el CSV
+frente al catálogo compilado (translations/catalog_cache.py) y memoria con
+todos los idiomas cargados frente a carga por idioma (lazy_languages), y
+memoria por sesión con un TranslationManager por sesión frente a vistas
+(TranslationView) sobre el catálogo compartido, y el cambio de idioma con
+BOUND_CONTROLS textos enlazados (bind) y la recarga en caliente (reload) tras
+editar una clave, y t(clave, **params) con plantillas compiladas frente a
+t(clave).format(**params), con un CSV sintético de N_KEYS claves en todos los
+idiomas de LANGUAGE_NAMES.
+"""
+
+import csv
+import itertools
+import os
+import tempfile
+import tracemalloc
+from typing import Dict
+
+import flet as ft
+
+from harness import FakePage, headless, measure
+from translations import TranslationManager, TranslationView, use_view
+from translations import t as translate
+from translations.catalog_cache import SharedCatalog, compile_catalog, default_cache_path
+from translations.formatting import compile_template
+from translations.languages import LANGUAGE_NAMES
+
+N_KEYS = 5000
+SESSIONS = 200
+BOUND_CONTROLS = 500
+# Plantilla con parámetros con nombre, válida también para str.format
+TEMPLATE = "{lang}: hello {{name}}, you have {{count}} new messages in {{folder}}"
+PARAMS = {"name": "Ana", "count": 3, "folder": "Inbox"}
+
+
+def write_catalog(directory: str, n_keys: int = N_KEYS) -> str:
+    """Escribe un CSV de traducciones sintético y retorna su ruta."""
+    path = os.path.join(directory, "translations.csv")
+    languages = list(LANGUAGE_NAMES)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["key"] + languages)
+        for i in range(n_keys):
+            writer.writerow([f"section{i % 50}.key{i}"] + [f"{lang} text {i}" for lang in languages])
+        writer.writerow(["inbox.summary"] + [TEMPLATE.format(lang=lang) for lang in languages])
+    return path
+
+
+def _format_metrics() -> Dict[str, float]:
+    """t() con parámetros (plantilla compilada) frente a str.format por llamada."""
+    def naive() -> str:
+        return translate("inbox.summary").format(**PARAMS)
+
+    def compiled() -> str:
+        return translate("inbox.summary", **PARAMS)
+
+    # Solo el renderizado, sin la búsqueda de la clave
+    text = translate("inbox.summary")
+    formatter = compile_template(text)
+
+    assert naive() == compiled() == formatter(PARAMS)
+    timings = {
+        "str_format_us": naive,
+        "compiled_us": compiled,
+        "render.str_format_us": lambda: text.format(**PARAMS),
+        "render.compiled_us": lambda: formatter(PARAMS),
+    }
+    return {
+        f"translations.format.{name}": measure(fn, number=10000)["median_ms"] * 1000.0
+        for name, fn in timings.items()
+    }
+
+
+def _session_metrics(csv_path: str, n: int) -> Dict[str, float]:
+    """Memoria por sesión: un TranslationManager por sesión frente a vistas."""
+    metrics: Dict[str, float] = {}
+    languages = ["es", "fr", "de", "it"]
+    # Las columnas compartidas (y sus tablas planas) se cargan una vez por
+    # proceso, no por sesión
+    catalog = SharedCatalog(csv_path)
+    for lang in languages:
+        catalog.resolved(lang, "en")
+    for name, session in (
+        ("manager", lambda lang: _manager(csv_path, lang)),
+        ("view", lambda lang: TranslationView(catalog, lang)),
+    ):
+        tracemalloc.start()
+        sessions = [session(languages[i % len(languages)]) for i in range(n)]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metrics[f"translations.sessions.{name}.memory_bytes"] = memory / n
+        del sessions
+    return metrics
+
+
+def _manager(csv_path: str, lang: str) -> TranslationManager:
+    manager = TranslationManager(csv_path, lazy_languages=True)
+    manager.set_language(lang)
+    return manager
+
+
+def _on_loop(page: FakePage, function):
+    """Ejecuta function() en el event loop de la página (como un handler de Flet)."""
+
+    async def call():
+        return function()
+
+    return page.run_task(call).result()
+
+
+def _binding_metrics(csv_path: str, number: int) -> Dict[str, float]:
+    """set_language() con BOUND_CONTROLS textos enlazados en una página."""
+    metrics: Dict[str, float] = {}
+    page = FakePage()
+    with headless(page):
+        manager = TranslationManager(csv_path, lazy_languages=True)
+        controls = [
+            manager.bind(ft.Text(), f"section{i % 50}.key{i}") for i in range(BOUND_CONTROLS)
+        ]
+        languages = itertools.cycle(["es", "fr", "de", "it"])
+        metrics["translations.bind.set_language_ms"] = measure(
+            lambda: _on_loop(page, lambda: manager.set_language(next(languages))),
+            number=number,
+        )["median_ms"]
+
+        page.reset_counters()
+        _on_loop(page, lambda: manager.set_language(next(languages)))
+        metrics["translations.bind.updates"] = page.update_calls
+        metrics["translations.bind.updated_controls"] = page.updated_controls
+
+        # Recarga en caliente: re-parseo de los idiomas cargados y diff
+        metrics["translations.reload.median_ms"] = measure(
+            lambda: _on_loop(page, manager.reload), number=number
+        )["median_ms"]
+        with open(csv_path, encoding="utf-8") as f:
+            source = f.read()
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            f.write(source.replace(f"{manager.active_lang} text 1,", "edited,", 1))
+        page.reset_counters()
+        metrics["translations.reload.changed_keys"] = len(_on_loop(page, manager.reload))
+        metrics["translations.reload.updated_controls"] = page.updated_controls
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            f.write(source)
+    del controls
+    return metrics
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    number = 3 if quick else 10
+    metrics: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = write_catalog(directory, N_KEYS // 5 if quick else N_KEYS)
+
+        metrics["translations.load.csv_ms"] = measure(
+            lambda: TranslationManager(csv_path, use_cache=False), number=number
+        )["median_ms"]
+
+        compile_catalog(csv_path)
+        metrics["translations.load.compiled_ms"] = measure(
+            lambda: TranslationManager(csv_path), number=number
+        )["median_ms"]
+
+        # Catálogo obsoleto: se vuelve a generar en la primera carga
+        def load_stale() -> None:
+            os.remove(default_cache_path(csv_path))
+            TranslationManager(csv_path)
+
+        metrics["translations.load.recompile_ms"] = measure(load_stale, number=number)["median_ms"]
+        metrics["translations.catalog.compiled_bytes"] = os.path.getsize(default_cache_path(csv_path))
+
+        for mode, lazy in (("eager", False), ("lazy", True)):
+            tracemalloc.start()
+            manager = TranslationManager(csv_path, lazy_languages=lazy)
+            manager.set_language("es")
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            metrics[f"translations.memory.{mode}_bytes"] = memory
+            del manager
+
+        # Cambio a idiomas no cargados (con desalojo de los menos usados)
+        manager = TranslationManager(csv_path, lazy_languages=True)
+        languages = itertools.cycle(manager.available_languages)
+        metrics["translations.set_language.lazy_ms"] = measure(
+            lambda: manager.set_language(next(languages)), number=number * 5
+        )["median_ms"]
+
+        metrics.update(_binding_metrics(csv_path, number * 5))
+        metrics.update(_session_metrics(csv_path, SESSIONS // 10 if quick else SESSIONS))
+        keys = itertools.cycle([f"section{i % 50}.key{i}" for i in range(100)])
+        metrics["translations.t.global_us"] = (
+            measure(lambda: translate(next(keys)), number=10000)["median_ms"] * 1000.0
+        )
+        with use_view(TranslationView(SharedCatalog(csv_path), "es")):
+            metrics["translations.t.view_us"] = (
+                measure(lambda: translate(next(keys)), number=10000)["median_ms"] * 1000.0
+            )
+            metrics.update(_format_metrics())
+    return metrics
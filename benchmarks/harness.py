@@ -0,0 +1,239 @@
+"""
+harness.py
+==========
+Utilidades comunes para los benchmarks headless (sin cliente Flutter).
+
+Contenido:
+    FakePage:          Sustituto mínimo de ft.Page que registra los update().
+    headless:          Context manager que redirige Control.update() a una FakePage.
+    count_controls:    Cuenta los controles de un árbol.
+    estimate_payload:  Tamaño aproximado (bytes JSON) de serializar un árbol.
+    measure:           Mide el tiempo medio de una función.
+    compare_metrics:   Compara dos resultados y detecta regresiones.
+    missing_metrics:   Métricas de la línea base que faltan en un resultado.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Los módulos del repo se importan por nombre plano (ej. `from layout_system import ...`)
+for _path in (ROOT, os.path.join(ROOT, "layout"), os.path.join(ROOT, "screen_system")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import flet as ft  # noqa: E402
+
+
+class RouteChange:
+    """Evento mínimo equivalente a ft.RouteChangeEvent."""
+
+    def __init__(self, route: str):
+        self.route = route
+
+
+class FakePage:
+    """
+    Sustituto de ft.Page para medir sin cliente: guarda los atributos que usan
+    el layout y el router y cuenta los update() recibidos junto con el tamaño
+    estimado de lo que se enviaría.
+
+    Navega como ft.Page en Flet 1.x: push_route() es una corrutina (lanza
+    on_route_change en lugar del cliente) que se ejecuta con run_task(); no
+    hay page.go().
+    """
+
+    def __init__(self, width: int = 1200, height: int = 800):
+        self.width = width
+        self.height = height
+        self.route = "/"
+        self.views: List[Any] = []
+        self.controls: List[ft.Control] = []
+        self.on_resize: Optional[Callable] = None
+        self.on_route_change: Optional[Callable] = None
+        self.on_view_pop: Optional[Callable] = None
+        self.update_calls = 0
+        self.updated_controls = 0
+        self.payload_bytes = 0
+        self.measure_payload = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add(self, *controls: ft.Control) -> None:
+        self.controls.extend(controls)
+
+    async def push_route(self, route: str) -> None:
+        """Equivalente a ft.Page.push_route(): cambia la ruta y avisa a on_route_change."""
+        self.route = route
+        if self.on_route_change:
+            self.on_route_change(RouteChange(route))
+
+    def update(self, *controls: ft.Control) -> None:
+        self.update_calls += 1
+        self.updated_controls += len(controls)
+        if self.measure_payload:
+            for control in controls:
+                self.payload_bytes += estimate_payload(control)
+
+    def run_task(self, handler: Callable, *args: Any, **kwargs: Any):
+        """Ejecuta la corrutina en un event loop propio en segundo plano."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(handler(*args, **kwargs), self._loop)
+
+    def reset_counters(self) -> None:
+        self.update_calls = 0
+        self.updated_controls = 0
+        self.payload_bytes = 0
+
+
+@contextmanager
+def headless(page: FakePage) -> Iterator[FakePage]:
+    """
+    Redirige Control.update() y Control.page a `page` mientras dure el bloque, para poder
+    ejecutar layouts y routers sin que estén montados en una página real.
+    """
+    originals = {name: vars(ft.Control).get(name) for name in ("update", "page")}
+
+    def update(control: ft.Control) -> None:
+        page.update(control)
+
+    ft.Control.update = update
+    # control.page apunta a la FakePage (ej. para page.update(*controles))
+    ft.Control.page = property(lambda control: page)
+    try:
+        yield page
+    finally:
+        for name, original in originals.items():
+            if original is None:
+                delattr(ft.Control, name)
+            else:
+                setattr(ft.Control, name, original)
+
+
+def _attributes(control: ft.Control) -> Iterator[Tuple[str, Any]]:
+    """Atributos de un control (Flet 1.x guarda las propiedades en `_values`)."""
+    for name, value in vars(control).items():
+        if name == "_values" and isinstance(value, dict):
+            yield from value.items()
+        else:
+            yield name, value
+
+
+def _child_controls(control: ft.Control) -> Iterator[ft.Control]:
+    for name, value in _attributes(control):
+        if "parent" in name or "page" in name:
+            continue
+        if isinstance(value, ft.Control):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, ft.Control):
+                    yield item
+
+
+def iter_controls(root: ft.Control) -> Iterator[ft.Control]:
+    """Recorre el árbol de controles (en profundidad, sin repetir nodos)."""
+    seen = set()
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        if id(control) in seen:
+            continue
+        seen.add(id(control))
+        yield control
+        stack.extend(_child_controls(control))
+
+
+def count_controls(root: ft.Control) -> int:
+    """Número de controles del árbol."""
+    return sum(1 for _ in iter_controls(root))
+
+
+def estimate_payload(root: ft.Control) -> int:
+    """
+    Tamaño aproximado (bytes) del árbol serializado: tipo y atributos
+    primitivos de cada control, como referencia para comparar estructuras.
+    """
+    total = 0
+    for control in iter_controls(root):
+        attrs = {
+            name: value
+            for name, value in _attributes(control)
+            if isinstance(value, (str, int, float, bool)) and not name.startswith("_")
+        }
+        attrs["_type"] = type(control).__name__
+        total += len(json.dumps(attrs, default=str))
+    return total
+
+
+def measure(fn: Callable[[], Any], number: int = 100, repeat: int = 5) -> Dict[str, float]:
+    """
+    Ejecuta fn `number` veces por ronda durante `repeat` rondas.
+
+    Returns:
+        {"median_ms": mediana de la media por llamada, "min_ms": mejor ronda}
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - start) * 1000.0 / number)
+    rounds.sort()
+    return {"median_ms": rounds[len(rounds) // 2], "min_ms": rounds[0]}
+
+
+# Métricas en las que un valor mayor es una regresión / una mejora
+LOWER_IS_BETTER = ("_ms", "_us", "controls", "updates", "bytes")
+HIGHER_IS_BETTER = ("_per_s",)
+
+
+def compare_metrics(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    threshold: float,
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Compara métricas planas con una línea base.
+
+    Returns:
+        Lista de regresiones (métrica, base, actual, cambio relativo) que
+        superan `threshold` (ej. 0.15 = 15 %). Las métricas que faltan en
+        `current` no se comparan: hay que comprobarlas con missing_metrics().
+    """
+    regressions = []
+    for name, base in baseline.items():
+        value = current.get(name)
+        if value is None or not base:
+            continue
+        change = (value - base) / base
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        elif not name.endswith(LOWER_IS_BETTER):
+            continue
+        if change > threshold:
+            regressions.append((name, base, value, change))
+    return regressions
+
+
+def missing_metrics(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    suites: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Métricas de la línea base que no aparecen en `current` (ej. un benchmark
+    que ha empezado a fallar y se ha omitido). Con `suites` solo se tienen en
+    cuenta las métricas de esas suites (prefijo "suite.").
+    """
+    prefixes = tuple(f"{suite}." for suite in suites) if suites else ("",)
+    return sorted(
+        name for name in baseline if name.startswith(prefixes) and name not in current
+    )
@@ -0,0 +1,109 @@
+"""
+run_benchmarks.py
+=================
+Ejecuta los benchmarks headless (layouts, router, componentes y traducciones) sobre una
+FakePage, sin cliente Flutter, y guarda los resultados en JSON.
+
+Uso:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json --threshold 0.15
+
+Con --compare el proceso termina con código 1 si alguna métrica empeora más
+del umbral respecto a la línea base (tiempos, nº de controles/updates y bytes
+más altos, o navegaciones por segundo más bajas) o si falta alguna métrica de
+la línea base en las suites ejecutadas (ej. un benchmark que pasa a omitirse).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import harness  # noqa: F401  (configura sys.path para los módulos del repo)
+
+import flet as ft
+
+SUITES = ("layout", "router", "components", "translations")
+
+
+def run_suites(suites, quick: bool) -> dict:
+    metrics = {}
+    skipped = {}
+    for suite in suites:
+        if suite == "layout":
+            import bench_layout
+
+            metrics.update(bench_layout.run(quick))
+        elif suite == "router":
+            import bench_router
+
+            metrics.update(bench_router.run(quick))
+        elif suite == "components":
+            import bench_components
+
+            suite_metrics, suite_skipped = bench_components.run(quick)
+            metrics.update(suite_metrics)
+            skipped.update(suite_skipped)
+        elif suite == "translations":
+            import bench_translations
+
+            metrics.update(bench_translations.run(quick))
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "flet": getattr(ft, "__version__", "desconocida"),
+            "quick": quick,
+            "suites": list(suites),
+        },
+        "metrics": metrics,
+        "skipped": skipped,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks headless de Flet-Base-Template")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="Suite a ejecutar (repetible)")
+    parser.add_argument("--output", help="Fichero JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="JSON de línea base con el que comparar")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Regresión máxima tolerada (0.15 = 15%%)")
+    parser.add_argument("--quick", action="store_true", help="Menos iteraciones (para CI)")
+    args = parser.parse_args()
+
+    suites = args.suite or list(SUITES)
+    results = run_suites(suites, args.quick)
+
+    for name, value in sorted(results["metrics"].items()):
+        print(f"{name:<60} {value:>12.3f}")
+    for name, reason in sorted(results["skipped"].items()):
+        print(f"{name:<60} omitido ({reason})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = harness.compare_metrics(
+            baseline["metrics"], results["metrics"], args.threshold
+        )
+        missing = harness.missing_metrics(baseline["metrics"], results["metrics"], suites)
+        if regressions:
+            print(f"\n{len(regressions)} regresiones por encima del {args.threshold:.0%}:")
+            for name, base, value, change in regressions:
+                print(f"  {name}: {base:.3f} -> {value:.3f} (+{change:.1%})")
+        if missing:
+            print(f"\n{len(missing)} métricas de la línea base sin resultado:")
+            for name in missing:
+                reason = results["skipped"].get(name.split(".", 1)[1].rsplit(".", 1)[0])
+                print(f"  {name}" + (f" (omitida: {reason})" if reason else ""))
+        if regressions or missing:
+            return 1
+        print(f"\nSin regresiones por encima del {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
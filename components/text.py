@@ -1,5 +1,7 @@
 import flet as ft
 
+import translations
+
 def markdown(md, size=10):
     """It creates a markdown text with the specified markdown content and the main color of the theme"""
     return ft.Markdown(
@@ -50,3 +52,9 @@ def text_primary_color(text: str, size: int = 14, weight=None, selectable: bool
     """Texto con el color primario del tema."""
     return ft.Text(text, size=size, color=ft.Colors.primary, weight=weight, selectable=selectable)
 
+
+def translated_text(key: str, size: int = 14, color=ft.Colors.text_color, weight=None, selectable: bool = True, **params):
+    """Texto traducido: muestra t(key, **params) y se actualiza solo al cambiar de idioma con set_language()."""
+    return translations.bind(
+        ft.Text(size=size, color=color, weight=weight, selectable=selectable), key, **params
+    )
@@ -1,4 +1,5 @@
 from layout_helpers import *
 from layout_system import *
+from layout_template import *
 
-__all__ = ["layout_helpers", "layout_system"]
\ No newline at end of file
+__all__ = ["layout_helpers", "layout_system", "layout_template"]
\ No newline at end of file
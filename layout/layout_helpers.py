@@ -7,14 +7,17 @@ Funciones:
     setup_responsive_layout: Configura el resize automático.
     create_simple_navbar:     Crea una barra de navegación simple.
     create_simple_sidebar:    Crea un sidebar con ítems de navegación.
+    create_searchable_sidebar: Sidebar virtualizado con secciones y búsqueda.
     create_footer:            Crea un pie de página simple.
     validate_layout_params:   Valida parámetros de dimensiones.
 """
 
+import asyncio
+import unicodedata
 import flet as ft
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from layout_system import ResponsiveLayout
+from layout_system import DIMENSION_BOUNDS, ResponsiveLayout, VirtualContent
 
 
 def validate_layout_params(
@@ -36,32 +39,56 @@ def validate_layout_params(
         ValueError: Si algún valor está fuera de su rango permitido.
     """
     constraints = [
-        (left_bar_width, "left_bar_width", 50, 1000),
-        (right_bar_width, "right_bar_width", 50, 1000),
-        (top_bar_height, "top_bar_height", 30, 200),
-        (bottom_bar_height, "bottom_bar_height", 30, 200),
+        (left_bar_width, "left_bar_width"),
+        (right_bar_width, "right_bar_width"),
+        (top_bar_height, "top_bar_height"),
+        (bottom_bar_height, "bottom_bar_height"),
     ]
-    for value, name, min_v, max_v in constraints:
+    for value, name in constraints:
+        min_v, max_v = DIMENSION_BOUNDS[name]
         if value is not None and not (min_v <= value <= max_v):
             raise ValueError(
                 f"'{name}' debe estar entre {min_v} y {max_v} px. Valor recibido: {value}"
             )
 
 
-def setup_responsive_layout(layout: ResponsiveLayout, page: ft.Page) -> None:
+def setup_responsive_layout(
+    layout: ResponsiveLayout,
+    page: ft.Page,
+    resize_throttle_ms: int = 100,
+) -> None:
     """
     Configura el manejo automático de resize entre la página y el layout.
 
-    Llama a layout.on_resize() en cada cambio de tamaño e inicializa
-    con el tamaño actual de la página.
+    Los eventos de resize se agrupan: como máximo se llama a
+    layout.on_resize() una vez cada resize_throttle_ms, con el último ancho
+    recibido (mediante una única tarea asyncio en el event loop de Flet).
+    El layout, a su vez, solo se actualiza si cambia el breakpoint.
+    Inicializa con el tamaño actual de la página.
 
     Args:
-        layout: El ResponsiveLayout a conectar.
-        page:   La página de Flet.
+        layout:             El ResponsiveLayout a conectar.
+        page:               La página de Flet.
+        resize_throttle_ms: Ventana de agrupación en ms (0 = sin agrupar).
     """
+    state = {"width": None, "scheduled": False}
+
+    def current_width() -> int:
+        return int(page.width) if page.width else 0
+
+    async def flush_resize():
+        await asyncio.sleep(resize_throttle_ms / 1000.0)
+        state["scheduled"] = False
+        layout.on_resize(state["width"])
 
     def on_page_resize(e):
-        layout.on_resize(int(page.width) if page.width else 0)
+        if resize_throttle_ms <= 0:
+            layout.on_resize(current_width())
+            return
+        state["width"] = current_width()
+        if not state["scheduled"]:
+            state["scheduled"] = True
+            page.run_task(flush_resize)
 
     page.on_resize = on_page_resize
     # Inicializar con el tamaño actual (puede ser None en el primer frame)
@@ -140,6 +167,234 @@ def create_simple_sidebar(
     )
 
 
+def _normalize(text: str) -> str:
+    """Minúsculas y sin tildes, para buscar "menu" y encontrar "Menú"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class SidebarSearchIndex:
+    """
+    Índice de prefijos por palabra, construido una sola vez para todos los
+    ítems: buscar es intersectar los conjuntos de cada palabra de la consulta.
+
+    Args:
+        items:         Lista de dicts con 'label' y, opcionalmente, 'section'
+                       y 'keywords' (lista de palabras extra).
+        max_prefix:    Longitud máxima de prefijo indexada; las palabras de la
+                       consulta más largas se comprueban sobre el resultado.
+    """
+
+    def __init__(self, items: List[dict], max_prefix: int = 12):
+        self.max_prefix = max_prefix
+        self._tokens: List[Tuple[str, ...]] = []
+        self._prefixes: Dict[str, Set[int]] = {}
+        for index, item in enumerate(items):
+            text = " ".join(
+                [item["label"], item.get("section") or ""] + list(item.get("keywords", ()))
+            )
+            tokens = tuple(set(_normalize(text).split()))
+            self._tokens.append(tokens)
+            for token in tokens:
+                for length in range(1, min(len(token), max_prefix) + 1):
+                    self._prefixes.setdefault(token[:length], set()).add(index)
+
+    def search(self, query: str) -> List[int]:
+        """Índices (en orden) de los ítems con alguna palabra que empiece por cada término."""
+        terms = _normalize(query).split()
+        if not terms:
+            return list(range(len(self._tokens)))
+        # Primero los términos más selectivos
+        candidate_sets = sorted(
+            (self._prefixes.get(term[: self.max_prefix], set()) for term in terms), key=len
+        )
+        matches = set(candidate_sets[0]).intersection(*candidate_sets[1:])
+        long_terms = [term for term in terms if len(term) > self.max_prefix]
+        if long_terms:
+            matches = {
+                index
+                for index in matches
+                if all(
+                    any(token.startswith(term) for token in self._tokens[index])
+                    for term in long_terms
+                )
+            }
+        return sorted(matches)
+
+
+class SearchableSidebar(ft.Container):
+    """
+    Sidebar de navegación para menús grandes (cientos de ítems).
+
+    - Solo construye los ítems visibles (VirtualContent con scroll propio).
+    - Agrupa los ítems por 'section' con una cabecera por sección.
+    - Filtra con un buscador incremental sobre un SidebarSearchIndex.
+    - set_active() actualiza solo los dos ítems afectados (el anterior y el
+      nuevo activo), no la lista completa.
+
+    Args:
+        items:           Lista de dicts con 'icon', 'label' y, opcionalmente,
+                         'section' y 'keywords'.
+        on_click:        Callback que recibe el índice (en `items`) del ítem pulsado.
+        item_extent:     Alto fijo de cada fila en píxeles.
+        viewport_height: Alto visible estimado hasta el primer scroll.
+        search_hint:     Texto de ayuda del buscador.
+    """
+
+    def __init__(
+        self,
+        items: List[dict],
+        on_click: Optional[Callable[[int], None]] = None,
+        item_extent: float = 48,
+        viewport_height: float = 600,
+        search_hint: str = "Buscar...",
+    ):
+        super().__init__(padding=10, expand=True)
+        self.items = items
+        self.on_item_click = on_click
+        self.active_index: Optional[int] = None
+        self.index = SidebarSearchIndex(items)
+        # Consulta normalizada y resultado del último filtro
+        self._query = ""
+        self._matches: List[int] = list(range(len(items)))
+        # Filas visibles tras filtrar: ("section", nombre) o ("item", índice)
+        self._rows: List[Tuple[str, object]] = []
+        self._row_of_item: Dict[int, int] = {}
+        self._set_rows(range(len(items)))
+
+        self._list = VirtualContent(
+            len(self._rows),
+            self._build_row,
+            item_extent=item_extent,
+            overscan=10,
+            viewport_height=viewport_height,
+        )
+        self.search_field = ft.TextField(
+            hint_text=search_hint,
+            prefix_icon=ft.Icons.SEARCH,
+            dense=True,
+            on_change=self._handle_search,
+        )
+        scroll_column = ft.Column(
+            controls=[self._list],
+            scroll=ft.ScrollMode.AUTO,
+            expand=True,
+            on_scroll=self._handle_scroll,
+        )
+        # reset() lleva esta columna al inicio al cambiar el filtro
+        self._list.scroll_owner = scroll_column
+        self.content = ft.Column(controls=[self.search_field, scroll_column], expand=True)
+
+    # --- Filas ---
+
+    def _set_rows(self, item_indices) -> None:
+        sections: Dict[str, List[int]] = {}
+        for index in item_indices:
+            sections.setdefault(self.items[index].get("section") or "", []).append(index)
+        rows: List[Tuple[str, object]] = []
+        for section, indices in sections.items():
+            if section:
+                rows.append(("section", section))
+            rows.extend(("item", index) for index in indices)
+        self._rows = rows
+        self._row_of_item = {
+            value: row for row, (kind, value) in enumerate(rows) if kind == "item"
+        }
+
+    def _build_row(self, row: int) -> ft.Control:
+        kind, value = self._rows[row]
+        if kind == "section":
+            return ft.Container(
+                content=ft.Text(value, size=12, weight=ft.FontWeight.BOLD, color=ft.Colors.GREY_600),
+                alignment=ft.Alignment.CENTER_LEFT,
+                padding=10,
+            )
+        item = self.items[value]
+        return ft.ListTile(
+            leading=ft.Icon(item["icon"]),
+            title=ft.Text(item["label"]),
+            selected=value == self.active_index,
+            on_click=lambda e, idx=value: self._handle_click(idx),
+        )
+
+    # --- Eventos ---
+
+    def _handle_scroll(self, e: ft.OnScrollEvent) -> None:
+        if self._list.handle_scroll(e.pixels, e.viewport_dimension):
+            self._list.update()
+
+    def _handle_search(self, e: ft.ControlEvent) -> None:
+        self.filter(e.control.value or "")
+
+    def _handle_click(self, index: int) -> None:
+        self.set_active(index)
+        if self.on_item_click:
+            self.on_item_click(index)
+
+    # --- API pública ---
+
+    def filter(self, query: str) -> List[int]:
+        """
+        Muestra solo los ítems que coinciden con `query`; retorna sus índices.
+        Si la consulta no cambia (salvo mayúsculas, tildes o espacios) no se
+        vuelve a filtrar ni se mueve el scroll.
+        """
+        normalized = " ".join(_normalize(query).split())
+        if normalized == self._query:
+            return list(self._matches)
+        self._query = normalized
+        self._matches = self.index.search(query)
+        self._set_rows(self._matches)
+        self._list.reset(len(self._rows))
+        self._list.update()
+        return list(self._matches)
+
+    def set_active(self, index: Optional[int]) -> None:
+        """Marca como activo el ítem `index` actualizando solo los dos ítems afectados."""
+        previous, self.active_index = self.active_index, index
+        if previous == index:
+            return
+        changed = []
+        for item_index, selected in ((previous, False), (index, True)):
+            row = self._row_of_item.get(item_index)
+            tile = self._list.built_item(row) if row is not None else None
+            if tile is not None:
+                tile.selected = selected
+                changed.append(tile)
+        if changed:
+            self.page.update(*changed)
+
+
+def create_searchable_sidebar(
+    items: List[dict],
+    on_click: Optional[Callable[[int], None]] = None,
+    item_extent: float = 48,
+) -> SearchableSidebar:
+    """
+    Crea un sidebar virtualizado con secciones y buscador, para menús con
+    cientos de ítems (create_simple_sidebar construye todos de golpe).
+
+    Args:
+        items:       Lista de dicts con 'icon', 'label' y, opcionalmente,
+                     'section' (agrupa bajo una cabecera) y 'keywords'.
+        on_click:    Callback que recibe el índice del ítem pulsado.
+        item_extent: Alto fijo de cada fila en píxeles.
+
+    Returns:
+        SearchableSidebar (ft.Container) con filter() y set_active().
+
+    Ejemplo::
+
+        items = [
+            {"icon": ft.Icons.PEOPLE, "label": "Usuarios", "section": "Admin"},
+            {"icon": ft.Icons.RECEIPT, "label": "Facturas", "section": "Ventas",
+             "keywords": ["billing"]},
+        ]
+        sidebar = create_searchable_sidebar(items, on_click=lambda idx: print(idx))
+    """
+    return SearchableSidebar(items, on_click=on_click, item_extent=item_extent)
+
+
 def create_footer(text: str = "© 2026") -> ft.Container:
     """
     Crea un pie de página simple con texto centrado.
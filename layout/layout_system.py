@@ -4,12 +4,321 @@ layout_system.py
 Sistema de layouts responsive profesional para Flet.
 
 Clases:
+    Breakpoint:       Breakpoint con nombre y el preset de layout que aplica.
+    BreakpointEngine: Resuelve el breakpoint de un ancho (búsqueda binaria).
+    VirtualContent: Contenido central virtualizado para listas/feeds muy grandes.
     ResponsiveLayout: Layout principal con soporte para barras top/bottom/left/right.
     LayoutBuilder: Builder fluido para construir ResponsiveLayout fácilmente.
 """
 
+import asyncio
+import bisect
+import math
+import time
 import flet as ft
-from typing import Optional
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+# Clases de dispositivo que reporta ResponsiveLayout.device_class
+DEVICE_MOBILE = "mobile"
+DEVICE_TABLET = "tablet"
+DEVICE_DESKTOP = "desktop"
+
+# Rangos permitidos (px) de las dimensiones de las barras; los usan
+# validate_layout_params() y el redimensionado de sidebars por arrastre
+DIMENSION_BOUNDS = {
+    "left_bar_width": (50, 1000),
+    "right_bar_width": (50, 1000),
+    "top_bar_height": (30, 200),
+    "bottom_bar_height": (30, 200),
+}
+
+# Ancho (px) de la zona de arrastre en el borde de cada sidebar
+RESIZE_HANDLE_WIDTH = 6
+
+# Una barra puede darse ya construida o como factory sin argumentos
+BarSource = Union[ft.Control, Callable[[], ft.Control]]
+
+
+class Breakpoint(NamedTuple):
+    """
+    Breakpoint con nombre: se aplica desde `min_width` (incluido) hasta el
+    siguiente. Los campos None usan el valor configurado en el layout.
+    """
+
+    name: str
+    min_width: int
+    collapse_sidebars: bool = False
+    left_bar_width: Optional[int] = None
+    right_bar_width: Optional[int] = None
+    top_bar_height: Optional[int] = None
+    bottom_bar_height: Optional[int] = None
+    show_top_bar: bool = True
+    show_bottom_bar: bool = True
+
+
+class LayoutPreset(NamedTuple):
+    """Estado precalculado del layout para un breakpoint."""
+
+    left_open: bool
+    right_open: bool
+    left_width: int
+    right_width: int
+    top_height: int
+    bottom_height: int
+    show_top_bar: bool
+    show_bottom_bar: bool
+
+
+class BreakpointEngine:
+    """
+    Conjunto ordenado de breakpoints con búsqueda binaria por ancho.
+
+    Un ancho menor que el primer min_width se asigna al primer breakpoint.
+
+    Raises:
+        ValueError: Si no hay breakpoints o hay nombres repetidos.
+    """
+
+    def __init__(self, breakpoints: Sequence[Breakpoint]):
+        if not breakpoints:
+            raise ValueError("Se necesita al menos un breakpoint.")
+        self.breakpoints = sorted(breakpoints, key=lambda bp: bp.min_width)
+        names = [bp.name for bp in self.breakpoints]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Nombres de breakpoint repetidos: {names}")
+        self._min_widths = [bp.min_width for bp in self.breakpoints]
+        # (anchos/alturas base) -> presets, compartidos por todos los layouts
+        self._preset_cache: Dict[tuple, Dict[str, LayoutPreset]] = {}
+
+    def lookup(self, width: int) -> Breakpoint:
+        """Retorna el breakpoint que corresponde a un ancho."""
+        index = bisect.bisect_right(self._min_widths, width) - 1
+        return self.breakpoints[max(index, 0)]
+
+    def presets(
+        self,
+        left_width: int,
+        right_width: int,
+        top_height: int,
+        bottom_height: int,
+    ) -> Dict[str, LayoutPreset]:
+        """
+        Presets por nombre de breakpoint para unas dimensiones base. Se
+        calculan una sola vez por combinación y no deben modificarse.
+        """
+        key = (left_width, right_width, top_height, bottom_height)
+        presets = self._preset_cache.get(key)
+        if presets is None:
+            presets = self._preset_cache[key] = self.build_presets(*key)
+        return presets
+
+    def build_presets(
+        self,
+        left_width: int,
+        right_width: int,
+        top_height: int,
+        bottom_height: int,
+    ) -> Dict[str, LayoutPreset]:
+        """Como presets(), pero sin pasar por la caché compartida."""
+        return {
+            bp.name: LayoutPreset(
+                left_open=not bp.collapse_sidebars,
+                right_open=not bp.collapse_sidebars,
+                left_width=bp.left_bar_width or left_width,
+                right_width=bp.right_bar_width or right_width,
+                top_height=bp.top_bar_height or top_height,
+                bottom_height=bp.bottom_bar_height or bottom_height,
+                show_top_bar=bp.show_top_bar,
+                show_bottom_bar=bp.show_bottom_bar,
+            )
+            for bp in self.breakpoints
+        }
+
+    @classmethod
+    def default(
+        cls,
+        breakpoint_mobile: int = 600,
+        breakpoint_tablet: int = 1024,
+        collapse_sidebars_on_mobile: bool = True,
+        collapse_sidebars_on_tablet: bool = False,
+    ) -> "BreakpointEngine":
+        """Los tres breakpoints clásicos: mobile, tablet y desktop."""
+        return cls(
+            [
+                Breakpoint(DEVICE_MOBILE, 0, collapse_sidebars_on_mobile),
+                Breakpoint(DEVICE_TABLET, breakpoint_mobile, collapse_sidebars_on_tablet),
+                Breakpoint(DEVICE_DESKTOP, breakpoint_tablet),
+            ]
+        )
+
+
+def _drag_delta(e) -> float:
+    """Desplazamiento horizontal de un evento de arrastre (según versión de Flet)."""
+    delta = getattr(e, "primary_delta", None)
+    if delta is None and getattr(e, "local_delta", None) is not None:
+        delta = e.local_delta.x
+    if delta is None:
+        delta = getattr(e, "delta_x", 0)
+    return delta or 0.0
+
+
+class VirtualContent(ft.Column):
+    """
+    Contenido central virtualizado: solo construye los ítems visibles más
+    `overscan` por arriba y por abajo. El resto del alto se reserva con dos
+    espaciadores, de modo que la barra de scroll del layout es la real.
+
+    No gestiona scroll propio: ResponsiveLayout le pasa los eventos de scroll
+    del área central (que sigue siendo la dueña del scroll). Los ítems que
+    siguen visibles al desplazarse se conservan; los huecos se rellenan
+    reutilizando los contenedores (slots) que salen de la ventana.
+
+    Args:
+        item_count:      Número total de ítems.
+        item_builder:    Función índice -> control del ítem.
+        item_extent:     Alto fijo de cada ítem en píxeles.
+        overscan:        Ítems extra construidos fuera de la zona visible.
+        viewport_height: Alto visible estimado hasta recibir el primer scroll.
+    """
+
+    def __init__(
+        self,
+        item_count: int,
+        item_builder: Callable[[int], ft.Control],
+        item_extent: float = 56,
+        overscan: int = 10,
+        viewport_height: float = 800,
+    ):
+        super().__init__(spacing=0)
+        self.item_count = item_count
+        self.item_builder = item_builder
+        self.item_extent = item_extent
+        self.overscan = overscan
+        self.viewport_height = viewport_height
+        # Column con scroll que contiene este control (la asigna quien lo monta)
+        self.scroll_owner: Optional[ft.Column] = None
+
+        self._scroll_offset = 0.0
+        self._window = (0, 0)
+        # índice -> slot (Container de alto fijo) actualmente visible
+        self._slots: dict = {}
+        self._free_slots: List[ft.Container] = []
+        self._top_spacer = ft.Container(height=0)
+        self._bottom_spacer = ft.Container(height=0)
+        self._render_window()
+
+    @property
+    def visible_range(self) -> tuple:
+        """Rango [inicio, fin) de índices construidos actualmente."""
+        return self._window
+
+    def handle_scroll(self, offset: float, viewport_height: Optional[float] = None) -> bool:
+        """
+        Recalcula la ventana para un desplazamiento vertical (en píxeles).
+
+        Returns:
+            True si la ventana cambió y el control necesita update().
+        """
+        self._scroll_offset = max(0.0, offset)
+        if viewport_height:
+            self.viewport_height = viewport_height
+        return self._render_window()
+
+    def set_item_count(self, item_count: int) -> bool:
+        """Cambia el número de ítems (ej. feed que crece). True si hay que actualizar."""
+        self.item_count = item_count
+        for index in [i for i in self._slots if i >= item_count]:
+            self._free_slots.append(self._slots.pop(index))
+        return self._render_window(force=True)
+
+    def refresh(self) -> None:
+        """Reconstruye los ítems visibles (ej. tras cambiar los datos)."""
+        for index, slot in self._slots.items():
+            slot.content = self.item_builder(index)
+
+    def reset(self, item_count: Optional[int] = None) -> None:
+        """
+        Vuelve al principio de la lista y reconstruye la ventana (ej. tras
+        filtrar los datos), opcionalmente con un nuevo número de ítems.
+        Si la lista estaba desplazada, lleva también scroll_owner al inicio
+        para que la ventana y la posición de scroll coincidan.
+        """
+        if item_count is not None:
+            self.item_count = item_count
+        scrolled = self._scroll_offset > 0
+        self._free_slots.extend(self._slots.values())
+        self._slots.clear()
+        self._scroll_offset = 0.0
+        self._render_window(force=True)
+        if scrolled:
+            self._scroll_owner_to_top()
+
+    def _scroll_owner_to_top(self) -> None:
+        owner = self.scroll_owner
+        if owner is None:
+            return
+        try:
+            page = owner.page
+        except RuntimeError:
+            # Aún no está en la página: no hay scroll que mover
+            return
+        if page is not None:
+            page.run_task(owner.scroll_to, offset=0)
+
+    def built_item(self, index: int) -> Optional[ft.Control]:
+        """Control del ítem `index` si está construido (en la ventana), o None."""
+        slot = self._slots.get(index)
+        return slot.content if slot is not None else None
+
+    def _compute_window(self) -> tuple:
+        first_visible = int(self._scroll_offset // self.item_extent)
+        last_visible = math.ceil(
+            (self._scroll_offset + self.viewport_height) / self.item_extent
+        )
+        start = max(0, first_visible - self.overscan)
+        end = min(self.item_count, last_visible + self.overscan)
+        return start, max(start, end)
+
+    def _render_window(self, force: bool = False) -> bool:
+        start, end = self._compute_window()
+        if (start, end) == self._window and self.controls and not force:
+            return False
+
+        # Liberar los slots que salen de la ventana
+        for index in [i for i in self._slots if not start <= i < end]:
+            self._free_slots.append(self._slots.pop(index))
+
+        # Rellenar los índices nuevos reutilizando slots libres
+        for index in range(start, end):
+            if index in self._slots:
+                continue
+            item = self.item_builder(index)
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                slot.content = item
+            else:
+                slot = ft.Container(content=item, height=self.item_extent)
+            self._slots[index] = slot
+
+        self._window = (start, end)
+        self._top_spacer.height = start * self.item_extent
+        self._bottom_spacer.height = (self.item_count - end) * self.item_extent
+        self.controls = (
+            [self._top_spacer]
+            + [self._slots[i] for i in range(start, end)]
+            + [self._bottom_spacer]
+        )
+        return True
 
 
 class ResponsiveLayout(ft.Container):
@@ -25,6 +334,33 @@ class ResponsiveLayout(ft.Container):
             │   ├── Container (content)   [expand=True]
             │   └── Container (right_bar) [opcional, ancho fijo, colapsable]
             └── Container (bottom_bar)    [opcional, altura fija]
+
+    Con flat_tree=True se omiten los envoltorios intermedios (el Container
+    que rodea al Row de cada barra lateral y el Container del área central):
+    cada sidebar queda como Container animado -> Row -> slot de ancho fijo
+    (el Row mantiene el ancho de la barra durante el deslizamiento), y el centro
+    como Column (scroll vertical) -> Row (scroll horizontal). Se conservan la
+    animación de deslizamiento y el scroll, con menos controles que
+    serializar y comparar en cada update.
+
+    Los breakpoints (por defecto mobile/tablet/desktop a partir de
+    breakpoint_mobile y breakpoint_tablet) pueden sustituirse por cualquier
+    lista de Breakpoint. Cada uno tiene un LayoutPreset precalculado; al
+    cambiar de breakpoint solo se modifican los contenedores cuyo estado
+    difiere del preset.
+
+    Con resizable_sidebars=True cada sidebar tiene en su borde interior una
+    zona de arrastre para cambiar su ancho. Durante el arrastre solo se
+    actualiza el contenedor de esa barra, como máximo resize_fps veces por
+    segundo; al soltar, el ancho se ajusta a DIMENSION_BOUNDS y se fija una
+    sola vez (se notifica con on_sidebar_resize(lado, ancho)).
+
+    Las barras laterales pueden pasarse como factory (callable sin
+    argumentos): no se construyen hasta la primera vez que se abren, así que
+    en móvil (donde empiezan colapsadas) no ocupan memoria ni se envían al
+    cliente. Con sidebar_unmount_after_s, una barra creada por factory que
+    permanece colapsada ese tiempo se desmonta y se vuelve a construir al
+    abrirla (su estado interno se pierde).
     """
 
     def __init__(
@@ -32,8 +368,8 @@ class ResponsiveLayout(ft.Container):
         content: ft.Control,
         top_bar: Optional[ft.Control] = None,
         bottom_bar: Optional[ft.Control] = None,
-        left_bar: Optional[ft.Control] = None,
-        right_bar: Optional[ft.Control] = None,
+        left_bar: Optional[BarSource] = None,
+        right_bar: Optional[BarSource] = None,
         top_bar_height: int = 60,
         bottom_bar_height: int = 60,
         left_bar_width: int = 250,
@@ -52,15 +388,29 @@ class ResponsiveLayout(ft.Container):
         transition_duration_ms: int = 300,
         transition_curve: ft.AnimationCurve = ft.AnimationCurve.DECELERATE,
         fade_sidebars: bool = False,
+        sidebar_unmount_after_s: Optional[float] = None,
+        breakpoints: Optional[Union[Sequence[Breakpoint], BreakpointEngine]] = None,
+        flat_tree: bool = False,
+        resizable_sidebars: bool = False,
+        resize_fps: int = 30,
+        on_sidebar_resize: Optional[Callable[[str, int], None]] = None,
     ):
         super().__init__(expand=True)
 
-        # Controles de las barras
+        # Controles de las barras (las barras laterales creadas por factory
+        # son None hasta que se montan)
         self.main_content = content
         self.top_bar_control = top_bar
         self.bottom_bar_control = bottom_bar
-        self.left_bar_control = left_bar
-        self.right_bar_control = right_bar
+        self._sidebar_factories: Dict[str, Optional[Callable[[], ft.Control]]] = {
+            "left": self._as_factory(left_bar),
+            "right": self._as_factory(right_bar),
+        }
+        self.left_bar_control = None if self._sidebar_factories["left"] else left_bar
+        self.right_bar_control = None if self._sidebar_factories["right"] else right_bar
+        self.sidebar_unmount_after_s = sidebar_unmount_after_s
+        # Se incrementa en cada apertura/cierre para invalidar desmontajes pendientes
+        self._sidebar_generation = {"left": 0, "right": 0}
 
         # Configuración de responsividad
         self.breakpoint_mobile = breakpoint_mobile
@@ -72,6 +422,8 @@ class ResponsiveLayout(ft.Container):
 
         # Animación para transiciones suaves
         self._fade_sidebars = fade_sidebars
+        # ft.Animation es mutable: cada layout tiene la suya (no se comparte
+        # entre sesiones)
         anim = (
             ft.Animation(transition_duration_ms, transition_curve)
             if animate_transitions
@@ -97,62 +449,99 @@ class ResponsiveLayout(ft.Container):
         # Guardamos el ancho original para restaurarlo al abrir
         self._left_bar_width = left_bar_width
         self._right_bar_width = right_bar_width
+        # Una barra de factory empieza cerrada (sin montar): el primer
+        # on_resize() o toggle la abre y la construye, nunca queda abierta vacía
         self._left_open = self.left_bar_control is not None
         self._right_open = self.right_bar_control is not None
 
-        # Contenedores internos mantienen el ancho fijo
-        self.left_inner = ft.Container(
-            content=ft.Row([ft.Container(self.left_bar_control, width=left_bar_width)]),
-            width=left_bar_width,
-        )
+        # Contenedores internos mantienen el ancho fijo. El Row da al slot un
+        # ancho sin límite, así que la barra no se comprime mientras el
+        # contenedor externo anima su ancho (en modo plano se omite solo el
+        # Container que envuelve al Row)
+        self.flat_tree = flat_tree
+        self.left_slot = ft.Container(self.left_bar_control, width=left_bar_width)
+        self.right_slot = ft.Container(self.right_bar_control, width=right_bar_width)
+        if flat_tree:
+            self.left_inner = ft.Row([self.left_slot], width=left_bar_width)
+            self.right_inner = ft.Row([self.right_slot], width=right_bar_width)
+        else:
+            self.left_inner = ft.Container(
+                content=ft.Row([self.left_slot]),
+                width=left_bar_width,
+            )
+            self.right_inner = ft.Container(
+                content=ft.Row([self.right_slot]),
+                width=right_bar_width,
+            )
 
-        self.right_inner = ft.Container(
-            content=ft.Row(
-                [ft.Container(self.right_bar_control, width=right_bar_width)]
-            ),
-            width=right_bar_width,
-        )
+        # --- Redimensionado por arrastre ---
+        self.resizable_sidebars = resizable_sidebars
+        self.resize_fps = resize_fps
+        self.on_sidebar_resize = on_sidebar_resize
+        self._animation = anim
+        # lado -> estado del arrastre en curso (ancho, último envío, flush pendiente)
+        self._drags: Dict[str, dict] = {}
 
         # Los contenedores externos animan su ancho y usan alineación para el efecto de deslizamiento real
         self.left_container = ft.Container(
-            content=self.left_inner,
+            content=self._with_resize_handle("left", self.left_inner),
             width=left_bar_width if self._left_open else 0,
             bgcolor=left_bar_bgcolor,
             animate=anim,
             clip_behavior=ft.ClipBehavior.HARD_EDGE,
             alignment=ft.alignment.Alignment(1, -1),  # Top Right
-            visible=self.left_bar_control is not None,
+            visible=self.has_left_bar,
         )
 
         self.right_container = ft.Container(
-            content=self.right_inner,
+            content=self._with_resize_handle("right", self.right_inner),
             width=right_bar_width if self._right_open else 0,
             bgcolor=right_bar_bgcolor,
             animate=anim,
             clip_behavior=ft.ClipBehavior.HARD_EDGE,
             alignment=ft.alignment.Alignment(-1, -1),  # Top Left
-            visible=self.right_bar_control is not None,
+            visible=self.has_right_bar,
         )
 
-        self.center_content = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[self.main_content],
-                        scroll=ft.ScrollMode.AUTO,  # barra horizontal si desborda
-                        vertical_alignment=ft.CrossAxisAlignment.START,
-                    )
-                ],
-                scroll=ft.ScrollMode.AUTO,  # barra vertical si desborda
-                expand=True,
-            ),
+        self._content_row = ft.Row(
+            controls=[self.main_content],
+            scroll=ft.ScrollMode.AUTO,  # barra horizontal si desborda
+            vertical_alignment=ft.CrossAxisAlignment.START,
+        )
+        self._center_column = ft.Column(
+            controls=[self._content_row],
+            scroll=ft.ScrollMode.AUTO,  # barra vertical si desborda
             expand=True,
         )
+        self.center_content = (
+            self._center_column
+            if flat_tree
+            else ft.Container(content=self._center_column, expand=True)
+        )
+        self._bind_virtual_content()
 
         # --- Estado de dispositivo ---
         self._is_mobile = False
         self._is_tablet = False
         self._is_desktop = True
+        # None hasta el primer on_resize(): fuerza a aplicar la configuración
+        self._device_class: Optional[str] = None
+        self._base_dimensions = {
+            "left_width": left_bar_width,
+            "right_width": right_bar_width,
+            "top_height": top_bar_height,
+            "bottom_height": bottom_bar_height,
+        }
+        # Dimensiones de la configuración: solo sus presets van a la caché del
+        # motor (compartida entre sesiones); los anchos arrastrados no
+        self._config_dimensions = dict(self._base_dimensions)
+        self._last_width: Optional[int] = None
+        self.set_breakpoints(breakpoints)
+        self._breakpoint_listeners: List[Callable[[str, Optional[str]], None]] = []
+
+        # --- Actualizaciones agrupadas (ver batch()) ---
+        self._batch_depth = 0
+        self._pending_updates: List[ft.Control] = []
 
         # --- Estructura del layout ---
         self.content = ft.Column(
@@ -189,57 +578,454 @@ class ResponsiveLayout(ft.Container):
         """True si el ancho actual es mayor o igual que breakpoint_tablet."""
         return self._is_desktop
 
+    @property
+    def has_left_bar(self) -> bool:
+        """True si hay barra izquierda (montada o pendiente de su factory)."""
+        return self.left_bar_control is not None or self._sidebar_factories["left"] is not None
+
+    @property
+    def has_right_bar(self) -> bool:
+        """True si hay barra derecha (montada o pendiente de su factory)."""
+        return self.right_bar_control is not None or self._sidebar_factories["right"] is not None
+
+    @property
+    def device_class(self) -> Optional[str]:
+        """
+        Nombre del breakpoint actual ("mobile", "tablet", "desktop" con la
+        configuración por defecto) o None antes del primer on_resize().
+        Con breakpoints personalizados, is_mobile/is_tablet/is_desktop solo
+        son True si el breakpoint usa uno de esos nombres.
+        """
+        return self._device_class
+
+    def device_class_for(self, width: int) -> str:
+        """Retorna el nombre del breakpoint correspondiente a un ancho."""
+        return self._breakpoint_engine.lookup(width).name
+
+    @property
+    def breakpoints(self) -> List[Breakpoint]:
+        """Breakpoints activos, ordenados por min_width."""
+        return list(self._breakpoint_engine.breakpoints)
+
+    def set_breakpoints(
+        self,
+        breakpoints: Optional[Union[Sequence[Breakpoint], BreakpointEngine]] = None,
+    ) -> None:
+        """
+        Sustituye los breakpoints (None = mobile/tablet/desktop según la
+        configuración actual), recalcula los presets y, si ya se conoce el
+        ancho de la página, vuelve a aplicar el breakpoint que corresponda.
+        Un BreakpointEngine se usa tal cual (y comparte sus presets).
+        """
+        if isinstance(breakpoints, BreakpointEngine):
+            self._breakpoint_engine = breakpoints
+        elif breakpoints is None:
+            self._breakpoint_engine = BreakpointEngine.default(
+                self.breakpoint_mobile,
+                self.breakpoint_tablet,
+                self.collapse_sidebars_on_mobile,
+                self.collapse_sidebars_on_tablet,
+            )
+        else:
+            self._breakpoint_engine = BreakpointEngine(breakpoints)
+        self._compile_presets()
+        if self._last_width is not None:
+            self._device_class = None
+            self.on_resize(self._last_width)
+
+    def _compile_presets(self) -> None:
+        engine = self._breakpoint_engine
+        if self._base_dimensions == self._config_dimensions:
+            self._presets = engine.presets(**self._base_dimensions)
+        else:
+            self._presets = engine.build_presets(**self._base_dimensions)
+
+    # --- Eventos de breakpoint ---
+
+    def add_breakpoint_listener(
+        self, callback: Callable[[str, Optional[str]], None]
+    ) -> None:
+        """
+        Suscribe un callback(nueva_clase, clase_anterior) que se llama solo
+        cuando cambia la clase de dispositivo, no en cada resize.
+        """
+        self._breakpoint_listeners.append(callback)
+
+    def remove_breakpoint_listener(
+        self, callback: Callable[[str, Optional[str]], None]
+    ) -> None:
+        """Elimina un callback registrado con add_breakpoint_listener()."""
+        if callback in self._breakpoint_listeners:
+            self._breakpoint_listeners.remove(callback)
+
     # --- Métodos públicos ---
 
     def toggle_left_sidebar(self) -> None:
         """Alterna la barra lateral izquierda con animación de deslizamiento real."""
-        if not self.left_bar_control or not self.left_bar_collapsible:
+        if not self.has_left_bar or not self.left_bar_collapsible:
             return
-        self._left_open = not self._left_open
-        self.left_container.width = self._left_bar_width if self._left_open else 0
-        self.update()
+        self._request_update(self._set_sidebar_open("left", not self._left_open))
 
     def toggle_right_sidebar(self) -> None:
         """Alterna la barra lateral derecha con animación de deslizamiento real."""
-        if not self.right_bar_control or not self.right_bar_collapsible:
+        if not self.has_right_bar or not self.right_bar_collapsible:
             return
-        self._right_open = not self._right_open
-        self.right_container.width = self._right_bar_width if self._right_open else 0
-        self.update()
+        self._request_update(self._set_sidebar_open("right", not self._right_open))
+
+    def set_content(self, content: ft.Control) -> None:
+        """Sustituye el contenido principal (actualiza solo el área central)."""
+        self.main_content = content
+        self._content_row.controls = [content]
+        self._bind_virtual_content()
+        self._request_update(self.center_content)
+
+    def _bind_virtual_content(self) -> None:
+        """
+        Conecta el scroll del área central con el contenido si es un
+        VirtualContent (el layout sigue siendo el dueño del scroll).
+        """
+        if isinstance(self.main_content, VirtualContent):
+            self.main_content.scroll_owner = self._center_column
+            self._center_column.on_scroll = self._on_center_scroll
+        else:
+            self._center_column.on_scroll = None
+
+    def _on_center_scroll(self, e: ft.OnScrollEvent) -> None:
+        content = self.main_content
+        if isinstance(content, VirtualContent) and content.handle_scroll(
+            e.pixels, e.viewport_dimension
+        ):
+            self._request_update(content)
+
+    def set_top_bar(self, bar: Optional[ft.Control]) -> None:
+        """Sustituye (o oculta con None) la barra superior."""
+        self.top_bar_control = bar
+        self.top_container.content = bar
+        self.top_container.visible = bar is not None
+        self._request_update(self.top_container)
+
+    def set_bottom_bar(self, bar: Optional[ft.Control]) -> None:
+        """Sustituye (o oculta con None) la barra inferior."""
+        self.bottom_bar_control = bar
+        self.bottom_container.content = bar
+        self.bottom_container.visible = bar is not None
+        self._request_update(self.bottom_container)
+
+    def set_left_bar(self, bar: Optional[BarSource]) -> None:
+        """
+        Sustituye (o oculta con None) el contenido de la barra izquierda. Con
+        una factory, la barra se construye cuando esté abierta.
+        """
+        self._request_update(self._replace_sidebar("left", bar))
+
+    def set_right_bar(self, bar: Optional[BarSource]) -> None:
+        """
+        Sustituye (o oculta con None) el contenido de la barra derecha. Con
+        una factory, la barra se construye cuando esté abierta.
+        """
+        self._request_update(self._replace_sidebar("right", bar))
+
+    # --- Montaje diferido de las barras laterales ---
+
+    @staticmethod
+    def _as_factory(bar: Optional[BarSource]) -> Optional[Callable[[], ft.Control]]:
+        if bar is None or isinstance(bar, ft.Control):
+            return None
+        return bar
+
+    def _replace_sidebar(self, side: str, bar: Optional[BarSource]) -> ft.Control:
+        factory = self._as_factory(bar)
+        self._sidebar_factories[side] = factory
+        self._sidebar_generation[side] += 1
+        slot = getattr(self, f"{side}_slot")
+        control = None if factory else bar
+        setattr(self, f"{side}_bar_control", control)
+        slot.content = control
+        container = getattr(self, f"{side}_container")
+        container.visible = bar is not None
+        if getattr(self, f"_{side}_open"):
+            self._mount_sidebar(side)
+        return container
+
+    def _mount_sidebar(self, side: str) -> None:
+        """Construye la barra con su factory si aún no está montada."""
+        factory = self._sidebar_factories[side]
+        if factory is None or getattr(self, f"{side}_bar_control") is not None:
+            return
+        control = factory()
+        setattr(self, f"{side}_bar_control", control)
+        getattr(self, f"{side}_slot").content = control
+
+    def _unmount_sidebar(self, side: str) -> None:
+        """Libera una barra creada por factory (se reconstruirá al abrirla)."""
+        if self._sidebar_factories[side] is None or getattr(self, f"_{side}_open"):
+            return
+        if getattr(self, f"{side}_bar_control") is None:
+            return
+        setattr(self, f"{side}_bar_control", None)
+        getattr(self, f"{side}_slot").content = None
+        self._request_update(getattr(self, f"{side}_container"))
+
+    def _set_sidebar_open(self, side: str, is_open: bool) -> ft.Control:
+        """
+        Abre o cierra una barra lateral (montándola si hace falta) y retorna el
+        contenedor que hay que actualizar.
+        """
+        setattr(self, f"_{side}_open", is_open)
+        self._sidebar_generation[side] += 1
+        if is_open:
+            self._mount_sidebar(side)
+        else:
+            self._schedule_unmount(side)
+        container = getattr(self, f"{side}_container")
+        container.width = getattr(self, f"_{side}_bar_width") if is_open else 0
+        return container
+
+    def _set_sidebar_width(self, side: str, width: int) -> None:
+        setattr(self, f"_{side}_bar_width", width)
+        getattr(self, f"{side}_slot").width = width
+        getattr(self, f"{side}_inner").width = width
+
+    # --- Redimensionado de sidebars ---
+
+    def _with_resize_handle(self, side: str, inner: ft.Control) -> ft.Control:
+        """
+        Superpone la zona de arrastre al borde interior de la barra; al quedar
+        dentro del contenedor recortado, se oculta sola al colapsarla.
+        """
+        if not self.resizable_sidebars:
+            return inner
+        handle = ft.GestureDetector(
+            content=ft.Container(width=RESIZE_HANDLE_WIDTH),
+            mouse_cursor=ft.MouseCursor.RESIZE_LEFT_RIGHT,
+            # Limita también en el cliente la frecuencia de eventos de arrastre
+            drag_interval=max(1, int(1000 / self.resize_fps)),
+            on_horizontal_drag_start=lambda e: self._start_resize(side),
+            on_horizontal_drag_update=lambda e: self._drag_resize(side, _drag_delta(e)),
+            on_horizontal_drag_end=lambda e: self._end_resize(side),
+            top=0,
+            bottom=0,
+            right=0 if side == "left" else None,
+            left=0 if side == "right" else None,
+        )
+        return ft.Stack([inner, handle])
+
+    @staticmethod
+    def clamp_sidebar_width(side: str, width: float) -> int:
+        """Ajusta un ancho de sidebar al rango de DIMENSION_BOUNDS."""
+        min_width, max_width = DIMENSION_BOUNDS[f"{side}_bar_width"]
+        return int(min(max(width, min_width), max_width))
+
+    def resize_sidebar(self, side: str, width: float) -> int:
+        """
+        Fija el ancho de una barra lateral ("left" o "right"), ajustado a
+        DIMENSION_BOUNDS, y lo conserva en los cambios de breakpoint (salvo
+        que el breakpoint defina su propio ancho).
+
+        Returns:
+            El ancho aplicado.
+        """
+        width = self.clamp_sidebar_width(side, width)
+        self._set_sidebar_width(side, width)
+        container = getattr(self, f"{side}_container")
+        if getattr(self, f"_{side}_open"):
+            container.width = width
+        self._base_dimensions[f"{side}_width"] = width
+        self._compile_presets()
+        self._request_update(container)
+        if self.on_sidebar_resize:
+            self.on_sidebar_resize(side, width)
+        return width
+
+    def _start_resize(self, side: str) -> None:
+        container = getattr(self, f"{side}_container")
+        # Sin animación mientras se arrastra: cada paso se aplica al instante
+        container.animate = None
+        self._drags[side] = {
+            "width": float(getattr(self, f"_{side}_bar_width")),
+            "last_sent": 0.0,
+            "scheduled": False,
+        }
+
+    def _drag_resize(self, side: str, delta: float) -> None:
+        drag = self._drags.get(side)
+        if drag is None or not getattr(self, f"_{side}_open"):
+            return
+        # La barra derecha crece al arrastrar hacia la izquierda
+        drag["width"] += delta if side == "left" else -delta
+        drag["width"] = self.clamp_sidebar_width(side, drag["width"])
+
+        wait = drag["last_sent"] + 1.0 / self.resize_fps - time.perf_counter()
+        if wait <= 0:
+            self._send_drag_width(side)
+        elif not drag["scheduled"]:
+            # Envía el último ancho cuando se cumpla el intervalo del frame
+            drag["scheduled"] = True
+
+            async def flush():
+                await asyncio.sleep(wait)
+                drag["scheduled"] = False
+                if self._drags.get(side) is drag:
+                    self._send_drag_width(side)
+
+            self.page.run_task(flush)
+
+    def _send_drag_width(self, side: str) -> None:
+        drag = self._drags[side]
+        drag["last_sent"] = time.perf_counter()
+        width = int(drag["width"])
+        if width == getattr(self, f"_{side}_bar_width"):
+            return
+        self._set_sidebar_width(side, width)
+        container = getattr(self, f"{side}_container")
+        container.width = width
+        # Solo el contenedor de la barra, nunca el layout completo
+        container.update()
+
+    def _end_resize(self, side: str) -> None:
+        drag = self._drags.pop(side, None)
+        if drag is None:
+            return
+        getattr(self, f"{side}_container").animate = self._animation
+        self.resize_sidebar(side, drag["width"])
+
+    def _apply_preset(self, preset: LayoutPreset) -> List[ft.Control]:
+        """
+        Aplica un preset y retorna solo los contenedores que han cambiado
+        respecto al estado actual.
+        """
+        changed: List[ft.Control] = []
+        for side, is_open, width in (
+            ("left", preset.left_open, preset.left_width),
+            ("right", preset.right_open, preset.right_width),
+        ):
+            if not getattr(self, f"has_{side}_bar"):
+                continue
+            resized = width != getattr(self, f"_{side}_bar_width")
+            if resized:
+                self._set_sidebar_width(side, width)
+            unmounted = is_open and getattr(self, f"{side}_bar_control") is None
+            if resized or unmounted or is_open != getattr(self, f"_{side}_open"):
+                changed.append(self._set_sidebar_open(side, is_open))
+
+        for bar, height, show in (
+            ("top", preset.top_height, preset.show_top_bar),
+            ("bottom", preset.bottom_height, preset.show_bottom_bar),
+        ):
+            container = getattr(self, f"{bar}_container")
+            visible = show and getattr(self, f"{bar}_bar_control") is not None
+            if container.height != height or container.visible != visible:
+                container.height = height
+                container.visible = visible
+                changed.append(container)
+        return changed
+
+    def _schedule_unmount(self, side: str) -> None:
+        if self.sidebar_unmount_after_s is None or self._sidebar_factories[side] is None:
+            return
+        if getattr(self, f"{side}_bar_control") is None:
+            return
+        try:
+            page = self.page
+        except RuntimeError:
+            # Aún no está en la página: no hay event loop donde programarlo
+            return
+        if page is None:
+            return
+        generation = self._sidebar_generation[side]
+
+        async def unmount_when_idle():
+            await asyncio.sleep(self.sidebar_unmount_after_s)
+            # Si la barra se abrió o cerró de nuevo entretanto, no se desmonta
+            if self._sidebar_generation[side] == generation:
+                self._unmount_sidebar(side)
+
+        page.run_task(unmount_when_idle)
+
+    # --- Actualizaciones agrupadas ---
+
+    @contextmanager
+    def batch(self) -> Iterator["ResponsiveLayout"]:
+        """
+        Agrupa varias modificaciones del layout en un único envío.
+
+        Dentro del bloque, toggle_*_sidebar(), on_resize(), los set_*() y
+        mark_dirty() solo registran los contenedores afectados; al salir se
+        envía un único page.update() con esos controles. Admite anidamiento.
+
+        Ejemplo::
+
+            with layout.batch():
+                layout.set_top_bar(nueva_barra)
+                layout.set_content(nueva_vista)
+                layout.toggle_left_sidebar()
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_updates()
+
+    def mark_dirty(self, *controls: ft.Control) -> None:
+        """
+        Registra controles modificados directamente por la app (ej.
+        layout.top_container) para enviarlos en el update del batch actual,
+        o los actualiza inmediatamente si no hay batch abierto.
+        """
+        self._request_update(*controls)
+
+    def _request_update(self, *controls: ft.Control) -> None:
+        for control in controls:
+            if all(control is not dirty for dirty in self._pending_updates):
+                self._pending_updates.append(control)
+        if self._batch_depth == 0:
+            self._flush_updates()
+
+    def _flush_updates(self) -> None:
+        dirty, self._pending_updates = self._pending_updates, []
+        if not dirty:
+            return
+        if any(control is self for control in dirty):
+            # El layout completo ya incluye al resto de contenedores
+            dirty = [self]
+        if len(dirty) == 1:
+            dirty[0].update()
+        else:
+            self.page.update(*dirty)
 
     def on_resize(self, width: int) -> None:
         """
         Actualiza el estado del layout al cambiar el ancho de la ventana.
 
+        Solo aplica el preset del breakpoint y envía update() cuando cambia
+        el breakpoint (por defecto mobile/tablet/desktop); un resize dentro
+        del mismo breakpoint no hace nada, así que no se pierde el estado
+        abierto/cerrado elegido por el usuario.
+
         Args:
             width: Ancho actual de la página en píxeles.
         """
         if width is None:
             return
 
+        self._last_width = width
+        device_class = self._breakpoint_engine.lookup(width).name
+        if device_class == self._device_class:
+            return
+        previous_class = self._device_class
+        self._device_class = device_class
+
         # Actualizar estado de dispositivo
-        self._is_mobile = width < self.breakpoint_mobile
-        self._is_tablet = self.breakpoint_mobile <= width < self.breakpoint_tablet
-        self._is_desktop = width >= self.breakpoint_tablet
-
-        # Colapsar/mostrar sidebars según configuración
-        if self.left_bar_control:
-            should_collapse = (
-                self._is_mobile and self.collapse_sidebars_on_mobile
-            ) or (self._is_tablet and self.collapse_sidebars_on_tablet)
-            self._left_open = not should_collapse
-            self.left_container.width = self._left_bar_width if self._left_open else 0
-
-        if self.right_bar_control:
-            should_collapse = (
-                self._is_mobile and self.collapse_sidebars_on_mobile
-            ) or (self._is_tablet and self.collapse_sidebars_on_tablet)
-            self._right_open = not should_collapse
-            self.right_container.width = (
-                self._right_bar_width if self._right_open else 0
-            )
+        self._is_mobile = device_class == DEVICE_MOBILE
+        self._is_tablet = device_class == DEVICE_TABLET
+        self._is_desktop = device_class == DEVICE_DESKTOP
 
-        self.update()
+        self._request_update(*self._apply_preset(self._presets[device_class]))
+
+        for callback in list(self._breakpoint_listeners):
+            callback(device_class, previous_class)
 
 
 class LayoutBuilder:
@@ -265,13 +1051,34 @@ class LayoutBuilder:
         self._params["content"] = content
         return self
 
+    def with_virtual_content(
+        self,
+        item_count: int,
+        item_builder: Callable[[int], ft.Control],
+        item_extent: float = 56,
+        overscan: int = 10,
+        viewport_height: float = 800,
+    ) -> "LayoutBuilder":
+        """
+        Establece como contenido principal una lista virtualizada (ver
+        VirtualContent): solo se construyen los ítems visibles.
+        """
+        self._params["content"] = VirtualContent(
+            item_count,
+            item_builder,
+            item_extent=item_extent,
+            overscan=overscan,
+            viewport_height=viewport_height,
+        )
+        return self
+
     def with_top_bar(
         self,
-        bar: ft.Control,
+        bar: BarSource,
         height: int = 60,
         bgcolor: Optional[str] = None,
     ) -> "LayoutBuilder":
-        """Configura la barra superior."""
+        """Configura la barra superior (control o factory sin argumentos)."""
         self._params["top_bar"] = bar
         self._params["top_bar_height"] = height
         self._params["top_bar_bgcolor"] = bgcolor
@@ -279,11 +1086,11 @@ class LayoutBuilder:
 
     def with_bottom_bar(
         self,
-        bar: ft.Control,
+        bar: BarSource,
         height: int = 60,
         bgcolor: Optional[str] = None,
     ) -> "LayoutBuilder":
-        """Configura la barra inferior."""
+        """Configura la barra inferior (control o factory sin argumentos)."""
         self._params["bottom_bar"] = bar
         self._params["bottom_bar_height"] = height
         self._params["bottom_bar_bgcolor"] = bgcolor
@@ -291,12 +1098,15 @@ class LayoutBuilder:
 
     def with_left_bar(
         self,
-        bar: ft.Control,
+        bar: BarSource,
         width: int = 250,
         bgcolor: Optional[str] = None,
         collapsible: bool = True,
     ) -> "LayoutBuilder":
-        """Configura la barra lateral izquierda."""
+        """
+        Configura la barra lateral izquierda. `bar` puede ser un control o una
+        factory sin argumentos que la construye en su primera apertura.
+        """
         self._params["left_bar"] = bar
         self._params["left_bar_width"] = width
         self._params["left_bar_bgcolor"] = bgcolor
@@ -305,12 +1115,15 @@ class LayoutBuilder:
 
     def with_right_bar(
         self,
-        bar: ft.Control,
+        bar: BarSource,
         width: int = 250,
         bgcolor: Optional[str] = None,
         collapsible: bool = True,
     ) -> "LayoutBuilder":
-        """Configura la barra lateral derecha."""
+        """
+        Configura la barra lateral derecha. `bar` puede ser un control o una
+        factory sin argumentos que la construye en su primera apertura.
+        """
         self._params["right_bar"] = bar
         self._params["right_bar_width"] = width
         self._params["right_bar_bgcolor"] = bgcolor
@@ -323,14 +1136,57 @@ class LayoutBuilder:
         breakpoint_tablet: int = 1024,
         collapse_sidebars_on_mobile: bool = True,
         collapse_sidebars_on_tablet: bool = False,
+        breakpoints: Optional[Sequence[Breakpoint]] = None,
     ) -> "LayoutBuilder":
-        """Configura los breakpoints y comportamiento responsive."""
+        """
+        Configura los breakpoints y comportamiento responsive.
+
+        Con `breakpoints` se usa esa lista (cualquier número de Breakpoint
+        con nombre) en lugar de mobile/tablet/desktop; ejemplo::
+
+            .with_responsive_config(breakpoints=[
+                Breakpoint("compact", 0, collapse_sidebars=True),
+                Breakpoint("medium", 600, left_bar_width=200),
+                Breakpoint("wide", 1200),
+                Breakpoint("ultrawide", 1800, left_bar_width=320),
+            ])
+        """
+        self._params["breakpoints"] = breakpoints
         self._params["breakpoint_mobile"] = breakpoint_mobile
         self._params["breakpoint_tablet"] = breakpoint_tablet
         self._params["collapse_sidebars_on_mobile"] = collapse_sidebars_on_mobile
         self._params["collapse_sidebars_on_tablet"] = collapse_sidebars_on_tablet
         return self
 
+    def with_resizable_sidebars(
+        self,
+        enabled: bool = True,
+        fps: int = 30,
+        on_resize: Optional[Callable[[str, int], None]] = None,
+    ) -> "LayoutBuilder":
+        """
+        Permite redimensionar los sidebars arrastrando su borde. `fps` limita
+        los updates durante el arrastre; `on_resize(lado, ancho)` recibe el
+        ancho final (ej. para guardarlo en las preferencias del usuario).
+        """
+        self._params["resizable_sidebars"] = enabled
+        self._params["resize_fps"] = fps
+        self._params["on_sidebar_resize"] = on_resize
+        return self
+
+    def with_flat_tree(self, enabled: bool = True) -> "LayoutBuilder":
+        """Usa el árbol de controles plano (menos envoltorios, ver ResponsiveLayout)."""
+        self._params["flat_tree"] = enabled
+        return self
+
+    def with_sidebar_unmount(self, after_s: Optional[float] = 30) -> "LayoutBuilder":
+        """
+        Desmonta las barras creadas por factory que lleven `after_s` segundos
+        colapsadas (None = no desmontar nunca).
+        """
+        self._params["sidebar_unmount_after_s"] = after_s
+        return self
+
     def with_transitions(
         self,
         animate: bool = True,
@@ -351,4 +1207,11 @@ class LayoutBuilder:
             raise ValueError(
                 "El contenido principal es obligatorio. Usa .with_content(control) antes de .build()."
             )
-        return ResponsiveLayout(**self._params)
+        params = dict(self._params)
+        # Las factories de contenido y barras fijas se llaman aquí; las de
+        # las barras laterales las monta el layout al abrirlas
+        for name in ("content", "top_bar", "bottom_bar"):
+            factory = ResponsiveLayout._as_factory(params.get(name))
+            if factory is not None:
+                params[name] = factory()
+        return ResponsiveLayout(**params)
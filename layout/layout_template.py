@@ -0,0 +1,267 @@
+"""
+layout_template.py
+==================
+Plantillas de layout reutilizables entre sesiones (modo web).
+
+Una LayoutTemplate se compila una sola vez (desde un LayoutBuilder o desde
+un dict / JSON / TOML) y crea un ResponsiveLayout por sesión con
+instantiate(). Todas las sesiones comparten las partes inmutables (motor de
+breakpoints y presets); los controles de cada sesión se crean
+con factories y las barras laterales se montan solo al abrirse.
+
+Clases:
+    LayoutTemplate: Configuración compilada de un ResponsiveLayout.
+"""
+
+import importlib
+import inspect
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+import flet as ft
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from layout_helpers import validate_layout_params
+from layout_system import (
+    BarSource,
+    Breakpoint,
+    BreakpointEngine,
+    LayoutBuilder,
+    ResponsiveLayout,
+)
+
+# Parámetros de ResponsiveLayout que son controles (distintos en cada sesión)
+CONTROL_PARAMS = ("content", "top_bar", "bottom_bar", "left_bar", "right_bar")
+
+# Resto de parámetros: configuración compartible entre sesiones
+CONFIG_PARAMS = tuple(
+    name
+    for name in inspect.signature(ResponsiveLayout.__init__).parameters
+    if name not in ("self",) + CONTROL_PARAMS
+)
+
+Factory = Callable[[], ft.Control]
+
+
+def _resolve_factory(value: Union[str, Factory], name: str) -> Factory:
+    """Acepta una factory o una referencia "paquete.modulo:funcion"."""
+    if isinstance(value, str):
+        module_name, sep, attr = value.partition(":")
+        if not sep:
+            raise ValueError(
+                f"'{name}' debe ser una referencia 'modulo:funcion'. Valor recibido: {value!r}"
+            )
+        value = getattr(importlib.import_module(module_name), attr)
+    if isinstance(value, ft.Control) or not callable(value):
+        raise ValueError(
+            f"'{name}' debe ser una factory (callable sin argumentos), no un control: "
+            "los controles no pueden compartirse entre sesiones."
+        )
+    return value
+
+
+def _parse_curve(value: Any) -> ft.AnimationCurve:
+    if isinstance(value, ft.AnimationCurve):
+        return value
+    try:
+        return ft.AnimationCurve(value)
+    except ValueError:
+        return ft.AnimationCurve[str(value).upper()]
+
+
+class LayoutTemplate:
+    """
+    Configuración compilada de un ResponsiveLayout, reutilizable en todas las
+    sesiones.
+
+    Ejemplo::
+
+        template = LayoutTemplate.from_builder(
+            LayoutBuilder()
+            .with_top_bar(lambda: create_simple_navbar("Mi App"))
+            .with_left_bar(lambda: create_simple_sidebar(items))
+            .with_responsive_config(breakpoint_tablet=1100)
+        )
+        # o bien: LayoutTemplate.load("layout.toml")
+
+        def main(page: ft.Page):
+            layout = template.instantiate(content=mi_contenido)
+            page.add(layout)
+            setup_responsive_layout(layout, page)
+
+    Args:
+        config:    Parámetros de ResponsiveLayout que no son controles.
+        factories: Factories (o referencias "modulo:funcion") para content,
+                   top_bar, bottom_bar, left_bar y right_bar.
+
+    Raises:
+        ValueError: Si hay parámetros desconocidos, dimensiones fuera de rango
+                    o controles en lugar de factories.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        factories: Optional[Dict[str, Union[str, Factory]]] = None,
+    ):
+        config = dict(config or {})
+        factories = dict(factories or {})
+
+        unknown = set(config) - set(CONFIG_PARAMS)
+        unknown |= set(factories) - set(CONTROL_PARAMS)
+        if unknown:
+            raise ValueError(f"Parámetros de layout desconocidos: {sorted(unknown)}")
+
+        validate_layout_params(
+            left_bar_width=config.get("left_bar_width"),
+            right_bar_width=config.get("right_bar_width"),
+            top_bar_height=config.get("top_bar_height"),
+            bottom_bar_height=config.get("bottom_bar_height"),
+        )
+
+        if "transition_curve" in config:
+            config["transition_curve"] = _parse_curve(config["transition_curve"])
+
+        # Un único motor (y sus presets) para todas las sesiones
+        breakpoints = config.get("breakpoints")
+        if breakpoints is None:
+            defaults = inspect.signature(BreakpointEngine.default).parameters
+            engine = BreakpointEngine.default(
+                **{
+                    name: config.get(name, param.default)
+                    for name, param in defaults.items()
+                    if name != "cls"
+                }
+            )
+        elif isinstance(breakpoints, BreakpointEngine):
+            engine = breakpoints
+        else:
+            engine = BreakpointEngine(
+                [bp if isinstance(bp, Breakpoint) else Breakpoint(**bp) for bp in breakpoints]
+            )
+        config["breakpoints"] = engine
+
+        self._config = config
+        self._factories = {
+            name: _resolve_factory(value, name) for name, value in factories.items()
+        }
+
+    # --- Carga ---
+
+    @classmethod
+    def from_builder(cls, builder: LayoutBuilder) -> "LayoutTemplate":
+        """
+        Compila la configuración de un LayoutBuilder. Las barras y el
+        contenido, si se indican, deben ser factories.
+        """
+        params = dict(builder._params)
+        factories = {
+            name: params.pop(name) for name in CONTROL_PARAMS if params.get(name) is not None
+        }
+        for name in CONTROL_PARAMS:
+            params.pop(name, None)
+        return cls(params, factories)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LayoutTemplate":
+        """
+        Crea la plantilla desde un dict: parámetros de ResponsiveLayout y, en
+        la clave opcional "factories", referencias "modulo:funcion".
+        """
+        data = dict(data)
+        factories = data.pop("factories", None)
+        return cls(data, factories)
+
+    @classmethod
+    def from_json(cls, path: str) -> "LayoutTemplate":
+        """Carga la plantilla desde un fichero JSON."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_toml(cls, path: str) -> "LayoutTemplate":
+        """Carga la plantilla desde un fichero TOML (requiere Python 3.11+ o tomli)."""
+        if tomllib is None:
+            raise ImportError("Leer TOML requiere Python 3.11+ o el paquete 'tomli'.")
+        with open(path, "rb") as f:
+            return cls.from_dict(tomllib.load(f))
+
+    @classmethod
+    def load(cls, path: str) -> "LayoutTemplate":
+        """Carga la plantilla desde .json o .toml según la extensión."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            return cls.from_json(path)
+        if extension == ".toml":
+            return cls.from_toml(path)
+        raise ValueError(f"Formato de plantilla no soportado: '{extension}' (usa .json o .toml)")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Configuración serializable (JSON/TOML). Las factories se exportan como
+        "modulo:funcion" y solo si son funciones de nivel de módulo.
+        """
+        # Se omiten los None (TOML no los admite; equivalen al valor por defecto)
+        data = {name: value for name, value in self._config.items() if value is not None}
+        data["breakpoints"] = [
+            {field: value for field, value in bp._asdict().items() if value is not None}
+            for bp in data["breakpoints"].breakpoints
+        ]
+        if "transition_curve" in data:
+            data["transition_curve"] = data["transition_curve"].value
+        factories = {
+            name: f"{factory.__module__}:{factory.__qualname__}"
+            for name, factory in self._factories.items()
+            if "<" not in factory.__qualname__
+        }
+        if factories:
+            data["factories"] = factories
+        return data
+
+    # --- Instanciación ---
+
+    def instantiate(
+        self,
+        content: Optional[Union[ft.Control, Factory]] = None,
+        **bars: Optional[BarSource],
+    ) -> ResponsiveLayout:
+        """
+        Crea el ResponsiveLayout de una sesión.
+
+        Args:
+            content: Contenido principal (control o factory); si se omite se
+                     usa la factory de la plantilla.
+            **bars:  top_bar, bottom_bar, left_bar o right_bar para esta
+                     sesión (control, factory o None para no mostrarla).
+
+        Raises:
+            ValueError: Si no hay contenido o se pasa una barra desconocida.
+        """
+        unknown = set(bars) - set(CONTROL_PARAMS[1:])
+        if unknown:
+            raise ValueError(f"Barras desconocidas: {sorted(unknown)}")
+
+        controls: Dict[str, Any] = dict(self._factories)
+        if content is not None:
+            controls["content"] = content
+        controls.update(bars)
+        if controls.get("content") is None:
+            raise ValueError(
+                "El contenido principal es obligatorio: pásalo a instantiate() o define su factory."
+            )
+
+        # Las barras laterales se pasan como factory (montaje diferido); el
+        # resto se construye ahora
+        for name in ("content", "top_bar", "bottom_bar"):
+            value = controls.get(name)
+            if value is not None and not isinstance(value, ft.Control):
+                controls[name] = value()
+        return ResponsiveLayout(**controls, **self._config)
@@ -5,22 +5,69 @@ Sistema de enrutamiento y pantallas para Flet.
 
 Clases:
     Screen: Clase base para todas las pantallas de la aplicación.
+    LazyScreenRef: Referencia "modulo:Clase" a una pantalla importada en la primera visita.
+    RouteMatch: Resultado de resolver una ruta (pantalla, parámetros y query).
+    RouteTable: Tabla de rutas compilada (trie) con parámetros y comodines.
+    NavigationStats: Histogramas móviles de tiempos de navegación por ruta y fase.
+    HistoryEntry: Entrada del historial de navegación (ruta y estado guardado).
     ScreenRouter: Gestor de rutas que renderiza la pantalla activa y maneja transiciones.
 """
 
+import asyncio
+import importlib
+import json
+import logging
+import re
+import threading
+import time
+import uuid
 import flet as ft
-from typing import Callable, Dict, List, Optional, Type
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Límites del historial de navegación usado para el prefetch: rutas origen
+# recordadas (LRU) y destinos por ruta origen
+TRANSITION_HISTORY_MAX_ROUTES = 256
+TRANSITION_HISTORY_MAX_TARGETS = 16
 
 
 class Screen:
     """
     Clase base para construir pantallas.
+
+    Atributos de clase:
+        route:      Ruta a la que responde la pantalla.
+        keep_alive: True/False fuerza (o impide) que el router conserve la
+                    instancia construida al salir de ella. None usa la
+                    configuración por defecto del ScreenRouter.
     """
 
     route: str = "/"
+    keep_alive: Optional[bool] = None
 
     def __init__(self, page: ft.Page):
         self.page = page
+        # Rellenados por el router antes de build(): ruta concreta visitada,
+        # parámetros de la ruta (ej. {"id": 42}) y query string como dict.
+        self.path: str = self.route
+        self.params: Dict[str, Any] = {}
+        self.query: Dict[str, str] = {}
 
     def build(self) -> ft.Control:
         """
@@ -40,6 +87,62 @@ class Screen:
         """
         return None
 
+    async def load(self) -> None:
+        """
+        Carga asíncrona de datos (BD local, ficheros, red) previa a build().
+
+        Si una pantalla lo sobrescribe, el router lo ejecuta en el event loop
+        de Flet en paralelo a la animación de transición y muestra
+        build_placeholder() hasta que termina; después llama a build() y a
+        on_load(). Se cancela si el usuario navega a otra ruta antes. Si
+        lanza una excepción, se registra y se muestra build_error().
+        """
+        pass
+
+    def build_placeholder(self) -> ft.Control:
+        """
+        Retorna el control que se muestra mientras load() está en curso.
+        """
+        try:
+            from components.data_display import loading_indicator
+
+            indicator = loading_indicator()
+        except (ImportError, AttributeError):
+            # components es opcional: data_display requiere flet_datatable2
+            # y los colores del tema de la app
+            indicator = ft.ProgressRing()
+        return ft.Container(
+            content=indicator,
+            alignment=ft.Alignment.CENTER,
+            expand=True,
+        )
+
+    def build_error(self, error: Exception) -> ft.Control:
+        """
+        Retorna el control que se muestra si load() falla (en lugar de
+        build(), que no se llama; tampoco on_load()).
+        """
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Icon(ft.Icons.ERROR_OUTLINE, size=40),
+                    ft.Text("No se pudieron cargar los datos."),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                tight=True,
+            ),
+            alignment=ft.Alignment.CENTER,
+            expand=True,
+        )
+
+    def get_prefetch_routes(self) -> List[str]:
+        """
+        Retorna las rutas a las que probablemente se navegue desde esta pantalla.
+        Con el prefetch del router activo se preconstruyen en segundo plano,
+        por lo que el build() de esas pantallas no debe llamar a update().
+        """
+        return []
+
     def on_load(self) -> None:
         """
         Se llama cuando la pantalla se vuelve activa.
@@ -52,11 +155,407 @@ class Screen:
         """
         pass
 
+    def save_state(self) -> Any:
+        """
+        Retorna una instantánea serializable (JSON) del estado de la pantalla
+        (scroll, filtros, datos ya cargados...) para el historial del router.
+        None indica que no hay nada que guardar.
+        """
+        return None
+
+    def restore_state(self, state: Any) -> None:
+        """
+        Restaura una instantánea de save_state() al volver atrás/adelante.
+        Se llama tras instanciar la pantalla y antes de build() y load(), de
+        modo que la pantalla puede evitar repetir consultas costosas.
+        """
+        pass
+
+    def on_suspend(self) -> None:
+        """
+        Se llama cuando la pantalla deja de estar activa pero se conserva en
+        la caché keep-alive del router (no se destruye).
+        """
+        pass
+
+    def on_resume(self) -> None:
+        """
+        Se llama cuando una pantalla conservada en caché vuelve a estar activa.
+        Sustituye a on_load() en ese caso: build() no se vuelve a ejecutar.
+        """
+        pass
+
+
+def _uses_async_load(screen_class: Type[Screen]) -> bool:
+    """True si la clase sobrescribe Screen.load()."""
+    return screen_class.load is not Screen.load
+
+
+def _strict_converter(pattern: str, convert: Callable[[str], Any]) -> Callable[[str], Any]:
+    """
+    Conversor que solo acepta segmentos con la forma canónica de `pattern`.
+    int()/float()/UUID() admiten además "4_2", "+42", " 42", "nan" o
+    mayúsculas, que darían el mismo valor con otro path (y otra entrada en
+    la caché keep-alive y en el prefetch).
+    """
+    regex = re.compile(pattern)
+
+    def converter(segment: str) -> Any:
+        if regex.fullmatch(segment) is None:
+            raise ValueError(f"Segmento no válido: {segment!r}")
+        return convert(segment)
+
+    return converter
+
+
+# Conversores de tipo disponibles para parámetros de ruta (":id<int>"); lanzan
+# ValueError si el segmento no tiene la forma esperada
+ROUTE_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": _strict_converter(r"-?(?:0|[1-9][0-9]*)", int),
+    "float": _strict_converter(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?", float),
+    "uuid": _strict_converter(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", uuid.UUID
+    ),
+}
+
+_PARAM_SEGMENT = re.compile(r"^:(\w+)(?:<(\w+)>)?$")
+
+
+class LazyScreenRef:
+    """
+    Referencia perezosa a una clase Screen mediante su ruta de importación
+    ("paquete.modulo:Clase"). El módulo solo se importa al llamar a resolve(),
+    lo que evita cargar pantallas (y sus dependencias) al arrancar la app.
+    """
+
+    def __init__(self, import_path: str):
+        module_name, sep, class_name = import_path.partition(":")
+        if not sep or not module_name or not class_name:
+            raise ValueError(
+                f"Ruta de importación inválida '{import_path}'. Formato: 'modulo:Clase'."
+            )
+        self.import_path = import_path
+        self.module_name = module_name
+        self.class_name = class_name
+        self._screen_class: Optional[Type[Screen]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True si la clase ya fue importada."""
+        return self._screen_class is not None
+
+    def resolve(self) -> Type[Screen]:
+        """
+        Importa el módulo (solo la primera vez) y retorna la clase Screen.
+
+        Raises:
+            ImportError: Si el módulo no existe.
+            TypeError:   Si el atributo no es una subclase de Screen.
+        """
+        if self._screen_class is None:
+            module = importlib.import_module(self.module_name)
+            screen_class = getattr(module, self.class_name)
+            if not (isinstance(screen_class, type) and issubclass(screen_class, Screen)):
+                raise TypeError(f"'{self.import_path}' no es una subclase de Screen")
+            self._screen_class = screen_class
+        return self._screen_class
+
+    def __repr__(self) -> str:
+        return f"LazyScreenRef({self.import_path!r})"
+
+
+ScreenSource = Union[Type[Screen], LazyScreenRef]
+
+
+def resolve_screen_class(source: ScreenSource) -> Type[Screen]:
+    """Retorna la clase Screen de una clase o de una LazyScreenRef."""
+    if isinstance(source, LazyScreenRef):
+        return source.resolve()
+    return source
+
+
+class RouteMatch(NamedTuple):
+    """Resultado de resolver una ruta contra la RouteTable."""
+
+    screen_class: ScreenSource
+    path: str
+    params: Dict[str, Any]
+    query: Dict[str, str]
+    pattern: str = ""
+
+
+class _RouteNode:
+    """Nodo del trie de rutas (un segmento de path)."""
+
+    __slots__ = ("static", "params", "wildcard", "screen_class", "pattern")
+
+    def __init__(self):
+        self.static: Dict[str, "_RouteNode"] = {}
+        # (nombre, conversor, nodo hijo); los tipados se prueban antes que str
+        self.params: List[Tuple[str, Callable[[str], Any], "_RouteNode"]] = []
+        # (nombre, pantalla, patrón) del comodín final "*" / "*nombre"
+        self.wildcard: Optional[Tuple[str, ScreenSource, str]] = None
+        self.screen_class: Optional[ScreenSource] = None
+        self.pattern: str = ""
+
+
+class RouteTable:
+    """
+    Tabla de rutas compilada en un trie de segmentos.
+
+    Sintaxis de patrones:
+        /users              Segmento estático.
+        /users/:id          Parámetro (str).
+        /users/:id<int>     Parámetro con conversor (ver ROUTE_CONVERTERS).
+        /files/*path        Comodín final: captura el resto del path ("*" = "path").
+
+    Prioridad por segmento: estático > parámetro tipado > parámetro str > comodín.
+    Las rutas sin parámetros se resuelven con una única búsqueda en un dict;
+    el resto recorre el trie, con coste proporcional al número de segmentos
+    y no al número de rutas registradas.
+    """
+
+    def __init__(self, converters: Optional[Dict[str, Callable[[str], Any]]] = None):
+        self.converters: Dict[str, Callable[[str], Any]] = dict(ROUTE_CONVERTERS)
+        if converters:
+            self.converters.update(converters)
+        self._static_routes: Dict[str, Tuple[ScreenSource, str]] = {}
+        self._root = _RouteNode()
+
+    @staticmethod
+    def split_path(path: str) -> List[str]:
+        """Divide un path en segmentos ignorando barras iniciales/finales."""
+        stripped = path.strip("/")
+        return stripped.split("/") if stripped else []
+
+    def add(self, pattern: str, screen_class: ScreenSource) -> None:
+        """
+        Compila y añade un patrón de ruta (a una clase Screen o LazyScreenRef).
+
+        Raises:
+            ValueError: Si el patrón usa un conversor desconocido o un comodín
+                        que no es el último segmento.
+        """
+        segments = self.split_path(pattern)
+        if not any(seg[:1] in (":", "*") for seg in segments):
+            self._static_routes["/" + "/".join(segments)] = (screen_class, pattern)
+
+        node = self._root
+        for i, segment in enumerate(segments):
+            if segment.startswith("*"):
+                if i != len(segments) - 1:
+                    raise ValueError(
+                        f"El comodín debe ser el último segmento de la ruta: '{pattern}'"
+                    )
+                node.wildcard = (segment[1:] or "path", screen_class, pattern)
+                return
+
+            param = _PARAM_SEGMENT.match(segment)
+            if param is None:
+                node = node.static.setdefault(segment, _RouteNode())
+                continue
+
+            name, conv_name = param.group(1), param.group(2) or "str"
+            if conv_name not in self.converters:
+                raise ValueError(
+                    f"Conversor de ruta desconocido '{conv_name}' en '{pattern}'"
+                )
+            converter = self.converters[conv_name]
+            for p_name, p_conv, child in node.params:
+                if p_name == name and p_conv is converter:
+                    node = child
+                    break
+            else:
+                child = _RouteNode()
+                node.params.append((name, converter, child))
+                # Los parámetros str (aceptan cualquier valor) se prueban al final
+                node.params.sort(key=lambda p: p[1] is str)
+                node = child
+        node.screen_class = screen_class
+        node.pattern = pattern
+
+    def match(self, route: str) -> Optional[RouteMatch]:
+        """
+        Resuelve una ruta completa (con query string opcional).
+
+        Returns:
+            RouteMatch o None si ninguna ruta registrada coincide.
+        """
+        path, _, query_string = route.partition("?")
+        query = dict(parse_qsl(query_string, keep_blank_values=True))
+        segments = self.split_path(path)
+        path = "/" + "/".join(segments)
+
+        static = self._static_routes.get(path)
+        if static is not None:
+            return RouteMatch(static[0], path, {}, query, static[1])
+
+        params: Dict[str, Any] = {}
+        found = self._match_node(self._root, segments, 0, params)
+        if found is None:
+            return None
+        return RouteMatch(found[0], path, params, query, found[1])
+
+    def _match_node(
+        self,
+        node: _RouteNode,
+        segments: List[str],
+        index: int,
+        params: Dict[str, Any],
+    ) -> Optional[Tuple[ScreenSource, str]]:
+        if index == len(segments):
+            if node.screen_class is not None:
+                return node.screen_class, node.pattern
+            if node.wildcard is not None:
+                params[node.wildcard[0]] = ""
+                return node.wildcard[1], node.wildcard[2]
+            return None
+
+        segment = segments[index]
+
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match_node(child, segments, index + 1, params)
+            if found is not None:
+                return found
+
+        for name, converter, child in node.params:
+            try:
+                value = converter(segment)
+            except ValueError:
+                continue
+            params[name] = value
+            found = self._match_node(child, segments, index + 1, params)
+            if found is not None:
+                return found
+            del params[name]
+
+        if node.wildcard is not None:
+            params[node.wildcard[0]] = "/".join(segments[index:])
+            return node.wildcard[1], node.wildcard[2]
+        return None
+
+
+class NavigationStats:
+    """
+    Tiempos de navegación (ms) por patrón de ruta y fase, guardados en
+    ventanas móviles de las últimas `window` muestras.
+
+    Fases registradas por ScreenRouter:
+        match, construct, build, update, on_load, on_resume, load (Screen.load
+        asíncrono), callback (on_route_change_complete) y total (suma de las
+        fases síncronas de la navegación, sin contar la animación).
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Dict[str, deque]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, phase: str, duration_ms: float) -> None:
+        """Añade una muestra de duración para la ruta y fase indicadas."""
+        with self._lock:
+            phases = self._samples.setdefault(route, {})
+            samples = phases.get(phase)
+            if samples is None:
+                samples = phases[phase] = deque(maxlen=self.window)
+            samples.append(duration_ms)
+
+    def reset(self) -> None:
+        """Elimina todas las muestras."""
+        with self._lock:
+            self._samples.clear()
+
+    @staticmethod
+    def _percentile(sorted_samples: List[float], percentile: int) -> float:
+        # Percentil por rango más cercano
+        index = max(0, -(-percentile * len(sorted_samples) // 100) - 1)
+        return sorted_samples[index]
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Retorna {ruta: {fase: {count, p50, p95, p99, max}}} con tiempos en ms.
+        """
+        with self._lock:
+            snapshot = {
+                route: {phase: sorted(samples) for phase, samples in phases.items()}
+                for route, phases in self._samples.items()
+            }
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for route, phases in snapshot.items():
+            result[route] = {}
+            for phase, samples in phases.items():
+                stats: Dict[str, float] = {"count": len(samples)}
+                for percentile in self.PERCENTILES:
+                    stats[f"p{percentile}"] = round(
+                        self._percentile(samples, percentile), 3
+                    )
+                stats["max"] = round(samples[-1], 3)
+                result[route][phase] = stats
+        return result
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Exporta summary() como JSON."""
+        return json.dumps(self.summary(), indent=indent, sort_keys=True)
+
+
+class HistoryEntry(NamedTuple):
+    """Entrada del historial: ruta completa, estado guardado y su tamaño (bytes)."""
+
+    route: str
+    state: Any
+    size: int
+
 
 class ScreenRouter:
     """
     Enrutador para manejar el cambio de pantallas (Screen) dentro de un contenedor.
     Ideal para integrarse con ResponsiveLayout u otros layouts base.
+
+    Modo keep-alive:
+        Con keep_alive=True las pantallas ya construidas se guardan en una
+        caché LRU (máximo keep_alive_max_screens entradas) al navegar fuera
+        de ellas. Volver a una ruta cacheada solo intercambia
+        content_container.content y llama a on_resume(). Cada Screen puede
+        activar/desactivar el comportamiento con su atributo keep_alive.
+
+    Rutas perezosas:
+        register_lazy_route("/reports", "app.screens.reports:ReportsScreen")
+        registra la pantalla sin importarla; el módulo se importa en la primera
+        navegación. Con warm_up_lazy_routes=True (o llamando a warm_up()) los
+        módulos pendientes se importan en segundo plano tras pintar la primera
+        pantalla.
+
+    Prefetch:
+        Con prefetch=True, tras cada navegación se preconstruyen (instancia y
+        build()) en un pool de prefetch_max_workers hilos las rutas indicadas
+        por Screen.get_prefetch_routes() y las prefetch_history_hints más
+        visitadas desde la ruta actual. Se guardan como máximo
+        prefetch_max_screens pantallas preconstruidas; al navegar a una de
+        ellas ya construida solo se llama a on_load() (si aún se está
+        construyendo, la transición animada la espera sin bloquear el event
+        loop y la navegación sin animación la construye de nuevo). Las
+        preconstruidas hace más de prefetch_ttl_s segundos se descartan (sus
+        datos pueden estar obsoletos) y se vuelven a construir.
+
+    Métricas:
+        Con collect_stats=True se mide cada fase de la navegación (ver
+        NavigationStats); stats() retorna los percentiles por ruta y
+        export_stats_json() los exporta. Si se define on_slow_navigation, se
+        llama con (ruta, tiempos por fase) cuando el total supera
+        slow_navigation_ms.
+
+    Historial:
+        El router mantiene pilas atrás/adelante de como máximo
+        history_max_depth entradas con la instantánea Screen.save_state() de
+        cada pantalla abandonada. back()/forward() (y el evento view_pop)
+        reconstruyen la pantalla llamando a restore_state() antes de build().
+        Si las instantáneas superan history_max_bytes se descartan primero
+        las más antiguas (la ruta se conserva en el historial).
     """
 
     def __init__(
@@ -65,15 +564,86 @@ class ScreenRouter:
         on_route_change_complete: Optional[Callable[[Screen], None]] = None,
         animate_transitions: bool = True,
         transition_duration_ms: int = 300,
+        keep_alive: bool = False,
+        keep_alive_max_screens: int = 5,
+        warm_up_lazy_routes: bool = False,
+        prefetch: bool = False,
+        prefetch_max_workers: int = 2,
+        prefetch_max_screens: int = 3,
+        prefetch_history_hints: int = 2,
+        prefetch_ttl_s: float = 30.0,
+        collect_stats: bool = True,
+        stats_window: int = 200,
+        on_slow_navigation: Optional[Callable[[str, Dict[str, float]], None]] = None,
+        slow_navigation_ms: float = 500.0,
+        history_max_depth: int = 50,
+        history_max_bytes: int = 1_000_000,
     ):
         self.page = page
-        self.routes: Dict[str, Type[Screen]] = {}
+        self.routes: Dict[str, ScreenSource] = {}
+        self.route_table = RouteTable()
         self.current_screen: Optional[Screen] = None
         self.on_route_change_complete = on_route_change_complete
 
         self.animate_transitions = animate_transitions
         self.transition_duration_ms = transition_duration_ms
 
+        # Caché LRU de pantallas construidas: ruta -> (instancia, contenido)
+        self.keep_alive = keep_alive
+        self.keep_alive_max_screens = keep_alive_max_screens
+        self._screen_cache: "OrderedDict[str, Tuple[Screen, ft.Control]]" = (
+            OrderedDict()
+        )
+
+        # Transiciones: una única tarea asyncio activa y el último destino pedido
+        self._transition_lock = threading.Lock()
+        self._transition_task: Optional[Future] = None
+        # Identifica la tarea activa (la que debe marcar el fin de la transición)
+        self._transition_token: Optional[object] = None
+        self._pending_match: Optional[RouteMatch] = None
+
+        # Precarga en segundo plano de rutas perezosas tras la primera pantalla
+        self.warm_up_lazy_routes = warm_up_lazy_routes
+        self._first_paint_done = False
+
+        # Prefetch: pantallas preconstruidas por ruta -> (match, Future)
+        self.prefetch_enabled = prefetch
+        self.prefetch_max_workers = prefetch_max_workers
+        self.prefetch_max_screens = prefetch_max_screens
+        self.prefetch_history_hints = prefetch_history_hints
+        self.prefetch_ttl_s = prefetch_ttl_s
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        # Ruta -> (match, Future, instante de creación según time.monotonic())
+        self._prefetched: "OrderedDict[str, Tuple[RouteMatch, Future, float]]" = (
+            OrderedDict()
+        )
+        # Frecuencia de navegación: ruta origen -> contador de rutas destino
+        # (LRU acotada, ver TRANSITION_HISTORY_MAX_*)
+        self._transition_counts: "OrderedDict[str, Counter]" = OrderedDict()
+
+        # Carga asíncrona (Screen.load): pantalla en carga, su tarea y la
+        # pantalla que muestra el placeholder a la espera de montar su build()
+        self._loading_screen: Optional[Screen] = None
+        self._load_future: Optional[Future] = None
+        self._awaiting_mount: Optional[Screen] = None
+
+        # Métricas de navegación
+        self.collect_stats = collect_stats
+        self.navigation_stats = NavigationStats(window=stats_window)
+        self.on_slow_navigation = on_slow_navigation
+        self.slow_navigation_ms = slow_navigation_ms
+        self._last_match_ms = 0.0
+
+        # Historial de navegación con instantáneas de estado
+        self.history_max_depth = history_max_depth
+        self.history_max_bytes = history_max_bytes
+        self._back_stack: List[HistoryEntry] = []
+        self._forward_stack: List[HistoryEntry] = []
+        self._current_route: Optional[str] = None
+        # Petición back/forward en curso y la asociada al destino pendiente
+        self._history_request: Optional[Tuple[str, HistoryEntry]] = None
+        self._pending_history: Optional[Tuple[str, HistoryEntry]] = None
+
         # Contenedor padre donde se renderizará el contenido de las pantallas
         self.content_container = ft.Container(expand=True)
 
@@ -90,84 +660,777 @@ class ScreenRouter:
     def register_routes(self, screens: List[Type[Screen]]) -> None:
         """
         Registra una lista de clases que hereden de Screen.
+        Su atributo route puede contener parámetros (ver RouteTable).
         """
         for screen_class in screens:
-            self.routes[screen_class.route] = screen_class
+            self.register_route(screen_class)
 
     def register_route(self, screen_class: Type[Screen]) -> None:
         """
         Registra una única clase Screen.
         """
+        self.route_table.add(screen_class.route, screen_class)
         self.routes[screen_class.route] = screen_class
 
-    def go(self, route: str) -> None:
+    def register_lazy_route(self, route: str, import_path: str) -> None:
+        """
+        Registra una ruta cuya pantalla se importa en la primera navegación.
+
+        Args:
+            route:       Patrón de ruta (admite parámetros, ver RouteTable).
+            import_path: Clase Screen en formato "paquete.modulo:Clase".
+        """
+        ref = LazyScreenRef(import_path)
+        self.route_table.add(route, ref)
+        self.routes[route] = ref
+
+    def register_lazy_routes(self, routes: Dict[str, str]) -> None:
+        """
+        Registra varias rutas perezosas a partir de un dict ruta -> "modulo:Clase".
+        """
+        for route, import_path in routes.items():
+            self.register_lazy_route(route, import_path)
+
+    def warm_up(self, routes: Optional[List[str]] = None) -> Optional[Future]:
+        """
+        Importa en segundo plano los módulos de las rutas perezosas aún no cargadas.
+
+        Cada importación se ejecuta con asyncio.to_thread desde una única tarea
+        en el event loop de Flet, una detrás de otra.
+
+        Args:
+            routes: Patrones de ruta a precargar (por defecto, todas las perezosas).
+
+        Returns:
+            El Future de la tarea, o None si no había nada que importar.
+        """
+        refs = [
+            source
+            for route, source in self.routes.items()
+            if isinstance(source, LazyScreenRef)
+            and not source.is_loaded
+            and (routes is None or route in routes)
+        ]
+        if not refs:
+            return None
+
+        async def import_refs():
+            for ref in refs:
+                try:
+                    await asyncio.to_thread(ref.resolve)
+                except Exception:
+                    # Se reintentará (y fallará de forma visible) al navegar a la ruta
+                    pass
+
+        return self.page.run_task(import_refs)
+
+    def go(self, route: str) -> Future:
+        """
+        Navega a una nueva ruta (Page.push_route en el event loop de Flet).
+        Retorna el Future de la navegación.
+        """
+        return self.page.run_task(self.page.push_route, route)
+
+    @property
+    def can_go_back(self) -> bool:
+        """True si hay entradas en el historial hacia atrás."""
+        return bool(self._back_stack)
+
+    @property
+    def can_go_forward(self) -> bool:
+        """True si hay entradas en el historial hacia adelante."""
+        return bool(self._forward_stack)
+
+    def back(self) -> bool:
+        """
+        Vuelve a la ruta anterior restaurando su estado guardado.
+        Retorna False si no hay historial.
+        """
+        if not self._back_stack:
+            return False
+        self.page.run_task(self._navigate_history, "back", self._back_stack)
+        return True
+
+    def forward(self) -> bool:
+        """
+        Avanza a la ruta siguiente del historial restaurando su estado.
+        Retorna False si no hay historial hacia adelante.
+        """
+        if not self._forward_stack:
+            return False
+        self.page.run_task(self._navigate_history, "forward", self._forward_stack)
+        return True
+
+    async def _navigate_history(self, kind: str, stack: List[HistoryEntry]) -> None:
+        """
+        Navega a la última entrada de `stack` como navegación back/forward.
+
+        La entrada solo sale de la pila cuando empieza la navegación (vuelve a
+        ella si falla) y la petición se descarta al terminar, pase lo que pase.
+        """
+        if not stack:
+            return  # Otra navegación ya consumió la entrada
+        entry = stack.pop()
+        self._history_request = (kind, entry)
+        try:
+            await self.page.push_route(entry.route)
+        except Exception:
+            stack.append(entry)
+            raise
+        finally:
+            self._history_request = None
+
+    def clear_history(self) -> None:
+        """Vacía las pilas de historial atrás/adelante."""
+        self._back_stack.clear()
+        self._forward_stack.clear()
+
+    def _snapshot_current(self) -> Optional[HistoryEntry]:
+        """Crea la entrada de historial de la pantalla activa."""
+        if self.current_screen is None or self._current_route is None:
+            return None
+        state = self.current_screen.save_state()
+        size = 0 if state is None else len(json.dumps(state, default=str))
+        return HistoryEntry(self._current_route, state, size)
+
+    def _record_history(
+        self, target_route: str, history: Optional[Tuple[str, HistoryEntry]]
+    ) -> None:
+        """
+        Guarda la pantalla saliente en la pila correspondiente al tipo de
+        navegación (normal, atrás o adelante) y aplica los límites.
+        """
+        if self._current_route == target_route:
+            return
+        entry = self._snapshot_current()
+        if entry is None:
+            return
+
+        kind = history[0] if history else "push"
+        if kind == "back":
+            self._forward_stack.append(entry)
+        else:
+            self._back_stack.append(entry)
+            if kind == "push":
+                self._forward_stack.clear()
+        self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Aplica history_max_depth y history_max_bytes (lo más antiguo primero)."""
+        while len(self._back_stack) + len(self._forward_stack) > self.history_max_depth:
+            if self._back_stack:
+                self._back_stack.pop(0)
+            else:
+                self._forward_stack.pop(0)
+
+        total = sum(e.size for e in self._back_stack) + sum(
+            e.size for e in self._forward_stack
+        )
+        for stack in (self._back_stack, self._forward_stack):
+            for i, entry in enumerate(stack):
+                if total <= self.history_max_bytes:
+                    return
+                if entry.state is not None:
+                    total -= entry.size
+                    stack[i] = HistoryEntry(entry.route, None, 0)
+
+    @staticmethod
+    def _route_string(match: RouteMatch) -> str:
+        """Ruta completa (path y query) de un RouteMatch."""
+        if not match.query:
+            return match.path
+        return f"{match.path}?{urlencode(match.query)}"
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Retorna los percentiles (p50/p95/p99) de tiempo por ruta y fase, en ms.
+        """
+        return self.navigation_stats.summary()
+
+    def export_stats_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """
+        Exporta las métricas como JSON y, si se indica path, las escribe en disco.
+        """
+        data = self.navigation_stats.to_json(indent=indent)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def clear_screen_cache(self) -> None:
+        """
+        Vacía la caché keep-alive llamando a on_unload() en cada pantalla cacheada.
+        """
+        while self._screen_cache:
+            _, (screen, _) = self._screen_cache.popitem(last=False)
+            screen.on_unload()
+
+    def prefetch(self, routes: List[str]) -> None:
+        """
+        Preconstruye en segundo plano las pantallas de las rutas indicadas.
+
+        Las rutas activas, cacheadas (keep-alive) o ya en prefetch se ignoran.
+        Si se supera prefetch_max_screens se descartan las más antiguas.
+        """
+        for route in routes:
+            match = self.route_table.match(route)
+            if match is not None:
+                self._prefetch_match(match)
+
+    def clear_prefetched(self) -> None:
+        """Descarta todas las pantallas preconstruidas (o en construcción)."""
+        while self._prefetched:
+            _, (_, future, _) = self._prefetched.popitem(last=False)
+            future.cancel()
+
+    def _prefetch_match(self, match: RouteMatch) -> None:
+        """Envía al pool la construcción de la pantalla de una ruta resuelta."""
+        if self.prefetch_max_screens <= 0:
+            return
+        entry = self._prefetched.get(match.path)
+        if entry is not None:
+            if not self._prefetch_expired(entry):
+                return
+            del self._prefetched[match.path]
+            entry[1].cancel()
+        if match.path in self._screen_cache:
+            return
+        if self.current_screen is not None and self.current_screen.path == match.path:
+            return
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=self.prefetch_max_workers,
+                thread_name_prefix="screen-prefetch",
+            )
+        future = self._prefetch_pool.submit(self._build_screen, match)
+        self._prefetched[match.path] = (match, future, time.monotonic())
+
+        while len(self._prefetched) > self.prefetch_max_screens:
+            _, (_, old_future, _) = self._prefetched.popitem(last=False)
+            old_future.cancel()
+
+    def _prefetch_expired(self, entry: Tuple[RouteMatch, Future, float]) -> bool:
+        """Indica si una pantalla preconstruida supera prefetch_ttl_s."""
+        return time.monotonic() - entry[2] > self.prefetch_ttl_s
+
+    def _take_prefetched(
+        self, match: RouteMatch, discard: bool = False
+    ) -> Optional[Tuple[Screen, ft.Control]]:
+        """
+        Retorna la pantalla preconstruida para la ruta o None si no hay, aún
+        se está construyendo, su query no coincide, ha caducado
+        (prefetch_ttl_s) o discard=True. Nunca espera al pool: se llama desde
+        el event loop de Flet (ver _await_prefetch()).
+        """
+        entry = self._prefetched.pop(match.path, None)
+        if entry is None:
+            return None
+        prefetched_match, future, _ = entry
+        if (
+            discard
+            or not future.done()
+            or prefetched_match.query != match.query
+            or self._prefetch_expired(entry)
+        ):
+            # Si ya se está construyendo, el hilo termina pero se descarta
+            future.cancel()
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # Se reconstruye en el hilo principal para que el error sea visible
+            return None
+
+    def _schedule_prefetch(self) -> None:
+        """Prefetch tras una navegación: pistas de la pantalla y del historial."""
+        screen = self.current_screen
+        if not self.prefetch_enabled or screen is None:
+            return
+
+        routes = list(screen.get_prefetch_routes())
+        counts = self._transition_counts.get(screen.path)
+        if counts and self.prefetch_history_hints > 0:
+            routes.extend(
+                path for path, _ in counts.most_common(self.prefetch_history_hints)
+            )
+        self.prefetch(routes)
+
+    def _count_transition(self, source: str, target: str) -> None:
+        """
+        Cuenta una navegación source -> target para las pistas de prefetch,
+        con memoria acotada aunque las rutas lleven parámetros (/users/:id).
+        """
+        counts = self._transition_counts.get(source)
+        if counts is None:
+            counts = self._transition_counts[source] = Counter()
+            if len(self._transition_counts) > TRANSITION_HISTORY_MAX_ROUTES:
+                self._transition_counts.popitem(last=False)
+        else:
+            self._transition_counts.move_to_end(source)
+        counts[target] += 1
+        if len(counts) > TRANSITION_HISTORY_MAX_TARGETS:
+            # Se olvida el destino menos frecuente (sin contar el recién añadido)
+            rarest = min((path for path in counts if path != target), key=counts.__getitem__)
+            del counts[rarest]
+
+    def _build_screen(
+        self,
+        match: RouteMatch,
+        timings: Optional[Dict[str, float]] = None,
+        state: Any = None,
+    ) -> Tuple[Screen, Optional[ft.Control]]:
+        """
+        Instancia la pantalla de una ruta resuelta y construye su contenido.
+        Si la pantalla define load() el contenido es None: build() se llama
+        cuando termina la carga. Si se indica state, se restaura antes.
+        """
+        with self._measure(timings, "construct"):
+            screen_class = resolve_screen_class(match.screen_class)
+            screen = screen_class(self.page)
+        screen.route = match.pattern or screen.route
+        screen.path = match.path
+        screen.params = match.params
+        screen.query = match.query
+        if state is not None:
+            screen.restore_state(state)
+        if _uses_async_load(screen_class):
+            return screen, None
+        with self._measure(timings, "build"):
+            content = screen.build()
+        return screen, content
+
+    @contextmanager
+    def _measure(self, timings: Optional[Dict[str, float]], phase: str) -> Iterator[None]:
+        """Mide la duración (ms) del bloque y la guarda en timings[phase]."""
+        if timings is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[phase] = (time.perf_counter() - start) * 1000.0
+
+    def _record_navigation(self, route: str, timings: Dict[str, float]) -> None:
+        """Registra los tiempos de una navegación y avisa si ha sido lenta."""
+        timings["total"] = sum(timings.values())
+        for phase, duration_ms in timings.items():
+            self.navigation_stats.record(route, phase, duration_ms)
+        if self.on_slow_navigation and timings["total"] >= self.slow_navigation_ms:
+            self.on_slow_navigation(route, timings)
+
+    def _start_load(self, screen: Screen) -> None:
+        """Lanza screen.load() como tarea en el event loop de Flet."""
+        self._cancel_load()
+        self._loading_screen = screen
+        self._load_future = self.page.run_task(self._run_load, screen)
+
+    def _start_early_load(self, match: RouteMatch) -> None:
+        """
+        Instancia la pantalla destino y lanza su load() al iniciar la
+        navegación, para que la carga coincida con el fade out.
+
+        Las pantallas conservadas en la caché keep-alive solo se reanudan:
+        no se construye otra instancia ni se repite su load().
+        """
+        if match.path in self._screen_cache:
+            # Una carga adelantada para esta ruta quedaría huérfana
+            self._cancel_load()
+            return
+        if self._loading_screen is not None and self._loading_screen.path == match.path:
+            return
+        source = match.screen_class
+        if isinstance(source, LazyScreenRef) and not source.is_loaded:
+            return  # Se importará (y cargará) al renderizar
+        if not _uses_async_load(resolve_screen_class(source)):
+            return
+        screen, _ = self._build_screen(match)
+        self._start_load(screen)
+
+    def _take_loading(self, match: RouteMatch) -> Optional[Tuple[Screen, None]]:
+        """Retorna la pantalla cuya carga se adelantó para esta ruta, si existe."""
+        screen = self._loading_screen
+        if screen is None or screen.path != match.path or screen.query != match.query:
+            return None
+        return screen, None
+
+    def _cancel_load(self) -> None:
+        """Cancela la carga asíncrona en curso, si existe."""
+        if self._load_future is not None and not self._load_future.done():
+            self._load_future.cancel()
+        self._loading_screen = None
+        self._load_future = None
+
+    async def _run_load(self, screen: Screen) -> Optional[Exception]:
+        """
+        Ejecuta screen.load() y monta su contenido real al terminar (o
+        build_error() si falla). Retorna el error de load(), si lo hubo.
+        """
+        start = time.perf_counter()
+        error = None
+        try:
+            await screen.load()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Nadie lee el Future de run_task(): el error se registra aquí
+            logger.exception("Error en load() de la pantalla %s", screen.path)
+            error = exc
+        self._record_load(screen, start)
+        self._mount_loaded_screen(screen, error)
+        return error
+
+    def _record_load(self, screen: Screen, start: float) -> None:
+        """Registra la duración de Screen.load() iniciado en `start`."""
+        if self.collect_stats:
+            self.navigation_stats.record(
+                screen.route, "load", (time.perf_counter() - start) * 1000.0
+            )
+
+    def _mount_loaded_screen(self, screen: Screen, error: Optional[Exception] = None) -> None:
+        """
+        Sustituye el placeholder por build() (o por build_error() si load()
+        falló) si la pantalla sigue esperándolo.
+        """
+        with self._transition_lock:
+            if self._awaiting_mount is not screen:
+                return
+            self._awaiting_mount = None
+
+        if self._loading_screen is screen:
+            self._loading_screen = None
+            self._load_future = None
+
+        timings = {} if self.collect_stats else None
+        self._mount_loaded_content(screen, error, timings)
+        with self._measure(timings, "update"):
+            self.content_container.update()
+        if timings is not None:
+            for phase, duration_ms in timings.items():
+                self.navigation_stats.record(screen.route, phase, duration_ms)
+
+    def _show_loading_screen(
+        self, screen: Screen, timings: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Monta una pantalla con load(): su build() si la carga ya terminó o
+        su placeholder hasta que termine.
         """
-        Navega a una nueva ruta.
+        if self._loading_screen is not screen:
+            self._start_load(screen)
+
+        with self._transition_lock:
+            ready = self._load_future.done()
+            self._awaiting_mount = None if ready else screen
+
+        if ready:
+            future = self._load_future
+            self._loading_screen = None
+            self._load_future = None
+            # Carga adelantada que ya terminó (con o sin error)
+            error = None if future.cancelled() else future.result()
+            self._mount_loaded_content(screen, error, timings)
+        else:
+            self.content_container.content = screen.build_placeholder()
+
+    def _mount_loaded_content(
+        self,
+        screen: Screen,
+        error: Optional[Exception],
+        timings: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Monta build() y llama a on_load(), o monta build_error()."""
+        if error is not None:
+            self.content_container.content = screen.build_error(error)
+            return
+        with self._measure(timings, "build"):
+            self.content_container.content = screen.build()
+        with self._measure(timings, "on_load"):
+            screen.on_load()
+
+    def _is_keep_alive(self, screen: Screen) -> bool:
+        """Indica si la pantalla debe conservarse en caché al salir de ella."""
+        if self.keep_alive_max_screens <= 0:
+            return False
+        if screen.keep_alive is not None:
+            return screen.keep_alive
+        return self.keep_alive
+
+    def _will_cache(self, screen: Screen) -> bool:
+        """Indica si _release_current_screen() conservará la pantalla en caché."""
+        return screen is not self._awaiting_mount and self._is_keep_alive(screen)
+
+    def _release_current_screen(self) -> None:
+        """
+        Suspende la pantalla activa (guardándola en la caché) o la desmonta.
         """
-        self.page.go(route)
+        screen = self.current_screen
+        if screen is None:
+            return
+
+        if screen is self._awaiting_mount:
+            # Aún mostraba el placeholder: se cancela la carga y no se cachea
+            with self._transition_lock:
+                self._awaiting_mount = None
+            if self._loading_screen is screen:
+                self._cancel_load()
+            screen.on_unload()
+            return
+
+        if not self._is_keep_alive(screen):
+            screen.on_unload()
+            return
+
+        screen.on_suspend()
+        self._screen_cache[screen.path] = (screen, self.content_container.content)
+        self._screen_cache.move_to_end(screen.path)
+
+        # Expulsar las entradas menos usadas recientemente
+        while len(self._screen_cache) > self.keep_alive_max_screens:
+            _, (evicted, _) = self._screen_cache.popitem(last=False)
+            evicted.on_unload()
 
     def _handle_route_change(self, e: ft.RouteChangeEvent) -> None:
         """
         Intercepta el cambio de ruta de la página y cambia el contenido del contenedor principal.
         """
-        route = e.route
+        # Resolver ruta, parámetros y query string (ej. /users/42?tab=info)
+        start = time.perf_counter()
+        match = self.route_table.match(e.route)
+        self._last_match_ms = (time.perf_counter() - start) * 1000.0
 
-        # Limpiar parámetros extra en la ruta web (ej. /home?param=1)
-        base_route = route.split("?")[0] if "?" in route else route
-
-        screen_class = self.routes.get(base_route)
-        if not screen_class:
+        # Navegación iniciada por back()/forward() (None si es una navegación normal)
+        history, self._history_request = self._history_request, None
+        if match is None:
             return  # Ruta no encontrada
 
-        self._transition_to_screen(screen_class)
+        self._transition_to_screen(match, history)
 
-    def _transition_to_screen(self, screen_class: Type[Screen]) -> None:
+    def _transition_to_screen(
+        self, match: RouteMatch, history: Optional[Tuple[str, HistoryEntry]] = None
+    ) -> None:
         """
         Realiza la transición visual y lógica a la nueva pantalla.
+
+        Las transiciones animadas se programan como una tarea asyncio en el
+        event loop de Flet. Si llega una navegación mientras otra está en
+        curso, solo se actualiza el destino pendiente: la tarea activa
+        renderiza únicamente la última ruta solicitada.
+        """
+        # Cancelar cargas asíncronas de destinos que ya no se van a mostrar
+        if self._loading_screen is not None and self._loading_screen.path != match.path:
+            self._cancel_load()
+
+        with self._transition_lock:
+            self._pending_match = match
+            self._pending_history = history
+
+            if not (
+                self.animate_transitions and self.content_container.content is not None
+            ):
+                # Sin animación / primera carga
+                self._cancel_transition()
+                animated = False
+            elif self._transition_task is not None:
+                # Ya hay un fade en curso: la navegación se fusiona con él
+                animated = True
+            else:
+                animated = True
+                # Fade out
+                self.content_container.opacity = 0.0
+                self.content_container.update()
+
+                # Adelantar el build() de la nueva pantalla mientras dura el fade
+                if self.prefetch_enabled:
+                    self._prefetch_match(match)
+
+                # Esperar a que termine la animación antes de renderizar la nueva
+                self._transition_token = token = object()
+                self._transition_task = self.page.run_task(self._run_transition, token)
+
+        if animated and not (history and history[1].state is not None):
+            # Adelantar también la carga asíncrona (Screen.load) al fade
+            # (no si hay que restaurar estado: restore_state va antes de load)
+            self._start_early_load(match)
+        else:
+            self._render_pending_screen()
+
+    async def _run_transition(self, token: object) -> None:
+        """
+        Tarea asyncio de una transición animada: espera al fade out y
+        renderiza el destino pendiente más reciente.
+
+        Si el render de una pantalla falla (build(), on_load(), placeholder...)
+        el error se registra y se continúa con el siguiente destino pendiente;
+        al terminar la transición siempre queda cerrada y el contenido visible.
+        """
+        await asyncio.sleep(self.transition_duration_ms / 1000.0)
+        await self._await_prefetch()
+        failed = False
+        try:
+            while True:
+                try:
+                    if not self._render_pending_screen():
+                        break
+                except Exception:
+                    failed = True
+                    logger.exception("Error al renderizar la pantalla destino")
+        finally:
+            self._end_transition(token, failed)
+
+    async def _await_prefetch(self) -> None:
+        """
+        Espera (sin bloquear el event loop) a que termine el prefetch del
+        destino pendiente, lanzado al empezar el fade out.
+        """
+        match = self._pending_match
+        entry = self._prefetched.get(match.path) if match is not None else None
+        if entry is not None and not entry[1].done():
+            # wait() no propaga el error ni la cancelación del prefetch
+            await asyncio.wait([asyncio.wrap_future(entry[1])])
+
+    def _end_transition(self, token: object, failed: bool) -> None:
+        """
+        Cierra la transición `token` si sigue activa (salida anómala) y, si
+        algún render falló, vuelve a mostrar el contenido que quedó montado.
+        """
+        with self._transition_lock:
+            if self._transition_token is token:
+                self._transition_task = None
+                self._transition_token = None
+            # Si ya hay otra transición en curso, su fade out es intencionado
+            restore = failed and self._transition_token is None
+        if restore and self.animate_transitions:
+            self.content_container.opacity = 1.0
+            self.content_container.update()
+
+    def _cancel_transition(self) -> None:
+        """
+        Cancela la transición animada en curso, si existe.
+        Debe llamarse con _transition_lock adquirido.
+        """
+        if self._transition_task is not None:
+            self._transition_task.cancel()
+            self._transition_task = None
+            self._transition_token = None
+
+    def _render_pending_screen(self) -> bool:
+        """
+        Renderiza la pantalla pendiente. Retorna False si no había ninguna
+        (y marca la transición como terminada).
         """
+        with self._transition_lock:
+            match, history = self._pending_match, self._pending_history
+            self._pending_match = self._pending_history = None
+            if match is None:
+                self._transition_task = None
+                self._transition_token = None
+                return False
 
-        def render_new_screen():
-            # Desmontar pantalla anterior
-            if self.current_screen:
-                self.current_screen.on_unload()
+        self._render_screen(match, history)
+        return True
+
+    def _render_screen(
+        self, match: RouteMatch, history: Optional[Tuple[str, HistoryEntry]] = None
+    ) -> None:
+        """
+        Desmonta la pantalla activa y monta (o reanuda) la indicada.
+
+        La pantalla destino se obtiene (caché keep-alive, prefetch o build())
+        antes de tocar el historial y la pantalla activa: si su build() falla,
+        la excepción se propaga y la pantalla activa sigue intacta.
+        """
+        timings = {"match": self._last_match_ms} if self.collect_stats else None
+        target_route = self._route_string(match)
+        restore_state = history[1].state if history else None
+        current = self.current_screen
 
-            # Inicializar y montar nueva pantalla
-            self.current_screen = screen_class(self.page)
-            new_content = self.current_screen.build()
+        # Sacar de la caché la pantalla destino antes de expulsar entradas
+        cached = self._screen_cache.pop(match.path, None)
+        built = None
+        # Navegación a la misma ruta activa que se va a cachear: se reanuda
+        # sin reconstruir (tras suspenderla)
+        resume_current = (
+            cached is None
+            and current is not None
+            and current.path == match.path
+            and self._will_cache(current)
+        )
+        if cached is None and not resume_current:
+            # Inicializar la nueva pantalla (preconstruida o importándola si
+            # es perezosa)
+            if restore_state is not None:
+                # Las versiones preconstruidas no tienen el estado restaurado
+                self._take_prefetched(match, discard=True)
+                built = self._build_screen(match, timings, restore_state)
+            else:
+                built = (
+                    self._take_loading(match)
+                    or self._take_prefetched(match)
+                    or self._build_screen(match, timings)
+                )
 
+        # La pantalla destino ya existe: se confirma la navegación
+        self._record_history(target_route, history)
+        if current is not None:
+            self._count_transition(current.path, match.path)
+
+        # Desmontar (o suspender en caché) la pantalla anterior
+        self._release_current_screen()
+        if resume_current:
+            cached = self._screen_cache.pop(match.path)
+
+        if cached is not None:
+            # Pantalla conservada: solo se intercambia el contenido
+            self.current_screen, new_content = cached
+            self._current_route = target_route
+            self.current_screen.query = match.query
             self.content_container.content = new_content
-            self.current_screen.on_load()
+            with self._measure(timings, "on_resume"):
+                self.current_screen.on_resume()
+        else:
+            self.current_screen, new_content = built
+            self._current_route = target_route
+
+            if new_content is None:
+                # Pantalla con load(): placeholder hasta que lleguen los datos
+                self._show_loading_screen(self.current_screen, timings)
+            else:
+                self.content_container.content = new_content
+                with self._measure(timings, "on_load"):
+                    self.current_screen.on_load()
 
-            if self.animate_transitions:
-                self.content_container.opacity = 1.0
+        if self.animate_transitions:
+            self.content_container.opacity = 1.0
 
+        with self._measure(timings, "update"):
             self.content_container.update()
 
-            # Avisar que la pantalla cambió (útil para inyectar botones en el top bar)
-            if self.on_route_change_complete:
+        # Avisar que la pantalla cambió (útil para inyectar botones en el top bar)
+        if self.on_route_change_complete:
+            with self._measure(timings, "callback"):
                 self.on_route_change_complete(self.current_screen)
 
-        if self.animate_transitions and self.content_container.content is not None:
-            # Fade out
-            self.content_container.opacity = 0.0
-            self.content_container.update()
+        if timings is not None:
+            self._record_navigation(self.current_screen.route, timings)
 
-            # Esperar a que termine la animación antes de renderizar la nueva
-            import threading
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            if self.warm_up_lazy_routes:
+                self.warm_up()
 
-            threading.Timer(
-                self.transition_duration_ms / 1000.0, render_new_screen
-            ).start()
-        else:
-            # Sin animación / primera carga
-            render_new_screen()
+        self._schedule_prefetch()
 
     def _handle_view_pop(self, e: ft.ViewPopEvent) -> None:
         """
         Maneja el evento de ir atrás en el historial.
-        Para un sistema de una sola vista dinámica, sacamos la vista superior si la hay.
+        Usa el historial del router si lo hay; si no, para un sistema de una
+        sola vista dinámica, sacamos la vista superior si la hay.
         """
+        if self.back():
+            return
         if len(self.page.views) > 1:
             self.page.views.pop()
             top_view = self.page.views[-1]
-            self.page.go(top_view.route)
+            self.page.run_task(self.page.push_route, top_view.route)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Los módulos del repo se importan por nombre plano, como en los benchmarks
+# (benchmarks/harness.py añade la raíz, layout/ y screen_system/ a sys.path)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import harness  # noqa: E402,F401
@@ -0,0 +1,141 @@
+import csv
+
+import pytest
+
+from translations import TranslationManager, TranslationView
+from translations.catalog_cache import SharedCatalog
+from translations.formatting import compile_template
+from translations.plurals import plural_category
+
+INBOX = "{count, plural, =0 {No messages} one {# message} other {# messages}}"
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["key", "en", "es"])
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    return write_csv(
+        tmp_path / "translations.csv",
+        [
+            ["braces", "Use {{x}} here", "Usa {{x}} aquí"],
+            ["greeting", "Hello {name}", "Hola {name}"],
+            ["inbox", INBOX, ""],
+        ],
+    )
+
+
+# --- Escaping ---
+
+
+def test_escaped_braces_render_as_single_braces():
+    assert compile_template("Use {{x}} here")({}) == "Use {x} here"
+    assert compile_template("{{{name}}}")({"name": "Ana"}) == "{Ana}"
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_translate_unescapes_with_and_without_params(csv_path, use_cache):
+    manager = TranslationManager(csv_path, use_cache=use_cache)
+    assert manager.translate("braces") == "Use {x} here"
+    assert manager.translate("braces", unused=1) == "Use {x} here"
+    manager.set_language("es")
+    assert manager.translate("braces") == "Usa {x} aquí"
+
+
+def test_view_unescapes_without_params(csv_path):
+    catalog = SharedCatalog(csv_path)
+    assert TranslationView(catalog, "en").translate("braces") == "Use {x} here"
+    assert TranslationView(catalog, "es").translate("braces") == "Usa {x} aquí"
+
+
+def test_text_with_placeholders_is_raw_without_params(csv_path):
+    manager = TranslationManager(csv_path)
+    assert manager.translate("greeting") == "Hello {name}"
+    assert manager.translate("greeting", name="Ana") == "Hello Ana"
+
+
+def test_invalid_template_renders_unchanged():
+    assert compile_template("Unclosed {brace")({}) == "Unclosed {brace"
+    assert compile_template("Stray } brace")({}) == "Stray } brace"
+
+
+# --- Format specs ---
+
+
+def test_format_spec():
+    render = compile_template("Total: {amount:.2f} EUR")
+    assert render({"amount": 3.14159}) == "Total: 3.14 EUR"
+    assert compile_template("{n:>4}|")({"n": 7}) == "   7|"
+
+
+def test_repeated_placeholder():
+    assert compile_template("{a} and {a}")({"a": "x"}) == "x and x"
+
+
+# --- Missing params ---
+
+
+def test_missing_param_raises_key_error():
+    with pytest.raises(KeyError):
+        compile_template("Hello {name}")({})
+
+
+def test_missing_key_returns_key(csv_path):
+    manager = TranslationManager(csv_path)
+    assert manager.translate("nope", count=1) == "nope"
+    assert manager.missing_report()["missing_keys"] == {"nope": 1}
+
+
+# --- Plurals ---
+
+
+@pytest.mark.parametrize(
+    "count, expected",
+    [(0, "No messages"), (1, "1 message"), (2, "2 messages"), (1.5, "1.5 messages")],
+)
+def test_plural_selection_english(count, expected):
+    assert compile_template(INBOX, "en")({"count": count}) == expected
+
+
+def test_plural_uses_language_rules():
+    text = "{n, plural, one {# one} few {# few} many {# many} other {# other}}"
+    render = compile_template(text, "ru")
+    assert [render({"n": n}) for n in (1, 3, 5, 21, 1.5)] == [
+        "1 one",
+        "3 few",
+        "5 many",
+        "21 one",
+        "1.5 other",
+    ]
+    # French: 0 and 1 are "one"
+    assert compile_template("{n, plural, one {un} other {plus}}", "fr")({"n": 0}) == "un"
+
+
+def test_plural_falls_back_to_default_language(csv_path):
+    manager = TranslationManager(csv_path)
+    manager.set_language("es")
+    assert manager.translate("inbox", count=0) == "No messages"
+    assert manager.translate("inbox", count=3) == "3 messages"
+
+
+@pytest.mark.parametrize(
+    "lang, number, category",
+    [
+        ("en", 1, "one"),
+        ("en", 1.0, "other"),
+        ("es", 1000000, "many"),
+        ("pl", 22, "few"),
+        ("pl", 25, "many"),
+        ("ar", 0, "zero"),
+        ("ar", 102, "other"),
+        ("ja", 1, "other"),
+        ("pt-BR", 0, "one"),
+    ],
+)
+def test_plural_category(lang, number, category):
+    assert plural_category(lang, number) == category
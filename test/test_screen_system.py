@@ -0,0 +1,293 @@
+import asyncio
+import threading
+import time
+import uuid
+
+import flet as ft
+import pytest
+
+from harness import FakePage, headless
+from screen_system import RouteTable, Screen, ScreenRouter
+
+
+def make_screen(route, log, fail=False):
+    def build(self):
+        if fail:
+            raise RuntimeError(f"build {route}")
+        return ft.Text(route)
+
+    name = route.strip("/") or "root"
+    return type(
+        f"Screen_{name}",
+        (Screen,),
+        {
+            "route": route,
+            "build": build,
+            "on_load": lambda self: log.append(f"load {name}"),
+            "on_unload": lambda self: log.append(f"unload {name}"),
+        },
+    )
+
+
+@pytest.fixture
+def page():
+    page = FakePage()
+    with headless(page):
+        yield page
+
+
+def navigate(page, route):
+    page.run_task(page.push_route, route).result(timeout=5)
+
+
+def make_router(page, log, **kwargs):
+    router = ScreenRouter(page, collect_stats=False, **kwargs)
+    router.register_routes(
+        [make_screen("/a", log), make_screen("/d", log), make_screen("/bad", log, fail=True)]
+    )
+    return router
+
+
+def test_failed_build_keeps_current_screen(page):
+    log = []
+    router = make_router(page, log, animate_transitions=False)
+    navigate(page, "/d")
+    with pytest.raises(RuntimeError):
+        navigate(page, "/bad")
+    assert router.current_screen.path == "/d"
+    assert router._back_stack == []
+
+    navigate(page, "/a")
+    assert log == ["load d", "unload d", "load a"]
+    assert [entry.route for entry in router._back_stack] == ["/d"]
+
+
+def test_failed_build_in_animated_transition(page):
+    log = []
+    router = make_router(page, log, transition_duration_ms=50)
+    navigate(page, "/d")
+    navigate(page, "/bad")
+    router._transition_task.result(timeout=5)
+    assert router.current_screen.path == "/d"
+    assert router.content_container.opacity == 1.0
+
+    navigate(page, "/a")
+    router._transition_task.result(timeout=5)
+    assert log == ["load d", "unload d", "load a"]
+    assert [entry.route for entry in router._back_stack] == ["/d"]
+
+
+# --- Historial (back/forward) ---
+
+
+def counter_screen(route):
+    def restore_state(self, state):
+        if state["count"] is None:
+            raise ValueError("estado inválido")
+        self.count = state["count"]
+
+    return type(
+        "CounterScreen",
+        (Screen,),
+        {
+            "route": route,
+            "count": 0,
+            "build": lambda self: ft.Text(str(self.count)),
+            "save_state": lambda self: {"count": self.count},
+            "restore_state": restore_state,
+        },
+    )
+
+
+def settle(page):
+    # back()/forward() navegan en una tarea del event loop de la página
+    page.run_task(asyncio.sleep, 0).result(timeout=5)
+
+
+def test_back_and_forward_restore_state(page):
+    router = ScreenRouter(page, animate_transitions=False, collect_stats=False)
+    router.register_routes([counter_screen("/counter"), make_screen("/a", [])])
+    navigate(page, "/counter")
+    router.current_screen.count = 3
+    navigate(page, "/a")
+
+    assert router.back()
+    settle(page)
+    assert router.current_screen.path == "/counter"
+    assert router.current_screen.count == 3
+    assert router.content_container.content.value == "3"
+    assert router._back_stack == []
+    assert [entry.route for entry in router._forward_stack] == ["/a"]
+    assert router._history_request is None
+
+    router.current_screen.count = 5
+    assert router.forward()
+    settle(page)
+    assert router.current_screen.path == "/a"
+    assert router._forward_stack == []
+    assert [entry.state for entry in router._back_stack] == [{"count": 5}]
+    assert router._history_request is None
+    assert not router.forward()
+
+
+def test_failed_back_keeps_history_entry(page):
+    router = ScreenRouter(page, animate_transitions=False, collect_stats=False)
+    router.register_routes([counter_screen("/counter"), make_screen("/a", [])])
+    navigate(page, "/counter")
+    router.current_screen.count = None  # restore_state() fallará al volver
+    navigate(page, "/a")
+
+    assert router.back()
+    settle(page)
+    assert router.current_screen.path == "/a"
+    assert [entry.route for entry in router._back_stack] == ["/counter"]
+    assert router._forward_stack == []
+    assert router._history_request is None
+
+
+# --- Conversores de ruta ---
+
+
+def route_table():
+    table = RouteTable()
+    table.add("/users/:id<int>", "user")
+    table.add("/price/:amount<float>", "price")
+    table.add("/items/:key<uuid>", "item")
+    return table
+
+
+@pytest.mark.parametrize(
+    "route, params",
+    [
+        ("/users/42", {"id": 42}),
+        ("/users/-7", {"id": -7}),
+        ("/users/0", {"id": 0}),
+        ("/price/3.5", {"amount": 3.5}),
+        ("/price/10", {"amount": 10.0}),
+        (
+            "/items/12345678-1234-5678-1234-567812345678",
+            {"key": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+        ),
+    ],
+)
+def test_converters_accept_canonical_forms(route, params):
+    assert route_table().match(route).params == params
+
+
+@pytest.mark.parametrize(
+    "route",
+    [
+        "/users/4_2",
+        "/users/+42",
+        "/users/ 42",
+        "/users/042",
+        "/users/٤٢",
+        "/price/nan",
+        "/price/inf",
+        "/price/1e3",
+        "/price/1_0.5",
+        "/price/.5",
+        "/items/12345678123456781234567812345678",
+        "/items/{12345678-1234-5678-1234-567812345678}",
+        "/items/12345678-1234-5678-1234-56781234567A",
+    ],
+)
+def test_converters_reject_non_canonical_forms(route):
+    assert route_table().match(route) is None
+
+
+# --- Prefetch ---
+
+
+def slow_prefetch_screen(route, builds, release):
+    def build(self):
+        # Solo el hilo del prefetch se queda esperando
+        if threading.current_thread().name.startswith("screen-prefetch"):
+            release.wait(5)
+        builds.append(threading.current_thread().name)
+        return ft.Text(route)
+
+    return type("SlowScreen", (Screen,), {"route": route, "build": build})
+
+
+def test_unfinished_prefetch_is_not_awaited_without_animation(page):
+    builds, release = [], threading.Event()
+    router = ScreenRouter(page, animate_transitions=False, collect_stats=False)
+    router.register_routes([make_screen("/a", []), slow_prefetch_screen("/slow", builds, release)])
+    navigate(page, "/a")
+    router.prefetch(["/slow"])
+    start = time.perf_counter()
+    navigate(page, "/slow")
+    assert time.perf_counter() - start < 1
+    assert len(builds) == 1 and not builds[0].startswith("screen-prefetch")
+    release.set()
+
+
+def test_animated_transition_waits_for_prefetch_off_the_loop(page):
+    builds, release = [], threading.Event()
+    router = ScreenRouter(page, transition_duration_ms=0, prefetch=True, collect_stats=False)
+    router.register_routes([make_screen("/a", []), slow_prefetch_screen("/slow", builds, release)])
+    navigate(page, "/a")
+    navigate(page, "/slow")
+    # El event loop sigue libre mientras el prefetch espera
+    assert page.run_task(asyncio.sleep, 0).result(timeout=1) is None
+    task = router._transition_task
+    release.set()
+    task.result(timeout=5)
+    assert router.current_screen.path == "/slow"
+    assert len(builds) == 1 and builds[0].startswith("screen-prefetch")
+
+
+# --- Carga asíncrona (Screen.load) ---
+
+
+def loading_screen(route, log, fail=False, gate=None):
+    async def load(self):
+        if gate is not None:
+            await asyncio.to_thread(gate.wait, 5)
+        if fail:
+            raise RuntimeError(f"load {route}")
+        log.append("loaded")
+
+    return type(
+        "LoadingScreen",
+        (Screen,),
+        {
+            "route": route,
+            "load": load,
+            "build": lambda self: log.append("build") or ft.Text("datos"),
+            "build_error": lambda self, error: ft.Text(f"error: {error}"),
+        },
+    )
+
+
+def test_placeholder_without_optional_components(page):
+    # components.data_display requiere flet_datatable2 (opcional)
+    placeholder = Screen(page).build_placeholder()
+    assert isinstance(placeholder.content, ft.ProgressRing)
+
+
+def test_failed_load_shows_error_state(page, caplog):
+    log, gate = [], threading.Event()
+    router = ScreenRouter(page, animate_transitions=False, collect_stats=False)
+    router.register_routes([loading_screen("/data", log, fail=True, gate=gate)])
+    navigate(page, "/data")
+    assert isinstance(router.content_container.content.content, ft.ProgressRing)
+    future = router._load_future
+    gate.set()
+    assert isinstance(future.result(timeout=5), RuntimeError)
+    assert router.content_container.content.value == "error: load /data"
+    assert "build" not in log
+    assert "Error en load()" in caplog.text
+
+
+def test_failed_early_load_shows_error_state(page, caplog):
+    log = []
+    router = ScreenRouter(page, transition_duration_ms=50, collect_stats=False)
+    router.register_routes([make_screen("/a", []), loading_screen("/data", log, fail=True)])
+    navigate(page, "/a")
+    navigate(page, "/data")
+    router._transition_task.result(timeout=5)
+    assert router.content_container.content.value == "error: load /data"
+    assert "build" not in log
+    assert "Error en load()" in caplog.text
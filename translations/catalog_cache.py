@@ -0,0 +1,481 @@
+"""Compiled translation catalogs.
+
+Parsing the translations CSV with ``csv.DictReader`` on every start is slow
+for large catalogs. This module stores the parsed catalog in a compiled
+``marshal`` file next to the CSV (``translations.csv.cache``). The compiled
+file is keyed on the CSV's mtime, size and SHA-256 hash: it is regenerated
+automatically when stale and otherwise loaded without touching the CSV.
+
+Each language is stored as its own column, so a process can load only the
+languages it uses (see CompiledCatalog.load_column). SharedCatalog keeps the
+loaded columns once per process, read-only, for every session to share.
+
+Precompile at build time with::
+
+    python -m translations.compile_catalog path/to/translations.csv
+    python -m translations.compile_catalog --check path/to/translations.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import tempfile
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .formatting import Formatter, column_formatters, resolve_formatters, unescaped_texts
+
+# Bump when the layout of the compiled file changes
+CACHE_FORMAT = 2
+CACHE_SUFFIX = ".cache"
+# File layout: MAGIC, header length (uint32), marshal(header), then
+# marshal([keys]) and one marshal([text or None, aligned with keys]) blob per
+# language, at the offsets listed in the header. Storing the keys once lets
+# every loaded column share the same key strings.
+# marshal.loads() on bytes is much faster than marshal.load() on a file.
+MAGIC = b"FLTCAT02"
+_LENGTH = struct.Struct("<I")
+
+Catalog = Tuple[List[str], Dict[str, Dict[str, str]]]
+Columns = Dict[str, Dict[str, str]]
+
+
+def parse_csv_columns(
+    csv_path: str, languages: Optional[Iterable[str]] = None
+) -> Tuple[List[str], Columns]:
+    """Parse a translations CSV into (all languages, {lang: {key: text}}).
+
+    Only the columns in `languages` are materialized (all of them if None).
+    The first column is the key; empty cells are dropped.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        if not fieldnames:
+            return [], {}
+        all_languages = fieldnames[1:]
+        if languages is None:
+            wanted = all_languages
+        else:
+            requested = set(languages)
+            wanted = [lang for lang in all_languages if lang in requested]
+        projection = [(fieldnames.index(lang), {}) for lang in wanted]
+        for row in reader:
+            if not row or not row[0]:
+                continue
+            key = row[0]
+            for index, column in projection:
+                if index < len(row) and row[index]:
+                    column[key] = row[index]
+    return all_languages, {lang: column for lang, (_, column) in zip(wanted, projection)}
+
+
+def changed_keys(old: Mapping[str, Mapping[str, str]], new: Mapping[str, Mapping[str, str]]) -> Set[str]:
+    """Keys added, removed or changed in any of old's languages."""
+    changed: Set[str] = set()
+    for lang, old_column in old.items():
+        new_column = new.get(lang, {})
+        changed.update(old_column.keys() ^ new_column.keys())
+        changed.update(key for key, text in new_column.items() if old_column.get(key, text) != text)
+    return changed
+
+
+def columns_to_catalog(languages: List[str], columns: Columns) -> Catalog:
+    """Convert per-language columns into (languages, {key: {lang: text}})."""
+    translations: Dict[str, Dict[str, str]] = {}
+    for lang in languages:
+        for key, text in columns.get(lang, {}).items():
+            translations.setdefault(key, {})[lang] = text
+    return languages, translations
+
+
+def parse_csv(csv_path: str) -> Catalog:
+    """Parse a translations CSV into (languages, {key: {lang: text}})."""
+    return columns_to_catalog(*parse_csv_columns(csv_path))
+
+
+def default_cache_path(csv_path: str) -> str:
+    """Return the compiled catalog path used for csv_path."""
+    return csv_path + CACHE_SUFFIX
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_header(csv_path: str, sha256: Optional[str] = None) -> dict:
+    stat = os.stat(csv_path)
+    return {
+        "format": CACHE_FORMAT,
+        # marshal data is only valid for the Python version that wrote it
+        "python": list(sys.version_info[:2]),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256 if sha256 is not None else _file_hash(csv_path),
+    }
+
+
+def _read_header(f) -> Optional[dict]:
+    """Read the header of an open compiled file; sets header["data_start"]."""
+    try:
+        prefix = f.read(len(MAGIC) + _LENGTH.size)
+        if len(prefix) != len(MAGIC) + _LENGTH.size or not prefix.startswith(MAGIC):
+            return None
+        (length,) = _LENGTH.unpack_from(prefix, len(MAGIC))
+        header = marshal.loads(f.read(length))
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(header, dict):
+        return None
+    header["data_start"] = len(prefix) + length
+    return header
+
+
+def _write(cache_path: str, header: dict, data: bytes) -> None:
+    """Write a compiled catalog atomically (temp file + rename)."""
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        header_bytes = marshal.dumps(header)
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + _LENGTH.pack(len(header_bytes)) + header_bytes)
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _compile(csv_path: str, cache_path: str) -> Tuple[List[str], Columns]:
+    languages, columns = parse_csv_columns(csv_path)
+    _write_columns(csv_path, cache_path, languages, columns)
+    return languages, columns
+
+
+def _write_columns(csv_path: str, cache_path: str, languages: List[str], columns: Columns) -> None:
+    keys = list(dict.fromkeys(key for lang in languages for key in columns[lang]))
+    header = _source_header(csv_path)
+    header["languages"] = languages
+    header["columns"] = {}
+    blobs = [marshal.dumps(keys)]
+    header["keys"] = [0, len(blobs[0])]
+    offset = len(blobs[0])
+    for lang in languages:
+        column = columns[lang]
+        blob = marshal.dumps([column.get(key) for key in keys])
+        header["columns"][lang] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+    _write(cache_path, header, b"".join(blobs))
+
+
+def compile_catalog(csv_path: str, cache_path: Optional[str] = None) -> Catalog:
+    """Parse csv_path and write its compiled catalog. Returns the catalog."""
+    languages, columns = _compile(csv_path, cache_path or default_cache_path(csv_path))
+    return columns_to_catalog(languages, columns)
+
+
+def _matches(header: dict, csv_path: str) -> bool:
+    if header.get("format") != CACHE_FORMAT or header.get("python") != list(sys.version_info[:2]):
+        return False
+    stat = os.stat(csv_path)
+    if header.get("mtime_ns") == stat.st_mtime_ns and header.get("size") == stat.st_size:
+        return True
+    # Touched but maybe unchanged (checkout, copy): compare contents
+    return header.get("size") == stat.st_size and header.get("sha256") == _file_hash(csv_path)
+
+
+def is_fresh(csv_path: str, cache_path: Optional[str] = None) -> bool:
+    """Return True if the compiled catalog matches the current CSV."""
+    try:
+        with open(cache_path or default_cache_path(csv_path), "rb") as f:
+            header = _read_header(f)
+    except OSError:
+        return False
+    return header is not None and _matches(header, csv_path)
+
+
+class CompiledCatalog:
+    """Read access to the compiled catalog of a CSV, one language at a time.
+
+    Opening it regenerates the compiled file if missing or stale. The file
+    stays open, so later column reads are consistent even if it is replaced
+    on disk. If the compiled file can't be written (e.g. read-only install),
+    each requested column is parsed from the CSV instead, so only the
+    languages actually used are kept in memory.
+    """
+
+    def __init__(self, csv_path: str, cache_path: Optional[str] = None) -> None:
+        self.csv_path = csv_path
+        self.cache_path = cache_path or default_cache_path(csv_path)
+        self._file = None
+        self._header: dict = {}
+        self._keys: Optional[List[str]] = None
+        self._open()
+
+    def _open(self) -> None:
+        try:
+            f = open(self.cache_path, "rb")
+        except OSError:
+            f = None
+        if f is not None:
+            header = _read_header(f)
+            if header is not None and _matches(header, self.csv_path):
+                if header["mtime_ns"] == os.stat(self.csv_path).st_mtime_ns:
+                    self._file, self._header = f, header
+                    return
+                # Same contents, new mtime: rewrite with a refreshed header
+                f.seek(header["data_start"])
+                data = f.read()
+                f.close()
+                refreshed = _source_header(self.csv_path, header["sha256"])
+                for field in ("languages", "keys", "columns"):
+                    refreshed[field] = header[field]
+                if self._try_write(_write, self.cache_path, refreshed, data):
+                    self._reopen()
+                    return
+            else:
+                f.close()
+        languages, columns = parse_csv_columns(self.csv_path)
+        if self._try_write(_write_columns, self.csv_path, self.cache_path, languages, columns):
+            self._reopen()
+        else:
+            # Not compiled: load_column() parses the CSV per language
+            self._header = {"languages": languages}
+
+    def _reopen(self) -> None:
+        f = open(self.cache_path, "rb")
+        self._file, self._header = f, _read_header(f)
+
+    @staticmethod
+    def _try_write(write, *args) -> bool:
+        try:
+            write(*args)
+            return True
+        except OSError:
+            return False
+
+    @property
+    def languages(self) -> List[str]:
+        """Language codes in the catalog, in CSV column order."""
+        return list(self._header["languages"])
+
+    def load_column(self, lang: str) -> Dict[str, str]:
+        """Return {key: text} for one language ({} if unknown)."""
+        if self._file is None:
+            # Not compiled or closed: read the CSV directly
+            return parse_csv_columns(self.csv_path, [lang])[1].get(lang, {})
+        location = self._header["columns"].get(lang)
+        if location is None:
+            return {}
+        if self._keys is None:
+            self._keys = self._read_blob(self._header["keys"])
+        values = self._read_blob(location)
+        return {key: text for key, text in zip(self._keys, values) if text is not None}
+
+    def _read_blob(self, location: List[int]):
+        offset, length = location
+        self._file.seek(self._header["data_start"] + offset)
+        return marshal.loads(self._file.read(length))
+
+    def load_columns(self, languages: Optional[Iterable[str]] = None) -> Columns:
+        """Return {lang: {key: text}} for the given languages (all if None)."""
+        if languages is None:
+            languages = self.languages
+        return {lang: self.load_column(lang) for lang in languages}
+
+    def close(self) -> None:
+        """Close the compiled file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class SharedCatalog:
+    """Process-wide, read-only catalog of one CSV, shared by all sessions.
+
+    Use SharedCatalog.for_path() to get the single instance of a CSV. Columns
+    are loaded on first use (once, even with concurrent sessions) and
+    returned as read-only mappings, so any number of sessions can hold them.
+
+    reload() re-reads the loaded columns from the CSV and notifies the views
+    registered with add_view(), which then pick up the new columns.
+    """
+
+    _instances: Dict[str, "SharedCatalog"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, csv_path: str, use_cache: bool = True) -> None:
+        self.csv_path = csv_path
+        self.use_cache = use_cache
+        self._source: Optional[CompiledCatalog] = None
+        self._columns: Dict[str, Mapping[str, str]] = {}
+        self._resolved: Dict[Tuple[str, str], Mapping[str, str]] = {}
+        self._formatters: Dict[Tuple[str, str], Mapping[str, Formatter]] = {}
+        self._lock = threading.Lock()
+        # Views over this catalog, told about reloads (see add_view)
+        self._views: "weakref.WeakSet" = weakref.WeakSet()
+        self._open()
+
+    def _open(self) -> None:
+        if not os.path.isfile(self.csv_path):
+            self.languages: Tuple[str, ...] = ()
+        elif self.use_cache:
+            self._source = CompiledCatalog(self.csv_path)
+            self.languages = tuple(self._source.languages)
+        else:
+            self.languages = tuple(parse_csv_columns(self.csv_path, ())[0])
+
+    @classmethod
+    def for_path(cls, csv_path: str, use_cache: bool = True) -> "SharedCatalog":
+        """Return the shared catalog of csv_path, creating it on first use."""
+        key = os.path.abspath(csv_path)
+        catalog = cls._instances.get(key)
+        if catalog is None:
+            with cls._instances_lock:
+                catalog = cls._instances.get(key)
+                if catalog is None:
+                    catalog = cls._instances[key] = cls(csv_path, use_cache)
+        return catalog
+
+    @classmethod
+    def existing(cls, csv_path: str) -> Optional["SharedCatalog"]:
+        """Return the shared catalog of csv_path if one was created, else None."""
+        return cls._instances.get(os.path.abspath(csv_path))
+
+    def add_view(self, view) -> None:
+        """Call view.catalog_reloaded(changed_keys) after each reload().
+
+        Only a weak reference is kept.
+        """
+        self._views.add(view)
+
+    def column(self, lang: str) -> Mapping[str, str]:
+        """Return the read-only {key: text} column of lang (empty if unknown)."""
+        column = self._columns.get(lang)
+        if column is None:
+            with self._lock:
+                column = self._columns.get(lang)
+                if column is None:
+                    column = self._columns[lang] = MappingProxyType(self._load(lang))
+        return column
+
+    def resolved(self, lang: str, default_lang: str) -> Mapping[str, str]:
+        """Return the read-only {key: text} of lang with default_lang's texts
+        filling its gaps, built once per language pair. Texts without
+        placeholders show escaped braces unescaped (see formatting)."""
+        lookup = self._resolved.get((lang, default_lang))
+        if lookup is None:
+            active, default = self.column(lang), self.column(default_lang)
+            merged = active if lang == default_lang else {**default, **active}
+            escaped = unescaped_texts(merged, self.formatters(lang, default_lang))
+            if escaped:
+                merged = {**merged, **escaped}
+            with self._lock:
+                lookup = self._resolved.setdefault(
+                    (lang, default_lang),
+                    merged if merged is active else MappingProxyType(merged),
+                )
+        return lookup
+
+    def formatters(self, lang: str, default_lang: str) -> Mapping[str, Formatter]:
+        """Return the read-only compiled templates matching resolved(lang,
+        default_lang), built once per language pair."""
+        formatters = self._formatters.get((lang, default_lang))
+        if formatters is None:
+            default = column_formatters(self.column(default_lang), default_lang)
+            if lang != default_lang:
+                active = self.column(lang)
+                default = resolve_formatters(active, column_formatters(active, lang), default)
+            with self._lock:
+                formatters = self._formatters.setdefault(
+                    (lang, default_lang), MappingProxyType(default)
+                )
+        return formatters
+
+    def _load(self, lang: str) -> Dict[str, str]:
+        if lang not in self.languages:
+            return {}
+        if self._source is not None:
+            return self._source.load_column(lang)
+        return parse_csv_columns(self.csv_path, [lang])[1].get(lang, {})
+
+    @property
+    def loaded_languages(self) -> List[str]:
+        """Language codes whose column has been loaded."""
+        return list(self._columns)
+
+    def reload(self) -> Set[str]:
+        """Re-read the CSV and return the keys whose texts changed.
+
+        The loaded columns are re-read (the rest load from the new CSV when
+        needed) and the merged lookups and formatters are rebuilt on demand.
+        Registered views are then told which keys changed.
+        """
+        with self._lock:
+            if self._source is not None:
+                self._source.close()
+                self._source = None
+            self._open()
+            old = self._columns
+            self._columns = {lang: MappingProxyType(self._load(lang)) for lang in old}
+            self._resolved = {}
+            self._formatters = {}
+            changed = changed_keys(old, self._columns)
+        for view in list(self._views):
+            view.catalog_reloaded(changed)
+        return changed
+
+
+def load_catalog(csv_path: str, cache_path: Optional[str] = None) -> Catalog:
+    """Load the whole catalog for csv_path, using the compiled file when fresh."""
+    catalog = CompiledCatalog(csv_path, cache_path)
+    try:
+        return columns_to_catalog(catalog.languages, catalog.load_columns())
+    finally:
+        catalog.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m translations.compile_catalog",
+        description="Precompile translation CSV files into fast-loading catalogs.",
+    )
+    parser.add_argument("csv", nargs="+", help="Translation CSV file(s)")
+    parser.add_argument(
+        "-o", "--output", help="Compiled catalog path (only with a single CSV)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write anything; exit with 1 if a compiled catalog is missing or stale",
+    )
+    args = parser.parse_args(argv)
+    if args.output and len(args.csv) > 1:
+        parser.error("--output can only be used with a single CSV file")
+
+    status = 0
+    for csv_path in args.csv:
+        cache_path = args.output or default_cache_path(csv_path)
+        if args.check:
+            fresh = is_fresh(csv_path, cache_path)
+            print(f"{csv_path}: {'up to date' if fresh else 'stale'}")
+            status = status or (0 if fresh else 1)
+            continue
+        languages, translations = compile_catalog(csv_path, cache_path)
+        print(f"{csv_path} -> {cache_path} ({len(translations)} keys, {len(languages)} languages)")
+    return status
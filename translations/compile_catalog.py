@@ -0,0 +1,14 @@
+"""Command line entry point for precompiling translation catalogs.
+
+Usage::
+
+    python -m translations.compile_catalog translations/translations.csv
+    python -m translations.compile_catalog --check translations/translations.csv
+"""
+
+import sys
+
+from .catalog_cache import main
+
+if __name__ == "__main__":
+    sys.exit(main())
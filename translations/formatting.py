@@ -0,0 +1,237 @@
+"""Compiled translation templates.
+
+Translated texts may contain named placeholders and plural selections:
+
+    "Hello {name}"                       -> {name} is replaced by str(name)
+    "Total: {amount:.2f} EUR"            -> format spec, as in str.format
+    "{count, plural, =0 {No messages} one {# message} other {# messages}}"
+
+A plural selection picks the branch of an exact value (=0, =1, ...) or of
+the CLDR category of the number in the text's language (zero, one, two,
+few, many, other; "other" is required); "#" in a branch is the number.
+"{{" and "}}" are literal braces.
+
+compile_template() turns a text into a Formatter once: a function with the
+placeholders resolved into an f-string, so rendering does no parsing.
+Formatters are cached per process (by language and text, the most recent
+MAX_COMPILED_TEMPLATES), so sessions and managers share them.
+
+Without params a text is shown as is, except that a text with no
+placeholders shows "{{" and "}}" as single braces (see unescaped_texts).
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from .plurals import operands, plural_rule
+
+# Formatter(params) -> rendered text
+Formatter = Callable[..., str]
+
+# Compiled templates kept by compile_template()
+MAX_COMPILED_TEMPLATES = 4096
+
+# Placeholder names are identifiers; specs can't contain quotes or braces
+_SPEC = re.compile(r"[^{}'\"\\\n]*")
+# Marks "#" inside a plural branch
+_NUMBER = object()
+
+Part = Union[str, object, Tuple[str, str], Tuple[str, Dict[str, List[Any]]]]
+
+
+def is_template(text: str) -> bool:
+    """Whether text may contain placeholders (needs a compiled formatter)."""
+    return "{" in text or "}" in text
+
+
+def _closing_brace(text: str, start: int) -> int:
+    """Index of the brace closing the one at text[start]."""
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError(f"Unclosed '{{' at {start} in {text!r}")
+
+
+def _parse(text: str, in_plural: bool = False) -> List[Part]:
+    parts: List[Part] = []
+    literal: List[str] = []
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char in "{}" and text.startswith(char * 2, index):
+            literal.append(char)
+            index += 2
+            continue
+        if char == "}":
+            raise ValueError(f"Unmatched '}}' at {index} in {text!r}")
+        if char == "{":
+            end = _closing_brace(text, index)
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            parts.append(_parse_placeholder(text[index + 1 : end]))
+            index = end + 1
+            continue
+        if char == "#" and in_plural:
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            parts.append(_NUMBER)
+        else:
+            literal.append(char)
+        index += 1
+    if literal:
+        parts.append("".join(literal))
+    return parts
+
+
+def _parse_placeholder(body: str) -> Part:
+    if "," in body:
+        name, kind, rest = (body.split(",", 2) + ["", ""])[:3]
+        name = name.strip()
+        if kind.strip() != "plural":
+            raise ValueError(f"Unsupported placeholder type {kind.strip()!r} in {{{body}}}")
+        _check_name(name)
+        return name, _parse_branches(rest)
+    name, _, spec = body.partition(":")
+    name = name.strip()
+    _check_name(name)
+    if not _SPEC.fullmatch(spec):
+        raise ValueError(f"Invalid format spec {spec!r} in {{{body}}}")
+    return name, spec
+
+
+def _parse_branches(text: str) -> Dict[str, List[Part]]:
+    branches: Dict[str, List[Part]] = {}
+    index = 0
+    while True:
+        while index < len(text) and text[index].isspace():
+            index += 1
+        if index == len(text):
+            break
+        brace = text.find("{", index)
+        if brace == -1:
+            raise ValueError(f"Plural selector without branch in {text!r}")
+        selector = text[index:brace].strip()
+        end = _closing_brace(text, brace)
+        branches[selector] = _parse(text[brace + 1 : end], in_plural=True)
+        index = end + 1
+    if "other" not in branches:
+        raise ValueError(f"Plural without an 'other' branch in {text!r}")
+    return branches
+
+
+def _check_name(name: str) -> None:
+    if not name.isidentifier():
+        raise ValueError(f"Invalid placeholder name {name!r}")
+
+
+def _plural_selector(branches: Dict[str, Formatter], lang: str) -> Callable[[Any, Mapping], str]:
+    """select(number, params): render the branch for number."""
+    rule = plural_rule(lang)
+    exact = {}
+    for selector, branch in branches.items():
+        if selector.startswith("="):
+            exact[float(selector[1:])] = branch
+    other = branches["other"]
+
+    def select(number, params: Mapping) -> str:
+        branch = exact.get(number) if exact else None
+        if branch is None:
+            branch = branches.get(rule(operands(number)), other)
+        return branch(params, number)
+
+    return select
+
+
+def _build(parts: List[Part], lang: str) -> Formatter:
+    """Generate render(p, n=None) returning the parts as one f-string."""
+    namespace: Dict[str, Any] = {}
+    lines = ["def render(p, n=None):"]
+    pieces: List[str] = []
+    names: Dict[str, str] = {}
+    for part in parts:
+        if part is _NUMBER:
+            pieces.append("{n}")
+        elif isinstance(part, str):
+            pieces.append(part.replace("{", "{{").replace("}", "}}"))
+        else:
+            name, detail = part
+            var = names.get(name)
+            if var is None:
+                var = names[name] = f"_a{len(names)}"
+                lines.append(f"    {var} = p[{name!r}]")
+            if isinstance(detail, dict):
+                selector = f"_s{len(namespace)}"
+                namespace[selector] = _plural_selector(
+                    {key: _build(branch, lang) for key, branch in detail.items()}, lang
+                )
+                pieces.append(f"{{{selector}({var}, p)}}")
+            else:
+                pieces.append(f"{{{var}:{detail}}}" if detail else f"{{{var}}}")
+    lines.append(f"    return f{''.join(pieces)!r}")
+    exec("\n".join(lines), namespace)
+    return namespace["render"]
+
+
+@lru_cache(maxsize=MAX_COMPILED_TEMPLATES)
+def compile_template(text: str, lang: str = "en") -> Formatter:
+    """Compile text (in lang, for plural rules) into a Formatter.
+
+    The formatter takes the params mapping: formatter({"name": "Ana"}).
+    A missing param raises KeyError, as with str.format. Texts that are not
+    valid templates render unchanged.
+    """
+    try:
+        return _build(_parse(text), lang)
+    except (ValueError, SyntaxError):
+        # Braces that don't form a template: show the text as is
+        return lambda p, n=None: text
+
+
+def literal_text(text: str) -> Optional[str]:
+    """text with "{{" and "}}" unescaped, or None if it has placeholders or
+    is not a valid template."""
+    try:
+        parts = _parse(text)
+    except ValueError:
+        return None
+    if not all(isinstance(part, str) for part in parts):
+        return None
+    return "".join(parts)
+
+
+def unescaped_texts(lookup: Mapping[str, str], formatters: Mapping[str, Formatter]) -> Dict[str, str]:
+    """{key: literal_text(text)} for the texts of lookup (with their
+    formatters) that escape braces and have no placeholders."""
+    texts = {}
+    for key in formatters:
+        text = lookup.get(key)
+        if text is not None and ("{{" in text or "}}" in text):
+            literal = literal_text(text)
+            if literal is not None:
+                texts[key] = literal
+    return texts
+
+
+def column_formatters(column: Mapping[str, str], lang: str) -> Dict[str, Formatter]:
+    """{key: Formatter} for the texts of a language column that are templates."""
+    return {key: compile_template(text, lang) for key, text in column.items() if is_template(text)}
+
+
+def resolve_formatters(
+    active_column: Mapping[str, str],
+    active: Mapping[str, Formatter],
+    default: Mapping[str, Formatter],
+) -> Dict[str, Formatter]:
+    """Formatters of the active language over the default ones, like the flat
+    lookup: default formatters only for keys the active language lacks."""
+    formatters = {key: fn for key, fn in default.items() if key not in active_column}
+    formatters.update(active)
+    return formatters
@@ -0,0 +1,188 @@
+"""CLDR cardinal plural categories.
+
+plural_category(lang, n) returns the CLDR category ("zero", "one", "two",
+"few", "many" or "other") of the number n in lang, following the CLDR
+cardinal rules for the languages in LANGUAGE_NAMES. Unknown languages use
+the English rule.
+
+The rules work on the CLDR operands: n (absolute value), i (integer part),
+v (number of visible fraction digits) and f (visible fraction digits as an
+integer), so 1 and 1.0 can fall in different categories, as in CLDR.
+"""
+
+from decimal import Decimal
+from typing import Callable, Dict, Tuple, Union
+
+Number = Union[int, float, Decimal]
+# (n, i, v, f)
+Operands = Tuple[Union[int, float], int, int, int]
+PluralRule = Callable[[Operands], str]
+
+CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+
+def operands(number: Number) -> Operands:
+    """Return the CLDR operands (n, i, v, f) of number."""
+    if isinstance(number, int):
+        n = abs(number)
+        return n, n, 0, 0
+    text = format(abs(Decimal(str(number))), "f")
+    integer, _, fraction = text.partition(".")
+    n = float(text)
+    return (int(n) if n.is_integer() else n), int(integer), len(fraction), int(fraction or 0)
+
+
+def _other(ops: Operands) -> str:
+    return "other"
+
+
+def _one_i1_v0(ops: Operands) -> str:
+    # en, de, nl, sv, fi
+    n, i, v, f = ops
+    return "one" if i == 1 and v == 0 else "other"
+
+
+def _one_n1(ops: Operands) -> str:
+    # el, hu, tr, no
+    return "one" if ops[0] == 1 else "other"
+
+
+def _million_many(i: int, v: int) -> bool:
+    return i != 0 and i % 1000000 == 0 and v == 0
+
+
+def _es(ops: Operands) -> str:
+    n, i, v, f = ops
+    if n == 1:
+        return "one"
+    return "many" if _million_many(i, v) else "other"
+
+
+def _it(ops: Operands) -> str:
+    n, i, v, f = ops
+    if i == 1 and v == 0:
+        return "one"
+    return "many" if _million_many(i, v) else "other"
+
+
+def _fr_pt(ops: Operands) -> str:
+    n, i, v, f = ops
+    if i in (0, 1):
+        return "one"
+    return "many" if _million_many(i, v) else "other"
+
+
+def _da(ops: Operands) -> str:
+    n, i, v, f = ops
+    # t: fraction digits without trailing zeros
+    return "one" if n == 1 or (f != 0 and i in (0, 1)) else "other"
+
+
+def _hi(ops: Operands) -> str:
+    n, i, v, f = ops
+    return "one" if i == 0 or n == 1 else "other"
+
+
+def _he(ops: Operands) -> str:
+    n, i, v, f = ops
+    if (i == 1 and v == 0) or (i == 0 and v != 0):
+        return "one"
+    return "two" if i == 2 and v == 0 else "other"
+
+
+def _ru(ops: Operands) -> str:
+    n, i, v, f = ops
+    if v != 0:
+        return "other"
+    if i % 10 == 1 and i % 100 != 11:
+        return "one"
+    if 2 <= i % 10 <= 4 and not 12 <= i % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _pl(ops: Operands) -> str:
+    n, i, v, f = ops
+    if v != 0:
+        return "other"
+    if i == 1:
+        return "one"
+    if 2 <= i % 10 <= 4 and not 12 <= i % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _cs(ops: Operands) -> str:
+    n, i, v, f = ops
+    if v != 0:
+        return "many"
+    if i == 1:
+        return "one"
+    return "few" if 2 <= i <= 4 else "other"
+
+
+def _ro(ops: Operands) -> str:
+    n, i, v, f = ops
+    if i == 1 and v == 0:
+        return "one"
+    if v != 0 or n == 0 or (n != 1 and 1 <= n % 100 <= 19):
+        return "few"
+    return "other"
+
+
+def _ar(ops: Operands) -> str:
+    n = ops[0]
+    if n == 0:
+        return "zero"
+    if n == 1:
+        return "one"
+    if n == 2:
+        return "two"
+    if isinstance(n, int):
+        if 3 <= n % 100 <= 10:
+            return "few"
+        if 11 <= n % 100 <= 99:
+            return "many"
+    return "other"
+
+
+PLURAL_RULES: Dict[str, PluralRule] = {
+    "en": _one_i1_v0,
+    "de": _one_i1_v0,
+    "nl": _one_i1_v0,
+    "sv": _one_i1_v0,
+    "fi": _one_i1_v0,
+    "el": _one_n1,
+    "hu": _one_n1,
+    "tr": _one_n1,
+    "no": _one_n1,
+    "es": _es,
+    "it": _it,
+    "fr": _fr_pt,
+    "pt": _fr_pt,
+    "da": _da,
+    "hi": _hi,
+    "he": _he,
+    "ru": _ru,
+    "pl": _pl,
+    "cs": _cs,
+    "ro": _ro,
+    "ar": _ar,
+    "zh": _other,
+    "ja": _other,
+    "ko": _other,
+    "th": _other,
+    "vi": _other,
+    "id": _other,
+}
+
+
+def plural_rule(lang: str) -> PluralRule:
+    """Return the rule of lang ("pt-BR" and "pt_BR" use "pt")."""
+    base = lang.replace("_", "-").split("-", 1)[0].lower()
+    return PLURAL_RULES.get(base, _one_i1_v0)
+
+
+def plural_category(lang: str, number: Number) -> str:
+    """Return the CLDR plural category of number in lang."""
+    return plural_rule(lang)(operands(number))
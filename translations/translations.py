@@ -1,16 +1,254 @@
-import csv
+import asyncio
 import os
-from typing import Dict, List
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
+from .catalog_cache import CompiledCatalog, SharedCatalog, changed_keys, parse_csv_columns
+from .formatting import Formatter, column_formatters, resolve_formatters, unescaped_texts
 
-class TranslationManager:
+
+def _initial_language(page, available_languages, default_lang: str) -> str:
+    """Language stored in page's preferences, else its locale if available.
+
+    The chosen language is stored when there was none.
+    """
+    stored_language = page.shared_preferences.get("language")
+    if stored_language:
+        # Aseguramos que sea un código (por si se guardó el nombre completo)
+        from .languages import get_language_code
+
+        return get_language_code(stored_language)
+    lang = page.locale if page.locale in available_languages else default_lang
+    page.shared_preferences.set("language", lang)
+    return lang
+
+
+def _send_texts(page, changes: List[Tuple[Any, str, str]]) -> None:
+    """Set each (control, attr, text) and send the controls in one update."""
+    for control, attr, text in changes:
+        setattr(control, attr, text)
+    page.update(*(control for control, _, _ in changes))
+
+
+async def _send_texts_on_loop(page, changes: List[Tuple[Any, str, str]]) -> None:
+    _send_texts(page, changes)
+
+
+# Distinct missing keys remembered for missing_report()
+MAX_MISSING_KEYS = 1000
+
+
+class _FlatLookup:
+    """translate() over one flat {key: text} dict, with hit/miss counters.
+
+    Subclasses rebuild _lookup (the active column with the default
+    language filling its gaps) and _formatters (its compiled templates, see
+    formatting) whenever the language changes, so a lookup is a single dict
+    access, and then call _refresh_bindings() so controls registered with
+    bind() show the new language.
+    """
+
+    __slots__ = (
+        "active_lang",
+        "_active_column",
+        "_default_column",
+        "_lookup",
+        "_formatters",
+        "hits",
+        "misses",
+        "_missing",
+        "_bindings",
+    )
+
+    def _init_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        # key -> times requested without any translation
+        self._missing: Dict[str, int] = {}
+
+    def translate(self, key: str, **params: Any) -> str:
+        """Return the translation for key in the active language.
+        Falls back to default language then the key itself.
+
+        With params, placeholders and plurals of the text are filled in
+        (see formatting): translate("inbox", count=3). Without them, "{{"
+        and "}}" show as single braces in texts with no placeholders.
+        """
+        if params:
+            return self.format(key, params)
+        text = self._lookup.get(key)
+        if text is not None:
+            self.hits += 1
+            return text
+        self._record_miss(key)
+        return key
+
+    def format(self, key: str, params: Mapping[str, Any]) -> str:
+        """translate() with the params given as a mapping.
+
+        Templates are compiled when the language is selected, so this only
+        calls the compiled formatter.
+        """
+        formatter = self._formatters.get(key)
+        if formatter is not None:
+            self.hits += 1
+            return formatter(params)
+        return self.translate(key)
+
+    def _text(self, key: str, params: Mapping[str, Any]) -> str:
+        # Like format(), without counting
+        formatter = self._formatters.get(key) if params else None
+        if formatter is not None:
+            return formatter(params)
+        return self._lookup.get(key) or key
+
+    def _record_miss(self, key: str) -> None:
+        self.misses += 1
+        missing = self._missing
+        if key in missing:
+            missing[key] += 1
+        elif len(missing) < MAX_MISSING_KEYS:
+            missing[key] = 1
+
+    def missing_report(self) -> Dict[str, Any]:
+        """Summary of lookups since the last reset_stats().
+
+        Returns a dict with:
+            language:          Active language.
+            hits, misses:      translate() calls with / without a translation.
+            hit_rate:          hits / calls (1.0 if there were no calls).
+            missing_keys:      {key: times requested} for keys with no
+                               translation at all, most requested first.
+            untranslated_keys: Keys of the default language missing in the
+                               active one (served from the default language).
+        """
+        calls = self.hits + self.misses
+        return {
+            "language": self.active_lang,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / calls if calls else 1.0,
+            "missing_keys": dict(
+                sorted(self._missing.items(), key=lambda item: item[1], reverse=True)
+            ),
+            "untranslated_keys": sorted(
+                self._default_column.keys() - self._active_column.keys()
+            ),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss counters and the missing keys."""
+        self._init_stats()
+
+    def bind(self, control, key: str, attr: str = "value", **params: Any):
+        """Show key's translation (formatted with params) in control.<attr>,
+        now and after every language change. Returns the control.
+
+        Binding the control again replaces its key and params. Only a weak
+        reference to the control is kept: bindings of discarded controls
+        disappear on their own.
+        """
+        setattr(control, attr, self.translate(key, **params))
+        ident, bindings = id(control), self._bindings
+        bindings[ident] = (
+            weakref.ref(control, lambda _: bindings.pop(ident, None)),
+            key,
+            attr,
+            params,
+        )
+        return control
+
+    def unbind(self, control) -> None:
+        """Stop updating control on language changes."""
+        self._bindings.pop(id(control), None)
+
+    def _refresh_bindings(self, keys: Optional[Collection[str]] = None) -> None:
+        """Re-translate bound controls (only those bound to `keys`, if given)
+        and send the ones that changed in one update per page.
+
+        Controls not yet added to a page are just updated in place. Off the
+        event loop (e.g. from the watch() thread) the controls of each page
+        are changed and sent by a task on that page's loop (page.run_task).
+        """
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
+        pages: Dict[int, Tuple[Any, List[Tuple[Any, str, str]]]] = {}
+        for ref, key, attr, params in list(self._bindings.values()):
+            control = ref()
+            if control is None or (keys is not None and key not in keys):
+                continue
+            text = self._text(key, params)
+            if getattr(control, attr) == text:
+                continue
+            try:
+                page = control.page
+            except RuntimeError:
+                # Flet 1.x: the control is not on a page yet
+                page = None
+            if page is None:
+                setattr(control, attr, text)
+            else:
+                pages.setdefault(id(page), (page, []))[1].append((control, attr, text))
+        for page, changes in pages.values():
+            if on_loop:
+                _send_texts(page, changes)
+            else:
+                page.run_task(_send_texts_on_loop, page, changes)
+
+
+class TranslationManager(_FlatLookup):
     """Manages loading and retrieving translations from a CSV file.
 
     The CSV should have a header where the first column is the translation key
     and the subsequent columns are language codes (e.g., 'en', 'es').
+
+    With use_cache (default) the parsed CSV is kept in a compiled catalog
+    next to it and reloaded from there while the CSV is unchanged (see
+    catalog_cache).
+
+    Translations are held as one {key: text} column per language. With
+    lazy_languages only the default language is loaded up front; other
+    columns are loaded when set_language() switches to them, and at most
+    max_loaded_languages are kept (least recently used ones are evicted,
+    never the default or active language).
+
+    translate() is a single lookup in a flat dict rebuilt by set_language();
+    hits, misses and missing_report() show what had no translation.
+    Controls registered with bind() are re-translated by set_language().
+
+    With watch_interval (seconds) a daemon thread polls the CSV's mtime and
+    calls reload() when it changes (see watch()): only the changed keys
+    are re-translated and passed to the listeners (see add_listener()).
+    The SharedCatalog of the same CSV and its session views are reloaded too.
     """
 
-    def __init__(self, csv_path: str = None, default_lang: str = "en") -> None:
+    def __init__(
+        self,
+        csv_path: str = None,
+        default_lang: str = "en",
+        use_cache: bool = True,
+        lazy_languages: bool = False,
+        max_loaded_languages: int = 3,
+        watch_interval: Optional[float] = None,
+    ) -> None:
         if csv_path is None:
             # Default to translations.csv in the same directory as this file
             csv_path = os.path.join(os.path.dirname(__file__), "translations.csv")
@@ -21,11 +259,32 @@ class TranslationManager:
                     csv_path = test_path
 
         self.csv_path = csv_path
+        self.use_cache = use_cache
+        self.lazy_languages = lazy_languages
+        self.max_loaded_languages = max_loaded_languages
         self.default_lang = default_lang
         self.active_lang = default_lang
-        self.translations: Dict[str, Dict[str, str]] = {}
         self.available_languages: List[str] = []
+        # lang -> {key: text}, in least-recently-used order
+        self._columns: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._catalog: Optional[CompiledCatalog] = None
+        self._active_column: Dict[str, str] = {}
+        self._default_column: Dict[str, str] = {}
+        self._lookup: Dict[str, str] = {}
+        self._formatters: Dict[str, Formatter] = {}
+        # lang -> compiled templates of its column, like _columns
+        self._formatter_columns: Dict[str, Dict[str, Formatter]] = {}
+        # id(control) -> (weakref(control), key, attr, params), see bind()
+        self._bindings: Dict[int, tuple] = {}
+        self._init_stats()
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        # (mtime_ns, size) of the CSV when it was last read
+        self._source_stat: Optional[Tuple[int, int]] = None
+        self._reload_lock = threading.Lock()
+        self._watch_stop: Optional[threading.Event] = None
         self._load_csv()
+        if watch_interval is not None:
+            self.watch(watch_interval)
 
     def awake(self, page=None) -> None:
         """
@@ -36,41 +295,109 @@ class TranslationManager:
             translator.awake(page)
             # ... rest of the app
         """
-        stored_language = page.shared_preferences.get("language")
-        if stored_language:
-            # Aseguramos que sea un código (por si se guardó el nombre completo)
-            from .languages import get_language_code
-
-            self.set_language(get_language_code(stored_language))
-        else:
-            default_language = page.locale
-            if default_language in self.available_languages:
-                self.set_language(default_language)
-            else:
-                self.set_language(self.default_lang)
-            page.shared_preferences.set("language", self.active_lang)
+        self.set_language(_initial_language(page, self.available_languages, self.default_lang))
 
     def _load_csv(self) -> None:
         if not os.path.isfile(self.csv_path):
             return
 
-        with open(self.csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames:
-                # First column is 'key', rest are languages
-                self.available_languages = reader.fieldnames[1:]
-                key_field = reader.fieldnames[0]
-                for row in reader:
-                    key = row.pop(key_field)
-                    if key:
-                        # Remove empty columns
-                        self.translations[key] = {
-                            lang: txt for lang, txt in row.items() if txt
-                        }
+        self._source_stat = self._stat()
+        initial = [self.default_lang] if self.lazy_languages else None
+        if self.use_cache:
+            self._catalog = CompiledCatalog(self.csv_path)
+            self.available_languages = self._catalog.languages
+            columns = self._catalog.load_columns(
+                initial if initial is not None else self.available_languages
+            )
+        else:
+            self.available_languages, columns = parse_csv_columns(self.csv_path, initial)
+        self._columns = OrderedDict(columns)
+        self._select_columns()
+
+    def _load_column(self, lang: str) -> Dict[str, str]:
+        if self.use_cache:
+            if self._catalog is None:
+                # Closed by reload(): reopen (recompiling) on first use
+                self._catalog = CompiledCatalog(self.csv_path)
+            return self._catalog.load_column(lang)
+        return parse_csv_columns(self.csv_path, [lang])[1].get(lang, {})
+
+    def _ensure_column(self, lang: str) -> Dict[str, str]:
+        """Return the column for lang, loading it (and evicting) if needed."""
+        column = self._columns.get(lang)
+        if column is not None:
+            self._columns.move_to_end(lang)
+            return column
+        if lang not in self.available_languages:
+            return {}
+        column = self._columns[lang] = self._load_column(lang)
+        if self.lazy_languages:
+            pinned = {lang, self.active_lang, self.default_lang}
+            for loaded in list(self._columns):
+                if len(self._columns) <= self.max_loaded_languages:
+                    break
+                if loaded not in pinned:
+                    del self._columns[loaded]
+                    self._formatter_columns.pop(loaded, None)
+        return column
+
+    def _column_formatters(self, lang: str, column: Dict[str, str]) -> Dict[str, Formatter]:
+        """Compiled templates of lang's column, compiled once per load."""
+        formatters = self._formatter_columns.get(lang)
+        if formatters is None:
+            formatters = self._formatter_columns[lang] = column_formatters(column, lang)
+        return formatters
+
+    def _select_columns(self) -> None:
+        self._default_column = self._ensure_column(self.default_lang)
+        self._active_column = self._ensure_column(self.active_lang)
+        # translate() only reads this one: active texts over default ones
+        default = self._column_formatters(self.default_lang, self._default_column)
+        if self._active_column is self._default_column:
+            self._lookup = self._default_column
+            self._formatters = default
+        else:
+            self._lookup = dict(self._default_column)
+            self._lookup.update(self._active_column)
+            self._formatters = resolve_formatters(
+                self._active_column,
+                self._column_formatters(self.active_lang, self._active_column),
+                default,
+            )
+        # "{{"/"}}" of texts without placeholders are shown unescaped
+        escaped = unescaped_texts(self._lookup, self._formatters)
+        if escaped:
+            if self._lookup is self._default_column:
+                self._lookup = dict(self._lookup)
+            self._lookup.update(escaped)
+
+    @property
+    def loaded_languages(self) -> List[str]:
+        """Language codes currently held in memory."""
+        return list(self._columns)
+
+    @property
+    def translations(self) -> Dict[str, Dict[str, str]]:
+        """{key: {lang: text}} for every language.
+
+        Kept for compatibility: it loads all language columns (even with
+        lazy_languages) and builds a new dict on each access.
+        """
+        translations: Dict[str, Dict[str, str]] = {}
+        for lang in self.available_languages:
+            column = self._columns.get(lang)
+            if column is None:
+                column = self._load_column(lang)
+            for key, text in column.items():
+                translations.setdefault(key, {})[lang] = text
+        return translations
 
     def set_language(self, lang: str) -> None:
-        """Change the active language."""
+        """Change the active language, loading its column if needed, and
+        re-translate the bound controls."""
         self.active_lang = lang
+        self._select_columns()
+        self._refresh_bindings()
 
     def get_available_languages(self) -> List[str]:
         """Return a list of language names available in the CSV."""
@@ -78,26 +405,258 @@ class TranslationManager:
 
         return [get_language_name(lang) for lang in self.available_languages]
 
-    def translate(self, key: str) -> str:
-        """Return the translation for key in the active language.
-        Falls back to default language then the key itself.
+    # --- Hot reload ---
+
+    def add_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """Call listener(changed_keys) after a reload() that changed texts."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """Stop calling listener on reloads."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check_for_changes(self) -> Set[str]:
+        """reload() if the CSV's mtime or size changed since it was last read.
+
+        Returns the changed keys (empty if nothing changed).
         """
-        entry = self.translations.get(key, {})
-        return entry.get(self.active_lang) or entry.get(self.default_lang) or key
+        stat = self._stat()
+        if stat is None or stat == self._source_stat:
+            return set()
+        return self.reload()
+
+    def reload(self) -> Set[str]:
+        """Re-read the CSV and apply what changed.
 
+        Only the languages in memory are re-parsed (the rest load from the
+        new CSV when needed). Old and new columns are compared key by key;
+        bound controls of changed keys are re-translated and listeners are
+        called with the set of changed keys. Returns that set.
+
+        The SharedCatalog of this CSV, if any, is reloaded as well, so
+        session views (see create_view) re-translate their bound controls.
+        """
+        with self._reload_lock:
+            if not os.path.isfile(self.csv_path):
+                return set()
+            stat = self._stat()
+            languages, columns = parse_csv_columns(self.csv_path, list(self._columns))
+            self._source_stat = stat
+            changed = changed_keys(self._columns, columns)
+
+            self.available_languages = languages
+            # Same languages, same least-recently-used order
+            self._columns = OrderedDict((lang, columns.get(lang, {})) for lang in self._columns)
+            self._formatter_columns = {}
+            if self._catalog is not None:
+                self._catalog.close()
+                self._catalog = None
+            self._select_columns()
+
+        if changed:
+            self._refresh_bindings(changed)
+        shared = SharedCatalog.existing(self.csv_path)
+        if shared is not None:
+            changed |= shared.reload()
+        if changed:
+            for listener in list(self._listeners):
+                listener(changed)
+        return changed
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Poll the CSV every `interval` seconds in a daemon thread and
+        reload() it when it changes. Does nothing if already watching.
+
+        Bound controls on a page are re-translated on that page's loop."""
+        if self._watch_stop is not None:
+            return
+        stop = self._watch_stop = threading.Event()
 
-# Singleton instances for convenience
-translator = TranslationManager()
+        def poll() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.check_for_changes()
+                except Exception:
+                    # E.g. the CSV was read mid-save: retried on the next poll
+                    pass
+
+        threading.Thread(target=poll, name="translations-watch", daemon=True).start()
+
+    def stop_watching(self) -> None:
+        """Stop the thread started by watch()."""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+
+
+class TranslationView(_FlatLookup):
+    """A session's language over a SharedCatalog.
+
+    A view only holds its language, its counters and references to shared,
+    read-only columns (including the flat lookup, see
+    SharedCatalog.resolved), so creating one per session costs a few
+    hundred bytes and no parsing. Use create_view() to get one over the
+    default catalog. When the catalog is reloaded, the view switches to the
+    new columns and re-translates the controls bound to changed keys.
+    """
+
+    __slots__ = ("catalog", "default_lang", "__weakref__")
+
+    def __init__(
+        self, catalog: SharedCatalog, lang: Optional[str] = None, default_lang: str = "en"
+    ) -> None:
+        self.catalog = catalog
+        self.default_lang = default_lang
+        self._default_column: Mapping[str, str] = catalog.column(default_lang)
+        self._bindings: Dict[int, tuple] = {}
+        self._init_stats()
+        self.set_language(lang or default_lang)
+        catalog.add_view(self)
+
+    @property
+    def available_languages(self) -> List[str]:
+        """Language codes available in the catalog."""
+        return list(self.catalog.languages)
+
+    def awake(self, page) -> None:
+        """Set the language from page's stored preference or locale."""
+        self.set_language(_initial_language(page, self.catalog.languages, self.default_lang))
+
+    def set_language(self, lang: str) -> None:
+        """Change this view's language (other sessions are not affected) and
+        re-translate its bound controls."""
+        self.active_lang = lang
+        self._select_columns()
+        self._refresh_bindings()
 
+    def _select_columns(self) -> None:
+        self._active_column = self.catalog.column(self.active_lang)
+        self._lookup = self.catalog.resolved(self.active_lang, self.default_lang)
+        self._formatters = self.catalog.formatters(self.active_lang, self.default_lang)
 
-def t(key: str) -> str:
-    """Shortcut for translator.translate(key)."""
-    return translator.translate(key)
+    def catalog_reloaded(self, changed: Set[str]) -> None:
+        """Switch to the reloaded catalog's columns and re-translate the
+        controls bound to changed keys (called by SharedCatalog.reload)."""
+        self._default_column = self.catalog.column(self.default_lang)
+        self._select_columns()
+        if changed:
+            self._refresh_bindings(changed)
+
+
+# View of the current context (see use_view); takes precedence over page views
+_current_view: ContextVar[Optional[TranslationView]] = ContextVar(
+    "translation_view", default=None
+)
+# id(page) -> view of that page's session (see bind_view)
+_page_views: Dict[int, TranslationView] = {}
+# flet.context, imported on the first bind_view(); its .page is the page of
+# the session handling the current event
+_flet_context = None
+
+
+def bind_view(page, view: TranslationView) -> None:
+    """Use view for t() and set_language() in page's session.
+
+    The binding is dropped when the page is garbage collected.
+    """
+    global _flet_context
+    if _flet_context is None:
+        try:
+            from flet import context as _flet_context
+        except ImportError:
+            pass
+    key = id(page)
+    if key not in _page_views:
+        weakref.finalize(page, _page_views.pop, key, None)
+    _page_views[key] = view
+
+
+def _session_page():
+    try:
+        return _flet_context.page
+    except (AttributeError, RuntimeError):
+        # No flet.context (older Flet) or not inside a session callback
+        return None
+
+
+def current_view() -> Optional[TranslationView]:
+    """Return the view used by t() here, or None for the global translator."""
+    view = _current_view.get()
+    if view is None and _page_views:
+        page = _session_page()
+        if page is not None:
+            view = _page_views.get(id(page))
+    return view
+
+
+@contextmanager
+def use_view(view: TranslationView) -> Iterator[TranslationView]:
+    """Use view for t() and set_language() inside the block (this context only)."""
+    token = _current_view.set(view)
+    try:
+        yield view
+    finally:
+        _current_view.reset(token)
+
+
+# Singleton instances for convenience (only the languages in use are loaded)
+translator = TranslationManager(lazy_languages=True)
+
+
+def create_view(lang: Optional[str] = None) -> TranslationView:
+    """Create a language view over the shared catalog of translator's CSV."""
+    return TranslationView(
+        SharedCatalog.for_path(translator.csv_path, translator.use_cache),
+        lang,
+        translator.default_lang,
+    )
+
+
+def t(key: str, **params: Any) -> str:
+    """Translate key in the current session's language.
+
+    Uses the current view (see use_view and awake) if there is one,
+    otherwise the global translator. With params, the text's placeholders
+    and plurals are filled in: t("inbox.count", count=3).
+    """
+    lookup = current_view() or translator
+    if params:
+        return lookup.format(key, params)
+    return lookup.translate(key)
 
 
 def set_language(lang: str) -> None:
-    """Set the active language globally."""
-    translator.set_language(lang)
+    """Set the language of the current session, or globally if there is none."""
+    view = current_view()
+    if view is None:
+        translator.set_language(lang)
+    else:
+        view.set_language(lang)
+
+
+def bind(control, key: str, attr: str = "value", **params: Any):
+    """Bind control.<attr> to key (formatted with params) in the current
+    session (see TranslationManager.bind): set_language() re-translates it.
+    Returns the control."""
+    return (current_view() or translator).bind(control, key, attr, **params)
+
+
+def unbind(control) -> None:
+    """Stop re-translating control in the current session."""
+    (current_view() or translator).unbind(control)
+
+
+def missing_report() -> Dict[str, Any]:
+    """Missing-translation report of the current session (or the global translator)."""
+    return (current_view() or translator).missing_report()
 
 
 def get_available_languages() -> List[str]:
@@ -105,6 +664,17 @@ def get_available_languages() -> List[str]:
     return translator.get_available_languages()
 
 
-def awake(page=None) -> None:
-    """Initialize language preferences."""
-    translator.awake(page)
+def awake(page=None) -> TranslationView:
+    """Initialize language preferences for page's session.
+
+    Creates a TranslationView for the session, sets its language from the
+    page's preferences and binds it to the page, so t() and set_language()
+    in that session's callbacks don't affect other sessions. Call it at the
+    start of main(page).
+    """
+    view = create_view()
+    view.awake(page)
+    bind_view(page, view)
+    # Also for the rest of main(), whether or not flet.context is available
+    _current_view.set(view)
+    return view